@@ -0,0 +1,156 @@
+"""Local fixture server for the weathernews benchmarks.
+
+Serves synthetic main_v4, weather_v4, main2_v2 and pm_v4 payloads shaped
+like the kr-weathernews responses, so benchmarks do not touch the network.
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+import random
+
+from aiohttp import web
+
+KST = timezone(timedelta(hours=9))
+
+# Every fixture URL shares the 127.0.0.1 bucket of the host rate limiter, a
+# budget this high keeps the benchmarks from measuring its sleeps
+UNLIMITED_REQUESTS_PER_MINUTE = 1_000_000
+
+ENDPOINTS = {
+    'URL_MAIN': '/main_v4.fcgi?loc={apiKey}&language={lang}',
+    'URL_WEATHER': '/weather_v4.cgi?loc={apiKey}&language={lang}',
+    'URL_AIR': '/main2_v2.fcgi?lat={lat}&lon={lon}',
+    'URL_PM': '/pm_v4.fcgi?loc={apiKey}',
+}
+
+
+def _hour_start(now: datetime) -> datetime:
+    return now.astimezone(KST).replace(minute=0, second=0, microsecond=0)
+
+
+def main_payload(loc: str, now: datetime) -> dict:
+    """Return a main_v4 payload with 48 hourly and 10 daily rows."""
+    start = _hour_start(now)
+    seed = random.Random(f'{loc}{start}')
+    hourly = []
+    for offset in range(48):
+        valid = start + timedelta(hours=offset)
+        prec = seed.choice((0, 0, 0, 0.5, 2))
+        hourly.append({
+            'year': str(valid.year), 'mon': f'{valid.month:02d}', 'day': f'{valid.day:02d}',
+            'hour': f'{valid.hour:02d}', 'TimeUtc': str(int(valid.timestamp())),
+            'temp': f'{seed.uniform(5, 30):.1f}', 'feeltemp': f'{seed.uniform(5, 30):.1f}',
+            'humi': str(seed.randint(30, 95)), 'dewpt': f'{seed.uniform(0, 20):.1f}',
+            'prec': str(prec), 'pop': str(seed.choice((0, 10, 30, 60, 80))),
+            'wx': '300' if prec else '100', 'wdir': 'NW', 'wspd': str(seed.randint(1, 30)),
+            'uv': str(seed.randint(0, 8)), 'dayOrNight': 'D' if 6 <= valid.hour < 19 else 'N',
+        })
+    daily = []
+    for offset in range(10):
+        valid = start.replace(hour=0) + timedelta(days=offset)
+        daily.append({
+            'year': str(valid.year), 'mon': f'{valid.month:02d}', 'day': f'{valid.day:02d}',
+            'TimeUtc': str(int(valid.timestamp())), 'tmax': '25', 'tmin': '12', 'rhum': '60',
+            'prec': '0', 'pop': '20', 'wx_am': '100', 'wx_pm': '200', 'uv': '5',
+            'wdir': 'W', 'wspd': '10',
+        })
+    return {
+        'lat': 37.544147, 'lon': 126.8357822, 'sunrise': '06:40', 'sunset': '17:50',
+        'current': {
+            'TimeLocal': start.strftime('%Y/%m/%d %H:%M'), 'temp': hourly[0]['temp'],
+            'feeltemp': hourly[0]['feeltemp'], 'rhum': hourly[0]['humi'], 'dewpt': '10.0',
+            'press': '1013', 'uv': '3', 'wdir': 'NW', 'wspd': hourly[0]['wspd'], 'visi': '20',
+            'wx': hourly[0]['wx'], 'tmax': '25', 'tmin': '12', 'prec': hourly[0]['prec'],
+            'pm10': str(seed.randint(10, 120)), 'pm25': str(seed.randint(5, 80)),
+        },
+        'hourly': hourly,
+        'daily': daily,
+    }
+
+
+def weather_payload(loc: str, now: datetime) -> list:
+    """Return a weather_v4 payload."""
+    start = _hour_start(now)
+    return [{
+        'publish_TimeLocal': start.strftime('%Y/%m/%dT%H:%M:%S%z'),
+        'cur_cmt': '맑음',
+        'daily': [{
+            'day_cmt': '맑음', 'night_cmt': '구름많음',
+            'dayShortCmt': '맑고 선선해요', 'nextDayShortCmt': '구름이 많아요',
+        }],
+        'air': {
+            'pm10': {'value': 35, 'description': '보통'},
+            'pm25': {'value': 12, 'description': '좋음'},
+        },
+    }]
+
+
+def air_payload(now: datetime) -> dict:
+    """Return a main2_v2 payload."""
+    return {'current': {'tempdiff': '-2'}, 'aq': {'khai': 62, 'pm10': 35, 'pm25': 12}}
+
+
+def pm_payload(now: datetime) -> dict:
+    """Return a pm_v4 payload."""
+    start = _hour_start(now)
+    return {'pm': {'forcast': {
+        'daily': [
+            {'year': day.year, 'mon': day.month, 'day': day.day,
+             'pm10': 40, 'pm25': 20, 'aqi': 60, 'o3': 0.03}
+            for day in (start + timedelta(days=offset) for offset in range(4))
+        ],
+        'hourly': [
+            {'year': hour.year, 'mon': hour.month, 'day': hour.day, 'hour': hour.hour,
+             'pm10': 40, 'pm25': 20}
+            for hour in (start + timedelta(hours=offset) for offset in range(24))
+        ],
+    }}}
+
+
+class FixtureServer:
+    """aiohttp server answering the four weathernews endpoints.
+
+    ``now`` may be replaced to simulate accelerated time; ``fail_rate`` and
+    ``delay`` inject endpoint failures and slow responses.
+    """
+
+    def __init__(self) -> None:
+        self.now = lambda: datetime.now(timezone.utc)
+        self.fail_rate = 0.0
+        self.delay = 0.0
+        self.requests = 0
+        self._random = random.Random(0)
+        self._runner = None
+        self.base_url = None
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_get('/main_v4.fcgi', self._handle(lambda request: main_payload(request.query['loc'], self.now())))
+        app.router.add_get('/weather_v4.cgi', self._handle(lambda request: weather_payload(request.query['loc'], self.now())))
+        app.router.add_get('/main2_v2.fcgi', self._handle(lambda request: air_payload(self.now())))
+        app.router.add_get('/pm_v4.fcgi', self._handle(lambda request: pm_payload(self.now())))
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f'http://127.0.0.1:{port}'
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def urls(self) -> dict[str, str]:
+        """Return the const url templates pointing at this server."""
+        return {name: self.base_url + path for name, path in ENDPOINTS.items()}
+
+    def _handle(self, build):
+        async def handler(request):
+            self.requests += 1
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            if self._random.random() < self.fail_rate:
+                return web.Response(status=503)
+            return web.json_response(build(request))
+        return handler
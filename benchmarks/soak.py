@@ -0,0 +1,217 @@
+"""Soak test: days of refreshes, reloads and failures in accelerated time.
+
+Requires Home Assistant and pytest-homeassistant-custom-component::
+
+    pip install pytest-homeassistant-custom-component
+    python benchmarks/soak.py --days 7 --entries 10 --fail-rate 0.05 | tee soak_output.txt
+
+Time is advanced with ``async_fire_time_changed`` in 20 minute steps while
+the fixture server answers with payloads for the simulated time. After every
+simulated day the harness reports, relative to the end of the first day:
+traced memory and its largest growth sites, object counts by type, open
+aiohttp connectors and sessions, running tasks and the worst event loop lag.
+Growth that keeps rising day over day points at a leak.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from datetime import timedelta
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+STEP = timedelta(minutes=20)
+STEPS_PER_DAY = int(timedelta(days=1) / STEP)
+LAG_INTERVAL = 0.01
+
+
+class LagProbe:
+    """Measure how late the event loop wakes a sleeping task."""
+
+    def __init__(self) -> None:
+        self.worst = 0.0
+        self._task = None
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run(), name='soak lag probe')
+
+    async def _run(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(LAG_INTERVAL)
+            self.worst = max(self.worst, time.perf_counter() - start - LAG_INTERVAL)
+
+    def take(self) -> float:
+        worst, self.worst = self.worst, 0.0
+        return worst
+
+    async def stop(self) -> None:
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+
+def _object_counts() -> Counter:
+    gc.collect()
+    return Counter(type(obj).__qualname__ for obj in gc.get_objects())
+
+
+def _open_aiohttp() -> tuple[int, int]:
+    import aiohttp
+
+    connectors = sessions = 0
+    for obj in gc.get_objects():
+        if isinstance(obj, aiohttp.BaseConnector) and not obj.closed:
+            connectors += 1
+        elif isinstance(obj, aiohttp.ClientSession) and not obj.closed:
+            sessions += 1
+    return connectors, sessions
+
+
+def _report(day: int, baseline: dict, state: dict, requests: int, lag: float, top: int) -> None:
+    memory = state['snapshot'].statistics('filename')
+    traced = sum(stat.size for stat in memory)
+    print(f'day {day:3d}  traced {traced / 1024:10.1f} KiB ({(traced - baseline["traced"]) / 1024:+9.1f})  '
+          f'tasks {state["tasks"]:4d} ({state["tasks"] - baseline["tasks"]:+d})  '
+          f'connectors {state["connectors"]} sessions {state["sessions"]}  '
+          f'requests {requests:6d}  max loop lag {lag * 1000:7.1f} ms')
+    growth = state['objects'] - baseline['objects']
+    if growth:
+        print('         objects ' + ', '.join(f'{name} +{count}' for name, count in growth.most_common(top)))
+    for stat in state['snapshot'].compare_to(baseline['snapshot'], 'lineno')[:top]:
+        if stat.size_diff > 0:
+            print(f'         {stat.size_diff / 1024:+8.1f} KiB  {stat.traceback}')
+
+
+async def soak(args: argparse.Namespace) -> None:
+    """Run the soak test."""
+    from homeassistant import loader
+    from homeassistant.util import dt as dt_util
+    from pytest_homeassistant_custom_component.common import (
+        MockConfigEntry,
+        async_fire_time_changed,
+        async_test_home_assistant,
+    )
+
+    from fixtures import UNLIMITED_REQUESTS_PER_MINUTE, FixtureServer
+
+    from custom_components.weathernews import config_flow, coordinator
+    from custom_components.weathernews.const import (
+        CONF_INTERPOLATE,
+        CONF_LANG,
+        CONF_REQUESTS_PER_MINUTE,
+        DOMAIN,
+    )
+
+    server = FixtureServer()
+    await server.start()
+    server.fail_rate = args.fail_rate
+    for name, url in server.urls().items():
+        setattr(coordinator, name, url)
+    config_flow.URL_MAIN = server.urls()['URL_MAIN']
+
+    simulated = dt_util.utcnow()
+    server.now = lambda: simulated
+    tracemalloc.start(10)
+    probe = LagProbe()
+    try:
+        async with async_test_home_assistant() as hass:
+            hass.config.config_dir = REPO_ROOT
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+            entries = []
+            for idx in range(args.entries):
+                entry = MockConfigEntry(
+                    domain=DOMAIN,
+                    unique_id=f'{DOMAIN}-wn-soak{idx}',
+                    data={'api_key': f'11470{idx:05d}', 'name': f'soak{idx}', CONF_LANG: 'ko-KR'},
+                    # time is simulated but the token bucket sleeps in real time
+                    options={
+                        CONF_INTERPOLATE: args.interpolate,
+                        CONF_REQUESTS_PER_MINUTE: UNLIMITED_REQUESTS_PER_MINUTE,
+                    },
+                )
+                entry.add_to_hass(hass)
+                entries.append(entry)
+                await hass.config_entries.async_setup(entry.entry_id)
+            await hass.async_block_till_done()
+            probe.start()
+
+            baseline = None
+            reload_steps = max(1, int(timedelta(hours=args.reload_every) / STEP)) if args.reload_every else 0
+            for step in range(1, args.days * STEPS_PER_DAY + 1):
+                simulated += STEP
+                async_fire_time_changed(hass, simulated)
+                await hass.async_block_till_done()
+
+                if reload_steps and step % reload_steps == 0:
+                    for entry in entries:
+                        await hass.config_entries.async_reload(entry.entry_id)
+                    await hass.async_block_till_done()
+
+                if step % (STEPS_PER_DAY // max(args.flows_per_day, 1)) == 0 and args.flows_per_day:
+                    # a setup attempt for an existing location validates and aborts
+                    result = await hass.config_entries.flow.async_init(DOMAIN, context={'source': 'user'})
+                    result = await hass.config_entries.flow.async_configure(
+                        result['flow_id'], {'next_step_id': 'location'})
+                    result = await hass.config_entries.flow.async_configure(
+                        result['flow_id'], {'api_key': '1147000000', 'name': 'soak0', CONF_LANG: 'ko-KR'})
+                    if result['type'] == 'form':
+                        # a failed validation keeps the flow open
+                        hass.config_entries.flow.async_abort(result['flow_id'])
+
+                if step % STEPS_PER_DAY:
+                    continue
+                connectors, sessions = _open_aiohttp()
+                state = {
+                    'snapshot': tracemalloc.take_snapshot().filter_traces((
+                        tracemalloc.Filter(False, tracemalloc.__file__),
+                        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+                    )),
+                    'objects': _object_counts(),
+                    'tasks': len(asyncio.all_tasks()) - 1,
+                    'connectors': connectors,
+                    'sessions': sessions,
+                }
+                if baseline is None:
+                    baseline = state
+                    baseline['traced'] = sum(stat.size for stat in state['snapshot'].statistics('filename'))
+                _report(step // STEPS_PER_DAY, baseline, state, server.requests, probe.take(), args.top)
+                server.requests = 0
+
+            await probe.stop()
+            for entry in entries:
+                await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_block_till_done()
+            await hass.async_stop(force=True)
+    finally:
+        tracemalloc.stop()
+        await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--days', type=int, default=7)
+    parser.add_argument('--entries', type=int, default=5)
+    parser.add_argument('--fail-rate', type=float, default=0.05, help='share of failing requests')
+    parser.add_argument('--reload-every', type=float, default=6, help='hours between reloads, 0 to disable')
+    parser.add_argument('--flows-per-day', type=int, default=4, help='config flow attempts per day')
+    parser.add_argument('--interpolate', action='store_true', help='enable current value interpolation')
+    parser.add_argument('--top', type=int, default=5, help='growth sites reported per day')
+    args = parser.parse_args()
+    print(f'python {sys.version.split()[0]}, {args.days} days, {args.entries} entries, '
+          f'fail rate {args.fail_rate}, reload every {args.reload_every} h')
+    asyncio.run(soak(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+"""Startup benchmark: module import time and async_setup_entry wall time.
+
+Requires Home Assistant and pytest-homeassistant-custom-component::
+
+    pip install pytest-homeassistant-custom-component
+    python benchmarks/startup.py --runs 5 --entries 10 | tee bench_output.txt
+
+Import times are measured with ``python -X importtime`` in a fresh
+interpreter per run. Setup times are measured against a local fixture
+server, so they do not depend on the network or the upstream service.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+PACKAGE = 'custom_components.weathernews'
+MODULES = (
+    PACKAGE,
+    f'{PACKAGE}.config_flow',
+    f'{PACKAGE}.sensor',
+    f'{PACKAGE}.weather',
+)
+
+
+def import_time(module: str) -> tuple[float, float]:
+    """Return the (package self, cumulative) import time of a module in ms.
+
+    ``package self`` only counts the integration's own modules, so the
+    Home Assistant modules pulled in as dependencies do not hide changes.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    own = 0
+    cumulative = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len('import time:'):].split('|'))
+        if not self_us.isdigit():
+            continue
+        if name.startswith(PACKAGE):
+            own += int(self_us)
+        if name == module:
+            cumulative = int(cumulative_us)
+    return own / 1000, cumulative / 1000
+
+
+async def setup_time(entries: int) -> float:
+    """Return the wall time in ms to set up ``entries`` config entries."""
+    from homeassistant import loader
+    from pytest_homeassistant_custom_component.common import (
+        MockConfigEntry,
+        async_test_home_assistant,
+    )
+
+    from fixtures import UNLIMITED_REQUESTS_PER_MINUTE, FixtureServer
+
+    from custom_components.weathernews import coordinator
+    from custom_components.weathernews.const import CONF_LANG, CONF_REQUESTS_PER_MINUTE, DOMAIN
+
+    server = FixtureServer()
+    await server.start()
+    for name, url in server.urls().items():
+        setattr(coordinator, name, url)
+    try:
+        async with async_test_home_assistant() as hass:
+            hass.config.config_dir = REPO_ROOT
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+            config_entries = []
+            for idx in range(entries):
+                entry = MockConfigEntry(
+                    domain=DOMAIN,
+                    data={'api_key': f'11470{idx:05d}', 'name': f'bench{idx}', CONF_LANG: 'ko-KR'},
+                    options={CONF_REQUESTS_PER_MINUTE: UNLIMITED_REQUESTS_PER_MINUTE},
+                )
+                entry.add_to_hass(hass)
+                config_entries.append(entry)
+
+            start = time.perf_counter()
+            for entry in config_entries:
+                await hass.config_entries.async_setup(entry.entry_id)
+            await hass.async_block_till_done()
+            elapsed = time.perf_counter() - start
+
+            for entry in config_entries:
+                await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_block_till_done()
+            await hass.async_stop(force=True)
+    finally:
+        await server.stop()
+    return elapsed * 1000
+
+
+def _summary(values: list[float]) -> str:
+    return (f'median {statistics.median(values):8.1f} ms  '
+            f'min {min(values):8.1f} ms  max {max(values):8.1f} ms')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--entries', type=int, default=1)
+    args = parser.parse_args()
+
+    print(f'python {sys.version.split()[0]}, {args.runs} runs')
+    print('import time (integration modules only / cumulative)')
+    for module in MODULES:
+        own, cumulative = zip(*(import_time(module) for _ in range(args.runs)))
+        print(f'  {module:40s} own {_summary(list(own))}')
+        print(f'  {"":40s} cum {_summary(list(cumulative))}')
+
+    print(f'async_setup_entry wall time for {args.entries} entries')
+    setups = [asyncio.run(setup_time(args.entries)) for _ in range(args.runs)]
+    print(f'  {"setup":40s}     {_summary(setups)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,16 +1,37 @@
 """The weather.com component."""
+from __future__ import annotations
+
+import importlib
 import logging
-from typing import Final
+from typing import TYPE_CHECKING, Final
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     CONF_API_KEY,
     CONF_NAME, Platform
 )
 from homeassistant.core import HomeAssistant
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.unit_system import METRIC_SYSTEM
-from .coordinator import WeatherUpdateCoordinator, WeatherUpdateCoordinatorConfig
 from .const import (
     CONF_LANG,
+    CONF_FLEET,
+    CONF_LOCATIONS,
+    CONF_CONCURRENCY,
+    CONF_REQUESTS_PER_MINUTE,
+    CONF_INTERPOLATE,
+    CONF_HISTORY,
+    CONF_STATISTICS,
+    CONF_RULES,
+    CONF_STAGE_BUDGET,
+    CONF_OFFLOAD_ROWS,
+    CONF_AQ_STANDARD,
+    AQ_STANDARD_KOREA,
+    FEATURE_GROUPS,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_REQUESTS_PER_MINUTE,
+    DEFAULT_STAGE_BUDGET,
+    DEFAULT_OFFLOAD_ROWS,
     DOMAIN,
     
     API_METRIC,
@@ -19,11 +40,35 @@ from .const import (
     API_URL_IMPERIAL
 )
 
-PLATFORMS: Final = [Platform.WEATHER, Platform.SENSOR]
+if TYPE_CHECKING:
+    from .coordinator import WeatherUpdateCoordinator
+
+PLATFORMS: Final = [Platform.WEATHER, Platform.SENSOR, Platform.BINARY_SENSOR]
+FLEET_PLATFORMS: Final = [Platform.SENSOR]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Register the bulk data websocket command, HTTP view and services."""
+    api, services = await hass.async_add_import_executor_job(_import_api_modules)
+    api.async_register(hass)
+    services.async_register_services(hass)
+    return True
+
+
+def _import_api_modules() -> tuple:
+    """Import the bulk data API and the services in one executor job."""
+    return importlib.import_module(f"{__name__}.api"), importlib.import_module(f"{__name__}.services")
+
+
+async def _async_import(hass: HomeAssistant, name: str):
+    """Import a submodule off the event loop."""
+    return await hass.async_add_import_executor_job(importlib.import_module, f"{__name__}.{name}")
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Set up the Weather.com component."""
     hass.data.setdefault(DOMAIN, {})
@@ -35,18 +80,49 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         unit_system_api = API_URL_IMPERIAL
         unit_system = API_IMPERIAL
 
-    config = WeatherUpdateCoordinatorConfig(
+    # The coordinator pulls in the derivation, grading, rate limit and rule modules, import them off the event loop
+    coordinator_module = await _async_import(hass, "coordinator")
+    ratelimit = await _async_import(hass, "ratelimit")
+    rate_limiter = ratelimit.async_get_rate_limiter(hass)
+    rate_limiter.async_set_budget(
+        entry.entry_id, entry.options.get(CONF_REQUESTS_PER_MINUTE, DEFAULT_REQUESTS_PER_MINUTE))
+    entry.async_on_unload(lambda: rate_limiter.async_remove_budget(entry.entry_id))
+
+    if entry.data.get(CONF_FLEET):
+        return await _async_setup_fleet_entry(hass, entry, coordinator_module, unit_system_api, unit_system)
+
+    config = coordinator_module.WeatherUpdateCoordinatorConfig(
         api_key=entry.data[CONF_API_KEY],
         location_name=entry.data[CONF_NAME],
         unit_system_api=unit_system_api,
         unit_system=unit_system,
-        lang=entry.data[CONF_LANG]
+        lang=entry.data[CONF_LANG],
+        entry_id=entry.entry_id,
+        interpolate=entry.options.get(CONF_INTERPOLATE, False),
+        history=entry.options.get(CONF_HISTORY, False),
+        rules=entry.options.get(CONF_RULES, ""),
+        groups=_enabled_groups(entry),
+        stage_budget=entry.options.get(CONF_STAGE_BUDGET, DEFAULT_STAGE_BUDGET),
+        offload_rows=entry.options.get(CONF_OFFLOAD_ROWS, DEFAULT_OFFLOAD_ROWS),
+        aq_standard=entry.options.get(CONF_AQ_STANDARD, AQ_STANDARD_KOREA)
         # latitude=entry.data[CONF_LATITUDE],
         # longitude=entry.data[CONF_LONGITUDE]
     )
 
-    weathercoordinator = WeatherUpdateCoordinator(hass, config)
+    weathercoordinator = coordinator_module.WeatherUpdateCoordinator(hass, config)
+    if config.history:
+        await weathercoordinator.async_open_history()
+    entry.async_on_unload(weathercoordinator.async_close_history)
     await weathercoordinator.async_config_entry_first_refresh()
+    entry.async_on_unload(weathercoordinator.async_start_sun_tracking())
+    if config.interpolate:
+        entry.async_on_unload(weathercoordinator.async_start_interpolation())
+    if entry.options.get(CONF_STATISTICS, False):
+        await _async_setup_statistics(hass, entry, weathercoordinator)
+    if weathercoordinator.rule_engine.rules:
+        # the first fetch is evaluated when the binary sensors restore their state
+        entry.async_on_unload(
+            weathercoordinator.async_add_listener(weathercoordinator.rule_engine.async_evaluate))
 
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     hass.data[DOMAIN][entry.entry_id] = weathercoordinator
@@ -56,9 +132,71 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     return True
 
 
+def _enabled_groups(entry: ConfigEntry) -> frozenset:
+    """Return the feature groups enabled in the options, all by default."""
+    return frozenset(group for group in FEATURE_GROUPS if entry.options.get(group, True))
+
+
+async def _async_setup_statistics(
+        hass: HomeAssistant, entry: ConfigEntry, coordinator: WeatherUpdateCoordinator
+) -> None:
+    """Export the hourly observations to the recorder long-term statistics."""
+    if "recorder" not in hass.config.components:
+        _LOGGER.warning("Recorder is not loaded, long-term statistics are not exported")
+        return
+    longterm = await _async_import(hass, "longterm")
+    exporter = await longterm.async_setup_exporter(hass, coordinator)
+    exporter.async_update()
+    entry.async_on_unload(coordinator.async_add_listener(exporter.async_update))
+
+
+async def _async_setup_fleet_entry(
+        hass: HomeAssistant, entry: ConfigEntry, coordinator_module, unit_system_api: str, unit_system: str
+):
+    """Set up a fleet entry polling many location codes through one scheduler."""
+    # Only fleet entries need the scheduler, import it off the event loop on demand
+    fleet_module = await _async_import(hass, "fleet")
+
+    coordinators = {}
+    for api_key in entry.data[CONF_LOCATIONS]:
+        config = coordinator_module.WeatherUpdateCoordinatorConfig(
+            api_key=api_key,
+            location_name=f"{entry.data[CONF_NAME]}_{api_key}",
+            unit_system_api=unit_system_api,
+            unit_system=unit_system,
+            lang=entry.data[CONF_LANG],
+            entry_id=entry.entry_id,
+            groups=_enabled_groups(entry),
+            stage_budget=entry.options.get(CONF_STAGE_BUDGET, DEFAULT_STAGE_BUDGET),
+            offload_rows=entry.options.get(CONF_OFFLOAD_ROWS, DEFAULT_OFFLOAD_ROWS),
+            aq_standard=entry.options.get(CONF_AQ_STANDARD, AQ_STANDARD_KOREA)
+        )
+        # The fleet scheduler drives the refreshes, so no per-location timer.
+        config.update_interval = None
+        coordinators[api_key] = coordinator_module.WeatherUpdateCoordinator(hass, config)
+        entry.async_on_unload(coordinators[api_key].async_start_sun_tracking())
+
+    fleet = fleet_module.FleetScheduler(
+        hass,
+        coordinators,
+        coordinator_module.MIN_TIME_BETWEEN_UPDATES,
+        entry.data.get(CONF_CONCURRENCY, DEFAULT_CONCURRENCY)
+    )
+    fleet.async_start()
+    entry.async_on_unload(fleet.async_stop)
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+    hass.data[DOMAIN][entry.entry_id] = fleet
+
+    await hass.config_entries.async_forward_entry_setups(entry, FLEET_PLATFORMS)
+
+    return True
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    platforms = FLEET_PLATFORMS if entry.data.get(CONF_FLEET) else PLATFORMS
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, platforms)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
 
@@ -0,0 +1,79 @@
+"""Integrated air quality (main2_v2) responses shared by nearby locations."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from typing import Any, Awaitable, Callable
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_AIR_CACHE
+
+# Grid cell of about 2 km; neighbouring dong codes in a cell share one monitoring station
+CELL_DEGREES = 0.02
+# Shorter than the 20 minute refresh so every cycle of a cell gets a new answer
+TTL_SECONDS = 15 * 60
+
+
+def air_cell(lat: float | str, lon: float | str) -> tuple[int, int]:
+    """Return the grid cell of a coordinate."""
+    return math.floor(float(lat) / CELL_DEGREES), math.floor(float(lon) / CELL_DEGREES)
+
+
+class AirQualityCache:
+    """main2_v2 responses by grid cell, with one request in flight per cell."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._entries: dict[tuple[int, int], tuple[float, Any]] = {}
+        self._pending: dict[tuple[int, int], asyncio.Future] = {}
+
+    async def async_get(
+            self, lat: float | str, lon: float | str, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached response of the cell, calling ``fetch`` only when stale.
+
+        Callers get the same object, copy it before changing it.
+        """
+        cell = air_cell(lat, lon)
+        now = time.monotonic()
+        if (entry := self._entries.get(cell)) is not None and now - entry[0] < TTL_SECONDS:
+            return entry[1]
+        if (pending := self._pending.get(cell)) is not None:
+            # Shielded so a cancelled waiter does not cancel the shared request
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[cell] = future
+        try:
+            result = await fetch()
+        except asyncio.CancelledError:
+            # Waiters fail like a timed out request instead of being cancelled
+            future.set_exception(asyncio.TimeoutError())
+            future.exception()
+            raise
+        except Exception as err:
+            future.set_exception(err)
+            future.exception()
+            raise
+        else:
+            self._expire(now)
+            self._entries[cell] = (time.monotonic(), result)
+            future.set_result(result)
+            return result
+        finally:
+            del self._pending[cell]
+
+    def _expire(self, now: float) -> None:
+        for cell in [cell for cell, (fetched, _) in self._entries.items() if now - fetched >= TTL_SECONDS]:
+            del self._entries[cell]
+
+
+@callback
+def async_get_air_cache(hass: HomeAssistant) -> AirQualityCache:
+    """Return the air quality cache shared by every config entry."""
+    if (cache := hass.data.get(DATA_AIR_CACHE)) is None:
+        cache = hass.data[DATA_AIR_CACHE] = AirQualityCache()
+    return cache
@@ -0,0 +1,154 @@
+"""Bulk access to the normalized dataset of a location.
+
+``weathernews/data`` websocket command and ``/api/weathernews/<location>``
+HTTP view (authenticated). Both accept:
+
+* ``location``: location name or code, optional with a single location
+* ``fields``: sections (``current``, ``daily``, ``hourly``) or current fields
+  (``current.temp``) to return, default everything
+* ``since``: data version the caller already has; when unchanged only the
+  version is returned
+"""
+from __future__ import annotations
+
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
+
+from aiohttp import web
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, RESULTS_CURRENT, RESULTS_FORECAST_DAILY, RESULTS_FORECAST_HOURLY
+
+if TYPE_CHECKING:
+    from .coordinator import WeatherUpdateCoordinator
+
+SECTIONS = (RESULTS_CURRENT, RESULTS_FORECAST_DAILY, RESULTS_FORECAST_HOURLY)
+
+# coordinator -> (data version, normalized dataset)
+_NORMALIZED: WeakKeyDictionary = WeakKeyDictionary()
+
+
+@callback
+def async_register(hass: HomeAssistant) -> None:
+    """Register the websocket command and the HTTP view."""
+    websocket_api.async_register_command(hass, websocket_data)
+    hass.http.register_view(WeatherDataView())
+
+
+def all_coordinators(hass: HomeAssistant) -> list[WeatherUpdateCoordinator]:
+    coordinators = []
+    for value in hass.data.get(DOMAIN, {}).values():
+        # a fleet scheduler or a single coordinator
+        if hasattr(value, 'coordinators'):
+            coordinators.extend(value.coordinators.values())
+        else:
+            coordinators.append(value)
+    return coordinators
+
+
+def find_coordinator(hass: HomeAssistant, location: str | None) -> WeatherUpdateCoordinator | None:
+    """Return the coordinator of a location name or code."""
+    coordinators = all_coordinators(hass)
+    if location is None:
+        return coordinators[0] if len(coordinators) == 1 else None
+    for coordinator in coordinators:
+        if location in (coordinator.location_name, coordinator.api_key):
+            return coordinator
+    return None
+
+
+def _normalized(coordinator: WeatherUpdateCoordinator) -> dict[str, Any]:
+    """Return the dataset with numeric strings converted, once per data version."""
+    # loaded with the config entry that created the coordinator
+    from .coordinator import _to_number
+
+    cached = _NORMALIZED.get(coordinator)
+    if cached is not None and cached[0] == coordinator.data_version:
+        return cached[1]
+    data = coordinator.data
+    # compute the lazily derived fields for the full dump
+    current = data[RESULTS_CURRENT].materialize()
+    coordinator.get_hourly_forecast()
+    normalized = {
+        RESULTS_CURRENT: {
+            key: _to_number(value) for key, value in {**current, **coordinator.interpolated}.items()
+            if not key.startswith('_')
+        },
+        RESULTS_FORECAST_DAILY: [
+            {key: _to_number(value) for key, value in row.items()} for row in data[RESULTS_FORECAST_DAILY]
+        ],
+        RESULTS_FORECAST_HOURLY: [
+            {key: _to_number(value) for key, value in row.items()} for row in data[RESULTS_FORECAST_HOURLY]
+        ],
+    }
+    _NORMALIZED[coordinator] = (coordinator.data_version, normalized)
+    return normalized
+
+
+def build_payload(
+        coordinator: WeatherUpdateCoordinator, fields: list[str] | None = None, since: int | None = None
+) -> dict[str, Any]:
+    """Return the response for a location."""
+    payload = {
+        'location': coordinator.location_name,
+        'api_key': coordinator.api_key,
+        'version': coordinator.data_version,
+    }
+    if coordinator.data is None or (since is not None and since >= coordinator.data_version):
+        return payload
+    normalized = _normalized(coordinator)
+    if not fields:
+        payload.update(normalized)
+        return payload
+    for field in fields:
+        section, _, key = field.partition('.')
+        if section not in SECTIONS:
+            continue
+        if not key:
+            payload[section] = normalized[section]
+        elif section == RESULTS_CURRENT and key in normalized[section]:
+            payload.setdefault(section, {})[key] = normalized[section][key]
+    return payload
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "weathernews/data",
+        vol.Optional("location"): str,
+        vol.Optional("fields"): [str],
+        vol.Optional("since"): vol.Coerce(int),
+    }
+)
+@callback
+def websocket_data(hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict) -> None:
+    """Return the dataset of a location."""
+    coordinator = find_coordinator(hass, msg.get("location"))
+    if coordinator is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Unknown location")
+        return
+    connection.send_result(msg["id"], build_payload(coordinator, msg.get("fields"), msg.get("since")))
+
+
+class WeatherDataView(HomeAssistantView):
+    """Return the dataset of a location over HTTP."""
+
+    url = "/api/weathernews/{location}"
+    name = "api:weathernews:data"
+
+    async def get(self, request: web.Request, location: str) -> web.Response:
+        """Handle a GET request."""
+        hass = request.app[KEY_HASS]
+        coordinator = find_coordinator(hass, location)
+        if coordinator is None:
+            return self.json_message("Unknown location", HTTPStatus.NOT_FOUND)
+        fields = [field for field in request.query.get("fields", "").split(",") if field]
+        try:
+            since = int(request.query["since"]) if "since" in request.query else None
+        except ValueError:
+            return self.json_message("Invalid since", HTTPStatus.BAD_REQUEST)
+        return self.json(build_payload(coordinator, fields, since))
@@ -0,0 +1,70 @@
+"""Binary sensors of the weathernews alert rules."""
+from __future__ import annotations
+
+from homeassistant.components.binary_sensor import BinarySensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import generate_entity_id
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import WeatherUpdateCoordinator
+from .const import CONF_ATTRIBUTION, DOMAIN
+from .rules import Rule
+
+
+async def async_setup_entry(
+        hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Add one binary sensor per alert rule."""
+    coordinator: WeatherUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities([
+        WeatherRuleBinarySensor(coordinator, rule) for rule in coordinator.rule_engine.rules
+    ])
+
+
+class WeatherRuleBinarySensor(CoordinatorEntity, BinarySensorEntity, RestoreEntity):
+    """On while the conditions of an alert rule hold."""
+    _attr_attribution = CONF_ATTRIBUTION
+    _attr_icon = "mdi:alert-outline"
+
+    def __init__(self, coordinator: WeatherUpdateCoordinator, rule: Rule):
+        super().__init__(coordinator)
+        self._rule = rule
+        self._attr_name = f"wn_{coordinator.location_name} {rule.name}"
+        self._attr_unique_id = f"wn_{coordinator.location_name},rule_{rule.name}".lower()
+        self.entity_id = generate_entity_id(
+            "binary_sensor.{}", f"wn_{coordinator.location_name}_{rule.name}", hass=coordinator.hass
+        )
+        self._attr_extra_state_attributes = {'condition': rule.source}
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the rule state so a restart does not fire the alert again."""
+        await super().async_added_to_hass()
+        last_state = await self.async_get_last_state()
+        active = None
+        if last_state is not None and last_state.state in (STATE_ON, STATE_OFF):
+            active = last_state.state == STATE_ON
+        self.coordinator.rule_engine.async_restore(self._rule.name, active)
+
+    @property
+    def available(self) -> bool:
+        """Return if weather data is available."""
+        return self.coordinator.data is not None
+
+    @property
+    def is_on(self) -> bool:
+        """Return whether the rule matches."""
+        return bool(self.coordinator.rule_engine.state.get(self._rule.name))
+
+    @property
+    def device_info(self):
+        """Return information about the device."""
+        return {
+            "identifiers": {(DOMAIN, self.coordinator._location_name)},
+            "name": self.coordinator._location_name,
+            "manufacturer": 'WeatherNews',
+            "model": 'WeatherNews',
+        }
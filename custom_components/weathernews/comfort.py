@@ -0,0 +1,118 @@
+"""Derived comfort indices for the weathernews integration.
+
+Heat index, wind chill and discomfort index are computed for a whole column
+of observations at once so the hourly forecast is handled in a single pass.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+# https://github.com/gregnau/heat-index-calc/blob/master/heat-index-calc.py (C2 set)
+HEAT_INDEX_COEFFICIENTS = (
+    0.363445176, 0.988622465, 4.777114035, -0.114037667, -0.000850208,
+    -0.020716198, 0.000687678, 0.000274954, 0.0
+)
+
+# 단순식으로 구한 열지수(°F)가 이 값 이상일 때만 회귀식을 쓴다 (NWS)
+HEAT_INDEX_REGRESSION_MIN_F = 80.0
+
+# 32 주의, 39 매우주의, 51 위험 , 매우위
+HEAT_GRADES = (
+    (51, '매우위험'),
+    (39, '위험'),
+    (32, '매우주의'),
+    (27, '주의'),
+)
+
+# 체감온도(풍속냉각)는 기온 10°C 이하, 풍속 4.8km/h 이상에서만 정의된다
+WIND_CHILL_MAX_TEMP = 10.0
+WIND_CHILL_MIN_SPEED = 4.8
+
+
+def _to_float(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _format_time(timestamp_secs: Any) -> str | None:
+    try:
+        return datetime.fromtimestamp(int(timestamp_secs), timezone.utc).isoformat()
+    except (TypeError, ValueError):
+        return None
+
+
+def heat_grade(heatindex: float | None) -> str:
+    """Return the Korean heat index grade."""
+    if heatindex is None:
+        return '-'
+    for threshold, grade in HEAT_GRADES:
+        if heatindex > threshold:
+            return grade
+    return '-'
+
+
+def comfort_series(
+        temps: Iterable[Any], hums: Iterable[Any], winds: Iterable[Any]
+) -> tuple[list, list, list]:
+    """Return heat index, wind chill and discomfort index columns.
+
+    Inputs are parallel columns of temperature (°C), relative humidity (%)
+    and wind speed (km/h). Values that cannot be parsed yield None.
+    """
+    c0, c1, c2, c3, c4, c5, c6, c7, c8 = HEAT_INDEX_COEFFICIENTS
+    heat = []
+    chill = []
+    discomfort = []
+    for temp, hum, wind in zip(temps, hums, winds):
+        t = _to_float(temp)
+        h = _to_float(hum)
+        if t is None or h is None:
+            heat.append(None)
+            discomfort.append(None)
+        else:
+            f = t * 1.8 + 32
+            # 회귀식은 더운 날씨용이라 선선하거나 추운 날에는 단순식(기온에 가까운 값)을 쓴다
+            hi = 0.5 * (f + 61.0 + (f - 68.0) * 1.2 + h * 0.094)
+            if (hi + f) / 2 >= HEAT_INDEX_REGRESSION_MIN_F:
+                f2 = f * f
+                h2 = h * h
+                hi = c0 + c1 * f + c2 * h + c3 * f * h + c4 * f2 + c5 * h2 + c6 * f2 * h + c7 * f * h2 + c8 * f2 * h2
+            heat.append(round((hi - 32) * 5 / 9, 0))
+            # 불쾌지수
+            discomfort.append(round(1.8 * t - 0.55 * (1 - h / 100) * (1.8 * t - 26) + 32, 1))
+
+        v = _to_float(wind)
+        if t is None:
+            chill.append(None)
+        elif v is None or t > WIND_CHILL_MAX_TEMP or v < WIND_CHILL_MIN_SPEED:
+            chill.append(t)
+        else:
+            v16 = v ** 0.16
+            chill.append(round(13.12 + 0.6215 * t - 11.37 * v16 + 0.3965 * v16 * t, 1))
+    return heat, chill, discomfort
+
+
+def peak_heat_index(hours: list[dict], day: Any) -> dict:
+    """Return the highest heat index of the given day from processed hourly rows."""
+    peak = None
+    for hour_data in hours:
+        if str(hour_data.get('day')) != str(day) or hour_data.get('heatindex') is None:
+            continue
+        if peak is None or hour_data['heatindex'] > peak['heatindex']:
+            peak = hour_data
+    if peak is None:
+        return {
+            'heatindex': None,
+            'heatgrade': '-',
+            'hour': '-',
+            'time': None,
+        }
+    return {
+        'heatindex': peak['heatindex'],
+        'heatgrade': heat_grade(peak['heatindex']),
+        'hour': peak.get('hour'),
+        'time': _format_time(peak.get('TimeUtc')),
+    }
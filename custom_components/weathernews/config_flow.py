@@ -1,108 +1,254 @@
 """Config Flow to configure Weather.com Integration."""
 from __future__ import annotations
+import importlib
 import logging
 from http import HTTPStatus
-import async_timeout
+import aiohttp
 import voluptuous as vol
 from homeassistant import config_entries
 import homeassistant.helpers.config_validation as cv
 from homeassistant.const import CONF_API_KEY, CONF_NAME
-from homeassistant.core import callback
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
-from .coordinator import InvalidApiKey
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.selector import TextSelector, TextSelectorConfig
 
 from .const import (
     DOMAIN,
 
     CONF_LANG,
+    CONF_QUERY,
+    CONF_FLEET,
+    CONF_LOCATIONS,
+    CONF_CONCURRENCY,
+    CONF_REQUESTS_PER_MINUTE,
+    CONF_INTERPOLATE,
+    CONF_HISTORY,
+    CONF_STATISTICS,
+    CONF_RULES,
+    CONF_STAGE_BUDGET,
+    CONF_OFFLOAD_ROWS,
+    CONF_ENTITY_PROFILE,
+    CONF_AQ_STANDARD,
+    AQ_STANDARD_KOREA,
+    AQ_STANDARDS,
+    FEATURE_GROUPS,
     DEFAULT_LANG,
-    LANG_CODES
+    DEFAULT_FLEET_NAME,
+    DEFAULT_CONCURRENCY,
+    MAX_CONCURRENCY,
+    DEFAULT_REQUESTS_PER_MINUTE,
+    DEFAULT_STAGE_BUDGET,
+    DEFAULT_OFFLOAD_ROWS,
+    ENTITY_PROFILES,
+    PROFILE_FULL,
+    LANG_CODES,
+    URL_MAIN
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
+async def _async_import(hass: HomeAssistant, name: str):
+    """Import a submodule off the event loop, only the steps using it pay for it."""
+    return await hass.async_add_import_executor_job(importlib.import_module, f"{__package__}.{name}")
+
+
 class WeatherFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a Weather.com config flow."""
 
     VERSION = 1
 
+    def __init__(self):
+        """Initialize the config flow."""
+        self._search_results = {}
+        self._search_labels = {}
+        self._region_code = None
+        self._region_name = None
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Get the options flow for this handler."""
+        return WeatherOptionsFlowHandler()
+
     async def async_step_user(self, user_input=None):
         """Handle a flow initiated by the user."""
+        return self.async_show_menu(step_id="user", menu_options=["nearby", "search", "location", "fleet"])
+
+    async def async_step_nearby(self, user_input=None):
+        """Offer the location codes closest to the Home Assistant location."""
+        index = await self._async_region_index()
+        nearest = index.nearest(self.hass.config.latitude, self.hass.config.longitude)
+        if not nearest:
+            return await self.async_step_search()
+        self._search_results = {code: name for code, name, _ in nearest}
+        self._search_labels = {code: f"{name} ({code}, {km}km)" for code, name, km in nearest}
+        return await self.async_step_search_select()
+
+    async def async_step_search(self, user_input=None):
+        """Search the bundled location code index."""
+        errors = {}
+        if user_input is not None:
+            index = await self._async_region_index()
+            if results := index.search(user_input[CONF_QUERY]):
+                self._search_results = dict(results)
+                self._search_labels = {code: f"{name} ({code})" for code, name in results}
+                return await self.async_step_search_select()
+            errors["base"] = "no_results"
+
+        return self.async_show_form(
+            step_id="search",
+            data_schema=vol.Schema({vol.Required(CONF_QUERY): str}),
+            errors=errors,
+        )
+
+    async def async_step_search_select(self, user_input=None):
+        """Pick one of the search results."""
+        if user_input is not None:
+            self._region_code = user_input[CONF_API_KEY]
+            self._region_name = self._search_results[self._region_code].split()[-1]
+            return await self._show_setup_form()
+
+        return self.async_show_form(
+            step_id="search_select",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_API_KEY): vol.In(self._search_labels),
+                }
+            ),
+        )
+
+    async def async_step_location(self, user_input=None):
+        """Handle a single location entry."""
         if user_input is None:
             return await self._show_setup_form(user_input)
 
         errors = {}
-        session = async_create_clientsession(self.hass)
 
         api_key = user_input[CONF_API_KEY]
         lang = user_input[CONF_LANG]
         location_name = user_input[CONF_NAME]
-        headers = {
-            'Accept-Encoding': 'gzip',
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/111.0.0.0 Safari/537.36"
-        }
+        coordinator = await _async_import(self.hass, "coordinator")
+        # Validate with the same request path as the coordinator so the payload
+        # can be reused by the first refresh.
+        url = coordinator.build_url(URL_MAIN, api_key, lang)
         try:
             if user_input[CONF_API_KEY] is None or user_input[CONF_API_KEY] == "":
-                errors["base"] = "invalid_api_key"
-                raise InvalidApiKey
-
-            with async_timeout.timeout(10):
-                # Use English and US units for the initial test API call. User-supplied units and language will be used for
-                # the created entities.
-                url = f'https://www.kr-weathernews.com/mv3/if/main_v4.fcgi?loc={api_key}&language={lang}'
-                response = await session.get(url, headers=headers)
-            # _LOGGER.debug(response.status)
-            if response.status != HTTPStatus.OK:
-                # 401 status is most likely bad api_key or api usage limit exceeded
-                if response.status == HTTPStatus.UNAUTHORIZED:
-                    _LOGGER.error(
-                        "Weather.com config responded with HTTP error %s: %s",
-                        response.status,
-                        response.reason,
-                    )
-                    raise InvalidApiKey
-                else:
-                    _LOGGER.error(
-                        "Weather.com config responded with HTTP error %s: %s",
-                        response.status,
-                        response.reason,
-                    )
-                    raise Exception
-
-        except InvalidApiKey:
+                raise coordinator.InvalidApiKey
+
+            result_current = await coordinator.async_fetch_json(self.hass, url)
+            if not isinstance(result_current, dict) or 'current' not in result_current:
+                raise coordinator.InvalidApiKey
+
+        except coordinator.InvalidApiKey:
             errors["base"] = "invalid_api_key"
             return await self._show_setup_form(errors=errors)
+        except aiohttp.ClientResponseError as err:
+            # 401 status is most likely bad api_key or api usage limit exceeded
+            _LOGGER.error(
+                "Weather.com config responded with HTTP error %s: %s",
+                err.status,
+                err.message,
+            )
+            errors["base"] = "invalid_api_key" if err.status == HTTPStatus.UNAUTHORIZED else "unknown_error"
+            return await self._show_setup_form(errors=errors)
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Unexpected exception")
             errors["base"] = "unknown_error"
             return await self._show_setup_form(errors=errors)
 
-        if not errors:
-            result_current = await response.json(content_type=None)
+        unique_id = str(f"{DOMAIN}-wn-{location_name}")
+        await self.async_set_unique_id(unique_id)
+        self._abort_if_unique_id_configured()
 
-            unique_id = str(f"{DOMAIN}-wn-{location_name}")
-            await self.async_set_unique_id(unique_id)
-            self._abort_if_unique_id_configured()
+        coordinator.async_prime_payload(self.hass, url, result_current)
 
-            return self.async_create_entry(
-                title=location_name,
-                data={
-                    CONF_API_KEY: user_input[CONF_API_KEY],
-                    CONF_NAME: location_name,
-                    CONF_LANG: user_input[CONF_LANG]
-                },
-            )
+        return self.async_create_entry(
+            title=location_name,
+            data={
+                CONF_API_KEY: user_input[CONF_API_KEY],
+                CONF_NAME: location_name,
+                CONF_LANG: user_input[CONF_LANG]
+            },
+        )
+
+    async def async_step_fleet(self, user_input=None):
+        """Handle a fleet entry polling many location codes."""
+        errors = {}
+        if user_input is not None:
+            fleet = await _async_import(self.hass, "fleet")
+            locations = fleet.parse_location_codes(user_input[CONF_LOCATIONS])
+            if not locations or not all(code.isdigit() for code in locations):
+                errors["base"] = "invalid_locations"
+            else:
+                location_name = user_input[CONF_NAME]
+                await self.async_set_unique_id(f"{DOMAIN}-fleet-{location_name}")
+                self._abort_if_unique_id_configured()
+
+                return self.async_create_entry(
+                    title=location_name,
+                    data={
+                        CONF_FLEET: True,
+                        CONF_NAME: location_name,
+                        CONF_LOCATIONS: locations,
+                        CONF_LANG: user_input[CONF_LANG],
+                        CONF_CONCURRENCY: user_input[CONF_CONCURRENCY]
+                    },
+                )
+
+        # Map every zone to its nearest location code as the default list
+        regions = await _async_import(self.hass, "regions")
+        index = await self.hass.async_add_executor_job(regions.load_region_index)
+        zone_codes = []
+        for zone in self.hass.states.async_all("zone"):
+            latitude = zone.attributes.get("latitude")
+            longitude = zone.attributes.get("longitude")
+            if latitude is None or longitude is None:
+                continue
+            if (nearest := index.nearest(latitude, longitude, 1, regions.MAX_SUGGEST_KM)) and nearest[0][0] not in zone_codes:
+                zone_codes.append(nearest[0][0])
+
+        return self.async_show_form(
+            step_id="fleet",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_NAME, default=DEFAULT_FLEET_NAME): str,
+                    vol.Required(
+                        CONF_LOCATIONS, default=", ".join(zone_codes) or vol.UNDEFINED
+                    ): str,
+                    vol.Required(
+                        CONF_LANG, default=DEFAULT_LANG
+                    ): vol.All(vol.In(LANG_CODES)),
+                    vol.Required(
+                        CONF_CONCURRENCY, default=DEFAULT_CONCURRENCY
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_CONCURRENCY)),
+                }
+            ),
+            errors=errors,
+        )
+
+    async def _async_region_index(self):
+        """Load the bundled region index, importing the module on first use."""
+        regions = await _async_import(self.hass, "regions")
+        return await self.hass.async_add_executor_job(regions.load_region_index)
 
     async def _show_setup_form(self, errors=None):
         """Show the setup form to the user."""
+        if self._region_code is None:
+            # Suggest the location code closest to the Home Assistant location
+            regions = await _async_import(self.hass, "regions")
+            index = await self.hass.async_add_executor_job(regions.load_region_index)
+            if nearest := index.nearest(
+                    self.hass.config.latitude, self.hass.config.longitude, 1, regions.MAX_SUGGEST_KM):
+                self._region_code = nearest[0][0]
         return self.async_show_form(
-            step_id="user",
+            step_id="location",
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_API_KEY): str,
                     vol.Required(
-                        CONF_NAME, default=self.hass.config.location_name
+                        CONF_API_KEY, default=self._region_code or vol.UNDEFINED
+                    ): str,
+                    vol.Required(
+                        CONF_NAME, default=self._region_name or self.hass.config.location_name
                     ): str,
                     vol.Required(
                         CONF_LANG, default=DEFAULT_LANG
@@ -111,3 +257,79 @@ class WeatherFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             ),
             errors=errors or {},
         )
+
+
+class WeatherOptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle weathernews options."""
+
+    async def async_step_init(self, user_input=None):
+        """Manage the options."""
+        # Fleet entries only create a temperature sensor per location, without
+        # interpolation, history, statistics, rules or entity profiles
+        fleet = bool(self.config_entry.data.get(CONF_FLEET))
+        errors = {}
+        if user_input is not None:
+            rules = await _async_import(self.hass, "rules")
+            try:
+                rules.compile_rules(user_input.get(CONF_RULES, ""))
+            except ValueError as err:
+                _LOGGER.debug("Invalid rules: %s", err)
+                errors[CONF_RULES] = "invalid_rules"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+
+        options = user_input or self.config_entry.options
+        schema = {
+            vol.Required(
+                CONF_REQUESTS_PER_MINUTE,
+                default=options.get(CONF_REQUESTS_PER_MINUTE, DEFAULT_REQUESTS_PER_MINUTE)
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=600)),
+        }
+        if not fleet:
+            schema.update({
+                vol.Required(
+                    CONF_INTERPOLATE,
+                    default=options.get(CONF_INTERPOLATE, False)
+                ): bool,
+                vol.Required(
+                    CONF_HISTORY,
+                    default=options.get(CONF_HISTORY, False)
+                ): bool,
+                vol.Required(
+                    CONF_STATISTICS,
+                    default=options.get(CONF_STATISTICS, False)
+                ): bool,
+            })
+        schema.update({
+            vol.Required(group, default=options.get(group, True)): bool
+            for group in FEATURE_GROUPS
+        })
+        if not fleet:
+            schema[vol.Required(
+                CONF_ENTITY_PROFILE,
+                default=options.get(CONF_ENTITY_PROFILE, PROFILE_FULL)
+            )] = vol.In(ENTITY_PROFILES)
+        schema.update({
+            vol.Required(
+                CONF_STAGE_BUDGET,
+                default=options.get(CONF_STAGE_BUDGET, DEFAULT_STAGE_BUDGET)
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=10000)),
+            vol.Required(
+                CONF_OFFLOAD_ROWS,
+                default=options.get(CONF_OFFLOAD_ROWS, DEFAULT_OFFLOAD_ROWS)
+            ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            vol.Required(
+                CONF_AQ_STANDARD,
+                default=options.get(CONF_AQ_STANDARD, AQ_STANDARD_KOREA)
+            ): vol.In(AQ_STANDARDS),
+        })
+        if not fleet:
+            schema[vol.Optional(
+                CONF_RULES,
+                default=options.get(CONF_RULES, "")
+            )] = TextSelector(TextSelectorConfig(multiline=True))
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(schema),
+            errors=errors,
+        )
@@ -28,6 +28,31 @@ DOMAIN = 'weathernews'
 # NAME = 'WeatherUnderground'
 CONF_ATTRIBUTION = 'Data provided by the kr-weathernews.com weather service'
 CONF_LANG = 'lang'
+CONF_QUERY = 'query'
+CONF_FLEET = 'fleet'
+CONF_LOCATIONS = 'locations'
+CONF_CONCURRENCY = 'concurrency'
+CONF_REQUESTS_PER_MINUTE = 'requests_per_minute'
+CONF_INTERPOLATE = 'interpolate'
+CONF_HISTORY = 'history'
+CONF_STATISTICS = 'statistics'
+CONF_RULES = 'rules'
+CONF_STAGE_BUDGET = 'stage_budget'
+CONF_OFFLOAD_ROWS = 'offload_rows'
+CONF_ENTITY_PROFILE = 'entity_profile'
+CONF_AQ_STANDARD = 'aq_standard'
+
+# Feature groups, each an option; disabled groups skip their requests and entities
+GROUP_FORECAST = 'forecast'
+GROUP_SUMMARY = 'summary'
+GROUP_AIR = 'air'
+GROUP_PM_FORECAST = 'pm_forecast'
+GROUP_BRIEFING = 'briefing'
+FEATURE_GROUPS = (GROUP_FORECAST, GROUP_SUMMARY, GROUP_AIR, GROUP_PM_FORECAST, GROUP_BRIEFING)
+
+DATA_RATE_LIMITER = f'{DOMAIN}_rate_limiter'
+DATA_PRIMED = f'{DOMAIN}_primed'
+DATA_AIR_CACHE = f'{DOMAIN}_air_cache'
 
 ENTRY_WEATHER_COORDINATOR = 'weather_coordinator'
 
@@ -86,7 +111,33 @@ SNOWYRAIN_CONDITION_MAP = {
     'snow': [ATTR_CONDITION_SNOWY],
     'snowrainy': [ATTR_CONDITION_SNOWY_RAINY]
 }
+URL_MAIN = 'https://www.kr-weathernews.com/mv3/if/main_v4.fcgi?loc={apiKey}&language={lang}'
+URL_WEATHER = 'https://galaxy.kr-weathernews.com/api_v2/weather_v4.cgi?loc={apiKey}&language={lang}'
+URL_AIR = 'https://www.kr-weathernews.com/mv3/if/main2_v2.fcgi?lat={lat}&lon={lon}'
+URL_PM = 'https://www.kr-weathernews.com/mv3/if/pm_v4.fcgi?loc={apiKey}'
+URL_TODAY = 'https://www.kr-weathernews.com/mv4/html/today.html?loc={apiKey}'
+
 DEFAULT_LANG = 'ko-KR'
+DEFAULT_FLEET_NAME = 'WeatherNews Fleet'
+DEFAULT_CONCURRENCY = 4
+MAX_CONCURRENCY = 16
+# 설정마다 호스트별 분당 요청 수
+DEFAULT_REQUESTS_PER_MINUTE = 30
+# 후처리 단계 시간 예산 (ms), 넘으면 경고 로그
+DEFAULT_STAGE_BUDGET = 20
+# 예보 행 수가 이 이상이면 후처리를 실행기 스레드에서 (0이면 사용 안함)
+# 보통 응답은 86행 (main_v4 매시 48 + 매일 10, pm_v4 매시 24 + 매일 4), 미세먼지 예보를 끄면 58행이라
+# 정상 응답은 모두 옮기고 빈 응답이나 잘린 응답만 이벤트 루프에서 처리
+DEFAULT_OFFLOAD_ROWS = 50
+# 엔티티 구성: 전체 센서, 또는 속성으로 묶은 몇 개의 센서
+PROFILE_FULL = 'full'
+PROFILE_COMPACT = 'compact'
+ENTITY_PROFILES = [PROFILE_FULL, PROFILE_COMPACT]
+# 대기질 등급 기준
+AQ_STANDARD_KOREA = 'korea'
+AQ_STANDARD_WHO = 'who'
+AQ_STANDARD_US = 'us'
+AQ_STANDARDS = [AQ_STANDARD_KOREA, AQ_STANDARD_WHO, AQ_STANDARD_US]
 API_IMPERIAL: Final = "imperial"
 API_METRIC: Final = "metric"
 API_URL_IMPERIAL: Final = "e"
@@ -106,6 +157,9 @@ FIELD_DAYPART = 'daypart' #
 FIELD_DESCRIPTION = 'wxPhraseLong' #
 FIELD_DEW_POINT = 'dewpt'
 FIELD_FEELS_LIKE = 'feeltemp'
+FIELD_HEATINDEX = 'heatindex'
+FIELD_WINDCHILL = 'windchill'
+FIELD_DISCOMFORT = 'discomfort'
 FIELD_HUMIDITY = 'rhum'
 FIELD_HUMIDITY_HOURLY = 'humi'
 FIELD_ICONCODE = 'wx'
@@ -128,6 +182,11 @@ FIELD_WINDDIR = 'wdir' #
 FIELD_WINDGUST = 'windGust' #
 FIELD_WINDSPEED = 'wspd'
 
+# 매시 예보에 추가되는 체감지수 항목
+ATTR_FORECAST_HEAT_INDEX = 'heat_index'
+ATTR_FORECAST_WIND_CHILL = 'wind_chill'
+ATTR_FORECAST_DISCOMFORT_INDEX = 'discomfort_index'
+
 ICON_THERMOMETER = 'mdi:thermometer'
 ICON_UMBRELLA = 'mdi:umbrella'
 ICON_WIND = 'mdi:weather-windy'
\ No newline at end of file
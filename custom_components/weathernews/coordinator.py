@@ -3,31 +3,51 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+import importlib
 import logging
+import random
+import time
 from typing import Any
 
 import aiohttp
-import asyncio
 import json
 import async_timeout
-import re
-import copy
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_point_in_utc_time, async_track_time_interval
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 # from homeassistant.util import json
+from homeassistant.util import dt as dt_util
 from homeassistant.util.unit_system import METRIC_SYSTEM
 from homeassistant.const import (
     PERCENTAGE, UnitOfPressure, UnitOfTemperature, UnitOfLength, UnitOfSpeed, UnitOfVolumetricFlux)
+from .aircache import async_get_air_cache
+from .comfort import comfort_series, heat_grade, peak_heat_index
+from .derived import DerivedRegistry, LazyCurrent
+from .grading import AQ_STANDARD_KOREA, get_standard
+from .interpolate import CurrentInterpolator
+from .observations import ObservationBuffer
+from .ratelimit import async_get_rate_limiter
+from .rules import RuleEngine, compile_rules
+from .schedule import PublishTracker, parse_publish_time
+from .solar import SolarTable
+from .timeindex import ForecastIndex
+from .units import to_imperial
 from .const import (
     ICON_CONDITION_MAP,
     SNOWYRAIN_CONDITION_MAP,
     FIELD_DAYPART,
     FIELD_HUMIDITY,
+    FIELD_HUMIDITY_HOURLY,
+    FIELD_HEATINDEX,
+    FIELD_WINDCHILL,
+    FIELD_DISCOMFORT,
     FIELD_TEMP,
     FIELD_TEMPERATUREMAX,
     FIELD_TEMPERATUREMIN,
@@ -40,8 +60,23 @@ from .const import (
     FIELD_DAYORNIGHT,
     FIELD_PRECIPCHANCE,
     FIELD_PRECIPITATION,
+    FIELD_PRESSURE,
     FIELD_ICONCODE,
     DOMAIN,
+    API_URL_METRIC,
+    DATA_PRIMED,
+    DEFAULT_OFFLOAD_ROWS,
+    DEFAULT_STAGE_BUDGET,
+    FEATURE_GROUPS,
+    GROUP_FORECAST,
+    GROUP_SUMMARY,
+    GROUP_AIR,
+    GROUP_PM_FORECAST,
+    GROUP_BRIEFING,
+    URL_MAIN,
+    URL_WEATHER,
+    URL_AIR,
+    URL_PM,
     RESULTS_CURRENT,
     RESULTS_FORECAST_DAILY,
     RESULTS_FORECAST_HOURLY
@@ -50,6 +85,42 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 MIN_TIME_BETWEEN_UPDATES = timedelta(minutes=20)
+NUMERIC_CHARS = frozenset('0123456789.')
+REQUEST_TIMEOUT = 10
+INTERPOLATE_INTERVAL = timedelta(minutes=5)
+# Upper bound of the random delay before the first refresh of an entry
+STARTUP_JITTER = timedelta(seconds=15)
+
+# Sensor translation files by language
+_TRANSLATIONS: dict[str, dict] = {}
+
+HEADERS = {
+    'Accept-Encoding': 'gzip',
+    "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/111.0.0.0 Safari/537.36"
+}
+
+
+DERIVED = DerivedRegistry()
+# Internal derived key: comfort indexes added to the hourly rows
+FIELD_HOURLY_COMFORT = '_hourlyComfort'
+# Internal derived key: hourly and daily rows indexed by validity time
+FIELD_FORECAST_INDEX = '_forecastIndex'
+# Rain forecast windows: key -> hours, None for the rest of today, 'tomorrow' up to the end of tomorrow
+PRECIP_WINDOWS = {
+    'precipHourToday': None,
+    'precipHourTomorrow': 'tomorrow',
+    'precipHour3': 3,
+    'precipHour6': 6,
+    'precipHour9': 9,
+    'precipHour12': 12,
+}
+# Observation trends: window seconds and the change below which the trend is steady
+TREND_FIELDS = (FIELD_PRESSURE, FIELD_TEMP, 'pm10', 'pm25')
+PRESSURE_TENDENCY_WINDOW = 3 * 3600
+PRESSURE_STEADY = 1.0
+TEMP_RATE_WINDOW = 3600
+PM_TREND_WINDOW = 3 * 3600
+PM_STEADY = 5.0
 
 
 @dataclass
@@ -61,6 +132,14 @@ class WeatherUpdateCoordinatorConfig:
     unit_system_api: str
     unit_system: str
     lang: str
+    entry_id: str | None = None
+    interpolate: bool = False
+    history: bool = False
+    rules: str = ""
+    groups: frozenset = frozenset(FEATURE_GROUPS)
+    stage_budget: int = DEFAULT_STAGE_BUDGET
+    offload_rows: int = DEFAULT_OFFLOAD_ROWS
+    aq_standard: str = AQ_STANDARD_KOREA
     update_interval = MIN_TIME_BETWEEN_UPDATES
 
 
@@ -78,14 +157,51 @@ class WeatherUpdateCoordinator(DataUpdateCoordinator):
         self._api_key = config.api_key
         self._location_name = config.location_name
         self._unit_system_api = config.unit_system_api
+        self._convert_units = config.unit_system_api != API_URL_METRIC
         self.unit_system = config.unit_system
         self._lang = config.lang
+        self._entry_id = config.entry_id
         self.data = None
-        self._session = async_get_clientsession(self._hass)
+        # Bumped whenever data changes, for clients polling with `since`
+        self.data_version = 0
+        # Time of the last successful fetch, and the refresh shared by refresh_if_stale callers
+        self.fetched_at = None
+        self._stale_refresh = None
+        self._rate_limiter = async_get_rate_limiter(self._hass)
+        self._air_cache = async_get_air_cache(self._hass)
+        self._update_interval = config.update_interval
+        self._publish_tracker = PublishTracker()
+        # Random phase so entries started together do not poll in lockstep: a short delay
+        # before the first refresh spreads the boot burst, the offset shifts the interval after it
+        self._startup_delay = None
+        self._phase_offset = None
+        if config.update_interval is not None:
+            self._startup_delay = random.uniform(0, STARTUP_JITTER.total_seconds())
+            self._phase_offset = timedelta(seconds=random.uniform(0, config.update_interval.total_seconds()))
+        self._interpolate = config.interpolate
+        self._interpolator = None
+        # Interpolated current values shown by the entities, the fetched observation stays
+        # untouched for the derived fields and rules
+        self.interpolated: dict[str, Any] = {}
+        self._solar = None
+        # 최근 관측값 (추세 센서용)
+        self._observations = ObservationBuffer(TREND_FIELDS)
+        self._observed = None
+        self._sun_tracking = False
+        self._sun_unsub = None
+        self.groups = frozenset(config.groups)
+        self._derived_keys = DERIVED.keys(self.groups)
+        self._stage_budget = config.stage_budget / 1000
+        self._offload_rows = config.offload_rows
+        self._aq_standard = config.aq_standard
+        self._grading = get_standard(config.aq_standard)
+        self.rule_engine = RuleEngine(hass, self, compile_rules(config.rules))
+        self._history = None
+        self._history_scores = None
+        self._history_scored = 0
         self._tranfile = None
-        asyncio.create_task(self.async_init())
 
-        if self._unit_system_api == 'm':
+        if self._unit_system_api == API_URL_METRIC:
             self.units_of_measurement = (UnitOfTemperature.CELSIUS, UnitOfLength.MILLIMETERS, UnitOfLength.METERS,
                                         UnitOfSpeed.KILOMETERS_PER_HOUR, UnitOfPressure.MBAR,
                                         UnitOfVolumetricFlux.MILLIMETERS_PER_HOUR, PERCENTAGE)
@@ -119,146 +235,187 @@ class WeatherUpdateCoordinator(DataUpdateCoordinator):
         return self._api_key
 
     async def _async_update_data(self) -> dict[str, Any]:
-        return await self.get_weather()
+        if self._startup_delay is not None:
+            # A payload primed by the config flow needs no request, so no reason to wait
+            if self._build_url(URL_MAIN) not in self._hass.data.get(DATA_PRIMED, {}):
+                await asyncio.sleep(self._startup_delay)
+            self._startup_delay = None
+        result = await self.get_weather()
+        if self._update_interval is None:
+            return result
+        if self._phase_offset is not None:
+            self.update_interval = self._update_interval + self._phase_offset
+            self._phase_offset = None
+        else:
+            self.update_interval = self._publish_tracker.next_refresh(self._update_interval)
+        return result
 
     async def get_weather(self):
         """Get weather data."""
-        headers = {
-            'Accept-Encoding': 'gzip',
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/111.0.0.0 Safari/537.36"
-        }
+        if self._tranfile is None:
+            # Part of the refresh, so no untracked task outlives an unload
+            await self.async_init()
         try:
+            """CURRENT, FORECAST"""
+            # https://www.kr-weathernews.com/mv3/if/main_v4.fcgi?loc=1147010300&language=ko
+            result_data = await self._fetch_json(self._build_url(URL_MAIN))
+            lat = result_data['lat']
+            lon = result_data['lon']
+            if self._solar is None:
+                self._solar = SolarTable(lat, lon, dt_util.get_default_time_zone())
+
+            """날씨요약"""
+            # https://galaxy.kr-weathernews.com/api_v2/weather_v4.cgi?loc=1147010300
+            result_data2 = None
+            if GROUP_SUMMARY in self.groups:
+                result_data2 = await self._fetch_json(self._build_url(URL_WEATHER))
+
+            # 발표시간으로 다음 갱신시점 학습
+            self._publish_tracker.record('main', result_data['current'].get(FIELD_VALIDTIMELOCAL))
+            if result_data2 is not None:
+                self._publish_tracker.record('weather', result_data2[0].get('publish_TimeLocal'))
+
+            """통합대기등급"""
+            # https://www.kr-weathernews.com/mv3/if/main2_v2.fcgi?lat=37.544147&lon=126.8357822
+            result_data3 = None
+            if GROUP_AIR in self.groups:
+                # 가까운 지역(격자 셀)끼리 응답 공유
+                result_data3 = await self._air_cache.async_get(
+                    lat, lon, lambda: self._fetch_json(self._build_url(URL_AIR, lat=lat, lon=lon)))
+                # 공유 응답이라 속성을 추가할 aq는 복사
+                result_data3 = {**result_data3, 'aq': dict(result_data3['aq'])}
+
+            """미세먼지예보"""
+            # https://www.kr-weathernews.com/mv3/if/pm_v4.fcgi?loc=1147010300
+            result_data4 = None
+            if GROUP_PM_FORECAST in self.groups:
+                result_data4 = await self._fetch_json(self._build_url(URL_PM))
+
+            # 관측시간이 바뀌면 관측값 기록
+            if (observed := result_data['current'].get(FIELD_VALIDTIMELOCAL)) != self._observed:
+                self._observed = observed
+                self._observations.append(time.time(), result_data['current'])
+
+            # 호스트별 오늘 요청 수
+            requestsToday = self._rate_limiter.requests_today()
+
+            # 후처리, 예보 행이 많으면 이벤트 루프를 막지 않게 실행기 스레드에서
+            payloads = _Payloads(self, result_data, result_data2, result_data3, result_data4)
+            if self._offload_rows and payloads.rows() >= self._offload_rows:
+                current = await self._hass.async_add_executor_job(self._transform, payloads, requestsToday, True)
+                current.on_compute = self._check_stage
+            else:
+                with self._stage('transform'):
+                    current = self._transform(payloads, requestsToday, False)
+            result_data['current'] = current
+
+            # 예보 이력, 정확도
+            if self._history is not None:
+                result_data['current'].update(await self._async_record_history(result_data))
             
-            with async_timeout.timeout(10):
-                """CURRENT, FORECAST"""
-                # https://www.kr-weathernews.com/mv3/if/main_v4.fcgi?loc=1147010300&language=ko
-                url = self._build_url('https://www.kr-weathernews.com/mv3/if/main_v4.fcgi?loc={apiKey}&language={lang}')
-                response = await self._session.get(url, headers=headers)
-                result_data = await response.json(content_type=None)
-
-                if result_data is None:
-                    raise ValueError('NO RESULT')
-                self._check_errors(url, result_data)
-                lat = result_data['lat']
-                lon = result_data['lon']
-
-            with async_timeout.timeout(10):
-                """날씨요약"""
-                # https://galaxy.kr-weathernews.com/api_v2/weather_v4.cgi?loc=1147010300
-                url = self._build_url('https://galaxy.kr-weathernews.com/api_v2/weather_v4.cgi?loc={apiKey}&language={lang}')
-                response = await self._session.get(url, headers=headers)
-                result_data2 = await response.json(content_type=None)
-
-                if result_data2 is None:
-                    raise ValueError('NO RESULT2')
-                self._check_errors(url, result_data2)
-
-            with async_timeout.timeout(10):
-                """통합대기등급"""
-                # https://www.kr-weathernews.com/mv3/if/main2_v2.fcgi?lat=37.544147&lon=126.8357822
-                url = self._build_url(f"https://www.kr-weathernews.com/mv3/if/main2_v2.fcgi?lat={lat}&lon={lon}")
-                response = await self._session.get(url, headers=headers)
-                result_data3 = await response.json(content_type=None)
-
-                if result_data3 is None:
-                    raise ValueError('NO RESULT3')
-                self._check_errors(url, result_data3)
-                tempdiff = int(result_data3['current']['tempdiff'])
-                if tempdiff == 0:
-                    tempdiffCmt = "어제와 같아요"
+            result = {
+                RESULTS_CURRENT: result_data['current'],
+                RESULTS_FORECAST_DAILY: result_data['daily'],
+                RESULTS_FORECAST_HOURLY: result_data['hourly'],
+            }
+
+            self.data = result
+            self.fetched_at = dt_util.utcnow()
+            self.interpolated = {}
+            self._bump_data_version()
+            if self._sun_tracking and self._sun_unsub is None:
+                self._async_schedule_sun()
+            if self._interpolate:
+                # Anchored at the observation time, which may be well before the fetch
+                observed_at = parse_publish_time(result_data['current'].get(FIELD_VALIDTIMELOCAL))
+                self._interpolator = CurrentInterpolator(
+                    result_data['hourly'], result_data['current'], observed_at or self.fetched_at)
+
+            return result
+
+        except ValueError as err:
+            _LOGGER.error("Check Weather API %s", err.args)
+            raise UpdateFailed(err)
+        except (asyncio.TimeoutError, aiohttp.ClientError) as err:
+            _LOGGER.error("Error fetching Weather data: %s", repr(err))
+            raise UpdateFailed(err)
+        # _LOGGER.debug(f'Weather data {self.data}')
+
+    def data_age(self) -> float | None:
+        """Return the seconds since the last successful fetch."""
+        if self.fetched_at is None:
+            return None
+        return (dt_util.utcnow() - self.fetched_at).total_seconds()
+
+    async def async_refresh_if_stale(self, max_age: timedelta) -> bool:
+        """Refresh when the data is older than max_age, return whether a refresh ran.
+
+        Concurrent callers share one refresh.
+        """
+        age = self.data_age()
+        if age is not None and age <= max_age.total_seconds():
+            return False
+        if self._stale_refresh is None:
+            self._stale_refresh = self._hass.async_create_task(
+                self.async_refresh(), f"{DOMAIN} refresh_if_stale {self._location_name}")
+            self._stale_refresh.add_done_callback(self._clear_stale_refresh)
+        # Shielded so a cancelled caller does not cancel the shared refresh
+        await asyncio.shield(self._stale_refresh)
+        return True
+
+    def _clear_stale_refresh(self, _task: asyncio.Task) -> None:
+        self._stale_refresh = None
+
+    def _bump_data_version(self) -> None:
+        # Millisecond based so versions keep increasing across reloads
+        self.data_version = max(self.data_version + 1, int(time.time() * 1000))
+
+    def _transform(self, payloads: _Payloads, requestsToday: dict, offloaded: bool) -> LazyCurrent:
+        """Build the current data from the responses, pure data work safe to run in a thread."""
+        result_data = payloads.main
+        result_data2 = payloads.summary
+        result_data3 = payloads.air
+        result_data4 = payloads.pm
+
+        # 미세먼지 등급: 한국 기준은 날씨 요약의 등급, 다른 기준은 선택한 기준으로 계산
+        pmDesc = {'pm10': None, 'pm25': None}
+        if result_data2 is not None:
+            for key in pmDesc:
+                air = result_data2[0]['air'][key]
+                if self._aq_standard == AQ_STANDARD_KOREA:
+                    pmDesc[key] = air['description']
                 else:
-                    tempdiffCmt = "어제보다 {}도 {}아요".format(abs(tempdiff), "높" if tempdiff > 0 else "낮")
-
-            pmForecastDaily = []
-            pmForecastHourly = []
-
-            with async_timeout.timeout(10):
-                """미세먼지예보"""
-                # https://www.kr-weathernews.com/mv3/if/pm_v4.fcgi?loc=1147010300
-                url = self._build_url("https://www.kr-weathernews.com/mv3/if/pm_v4.fcgi?loc={apiKey}")
-                response = await self._session.get(url, headers=headers)
-                result_data4 = await response.json(content_type=None)
-
-                if result_data4 is None:
-                    raise ValueError('NO RESULT4')
-                self._check_errors(url, result_data4)
-                
-                # new_item = {'date': datetime.strptime(result_data2[0]['publish_TimeLocal'], "%Y/%m/%dT%H:%M:%S%z").strftime("%Y-%m-%d %H:%M:%S"), 'pm10': result_data2[0]['air']['pm10']['value'], 'pm25': result_data2[0]['air']['pm25']['value']}
-                # pmForecastDaily.append(new_item)
-                # pmForecastHourly.append(new_item)
-                for pm in result_data4['pm']['forcast']['daily']:
-                    new_pm = {
-                        "date": f'{pm["year"]}-{pm["mon"]:02d}-{pm["day"]:02d} 00:00:00',
-                        "pm10": pm["pm10"],
-                        "pm25": pm["pm25"],
-                        "aqi": pm["aqi"],
-                        "o3": pm["o3"],
-                        "pm10Desc": self._range_desc([30,80,150], pm["pm10"]),
-                        "pm25Desc": self._range_desc([15,35,75], pm["pm25"]),
-                        "aqiDesc": self._range_desc([50,100,250], pm["aqi"]),
-                    }
-                    pmForecastDaily.append(new_pm)
-
-                for pm in result_data4['pm']['forcast']['hourly']:
-                    new_pm = {
-                        "date": f'{pm["year"]}-{pm["mon"]:02d}-{pm["day"]:02d} {pm["hour"]:02d}:00:00',
-                        "pm10": pm["pm10"],
-                        "pm25": pm["pm25"]
-                    }
-                    pmForecastHourly.append(new_pm)
-
-            # 비시작시간
-            remainhour = 24 - int(result_data['hourly'][0]['hour']) 
-            precipHourTodayAttr = self._get_precip_hour(result_data['hourly'], remainhour) # 오늘 
-            precipHourTomorrowAttr = self._get_precip_hour(result_data['hourly'], remainhour+24, result_data['daily'][0]['day']) # 내일까지
-            precipHour3Attr = self._get_precip_hour(result_data['hourly'], 3, result_data['daily'][0]['day']) # 3시간
-            precipHour6Attr = self._get_precip_hour(result_data['hourly'], 6, result_data['daily'][0]['day']) # 6시간
-            precipHour9Attr = self._get_precip_hour(result_data['hourly'], 9, result_data['daily'][0]['day']) # 9시간
-            precipHour12Attr = self._get_precip_hour(result_data['hourly'], 12, result_data['daily'][0]['day']) # 12시간
-
-            # 통합대기 속성추가
+                    pmDesc[key] = self._grading[key].grade(air.get('value'))
+
+        # 통합대기 속성추가, 어제와 온도차
+        tempdiff = None
+        tempdiffCmt = None
+        if result_data3 is not None:
+            khaiGrade = self._grading['aqi'].index(result_data3['aq']['khai'])
             result_data3['aq'].update({
-                'pm10Desc': result_data2[0]['air']['pm10']['description'],
-                'pm25Desc': result_data2[0]['air']['pm25']['description'],
-                'khaiDesc': self._range_desc([50,100,250], result_data3['aq']['khai'])
+                'pm10Desc': pmDesc['pm10'],
+                'pm25Desc': pmDesc['pm25'],
+                'khaiDesc': None if khaiGrade is None else self._grading['aqi'].labels[khaiGrade],
+                'khaiGrade': khaiGrade,
             })
-
-            # 열지수
-            heatIndex = heatIndexCalc(result_data['current'][FIELD_TEMP], result_data['current'][FIELD_HUMIDITY])
-            
-            hour = int(result_data['hourly'][0]['hour'])
-            mon = int(result_data['hourly'][0]['mon'])
-            weather_briefing = {}
-            weather_briefing['현재 날씨'] = f"현재 날씨 {result_data2[0]['cur_cmt']}"
-            weather_briefing['온도'] = f"온도 {result_data['current'][FIELD_TEMP]}°C"
-            weather_briefing['어제와 온도차'] = tempdiffCmt
-            weather_briefing['최저 온도'] = f"최저 {result_data['current'][FIELD_TEMPERATUREMIN]}°C"
-            weather_briefing['최고 온도'] = f"최고 {result_data['current'][FIELD_TEMPERATUREMAX]}°C"
-            weather_briefing['습도'] = f"습도 {result_data['current'][FIELD_HUMIDITY]}%"
-            weather_briefing['강수확률'] = f"강수확률 {precipHour12Attr['max_pop']}%"
-            weather_briefing['강수예상'] = f"{precipHour12Attr['cmt']}, {precipHour12Attr['cmt2']} 예상"
-            weather_briefing['미세먼지'] = f"미세먼지 {result_data2[0]['air']['pm10']['description']}"
-            weather_briefing['초미세먼지'] = f"초미세먼지 {result_data2[0]['air']['pm25']['description']}"
-            weather_briefing['통합대기'] = f"통합대기 {result_data3['aq']['khaiDesc']}"
-
-            weather_briefing_cmt = copy.deepcopy(weather_briefing)
-            if mon not in [11,12,1,2] or hour > 10:
-                del weather_briefing_cmt['최저 온도']
-            if hour > 14:
-                del weather_briefing_cmt['최고 온도']
-            if precipHour12Attr['cmt'] == '안옴':
-                del weather_briefing_cmt['강수확률']
-                del weather_briefing_cmt['강수예상']
-
-            weather_briefing_str = [str(value) for value in weather_briefing_cmt.values() if value]
-            weather_briefing_join = ", ".join(weather_briefing_str) + "입니다."
-
-            # 현재날씨 속성추가
-            result_data['current'].update({
-                'sunrise': result_data['sunrise'],
-                'sunset': result_data['sunset'],
-                'pop': result_data['daily'][0]['pop'],
-                FIELD_DAYORNIGHT: result_data['hourly'][0][FIELD_DAYORNIGHT],
+            tempdiff = int(result_data3['current']['tempdiff'])
+            if tempdiff == 0:
+                tempdiffCmt = "어제와 같아요"
+            else:
+                tempdiffCmt = "어제보다 {}도 {}아요".format(abs(tempdiff), "높" if tempdiff > 0 else "낮")
+
+        # 현재날씨 속성추가, 파생 항목(비 예보, 열지수, 날씨보고 등)은 읽을 때 계산
+        current = LazyCurrent(
+            result_data['current'], DERIVED, self._derived_keys, payloads,
+            None if offloaded else self._check_stage)
+        current.update(self._sun_fields(dt_util.utcnow(), result_data))
+        current.update({
+            'pop': result_data['daily'][0]['pop'],
+            'requestsToday': sum(requestsToday.values()),
+            'requestsTodayAttr': requestsToday
+        })
+        if result_data2 is not None:
+            current.update({
                 'cur_cmt': result_data2[0]['cur_cmt'],
                 'day_cmt': result_data2[0]['daily'][0]['day_cmt'],
                 'night_cmt': result_data2[0]['daily'][0]['night_cmt'],
@@ -266,64 +423,156 @@ class WeatherUpdateCoordinator(DataUpdateCoordinator):
                 'nextDayShortCmt': result_data2[0]['daily'][0]['nextDayShortCmt'],
                 'pm10Attr': result_data2[0]['air']['pm10'],
                 'pm25Attr': result_data2[0]['air']['pm25'],
-                'pm10Desc': result_data2[0]['air']['pm10']['description'],
-                'pm25Desc': result_data2[0]['air']['pm25']['description'],
-                'heatindex': heatIndex['heatindex'],
-                'heatindexAttr': heatIndex,
+                'pm10Desc': pmDesc['pm10'],
+                'pm25Desc': pmDesc['pm25'],
+            })
+        if result_data3 is not None:
+            current.update({
                 'khai': result_data3['aq']['khai'],
                 'pm': result_data3['aq'],
                 'tempdiff': tempdiff,
                 'tempdiffCmt': tempdiffCmt,
-                'precipHourToday': precipHourTodayAttr['cmt'],
-                'precipHourTodayAttr': precipHourTodayAttr,
-                'precipHourTomorrow': precipHourTomorrowAttr['cmt'],
-                'precipHourTomorrowAttr': precipHourTomorrowAttr,
-                'precipHour3': precipHour3Attr['cmt'],
-                'precipHour3Attr': precipHour3Attr,
-                'precipHour6': precipHour6Attr['cmt'],
-                'precipHour6Attr': precipHour6Attr,
-                'precipHour9': precipHour9Attr['cmt'],
-                'precipHour9Attr': precipHour9Attr,
-                'precipHour12': precipHour12Attr['cmt'],
-                'precipHour12Attr': precipHour12Attr,
-                'weatherBriping': weather_briefing_join,
-                'weatherBripingAttr': weather_briefing,
-                'pmForecast': result_data4['pm']['forcast']['hourly'][0]['pm10'],
-                'pmForecastDaily': pmForecastDaily,
-                'pmForecastHourly': pmForecastHourly
             })
-            
-            result = {
-                RESULTS_CURRENT: result_data['current'],
-                RESULTS_FORECAST_DAILY: result_data['daily'],
-                RESULTS_FORECAST_HOURLY: result_data['hourly'],
-            }
+        if result_data4 is not None:
+            current['pmForecast'] = result_data4['pm']['forcast']['hourly'][0]['pm10']
+
+        if offloaded or self._convert_units:
+            # 스레드에 있는 김에 (또는 단위 변환 전에 미터법으로) 켜진 기능 그룹의 파생 항목과 매시 체감지수를 미리 계산
+            current.materialize()
+            current[FIELD_HOURLY_COMFORT]
+        if self._convert_units:
+            # 응답은 항상 미터법이라 한 번에 야드파운드법으로 변환
+            to_imperial(current, result_data['hourly'], result_data['daily'])
+        return current
+
+    @contextmanager
+    def _stage(self, name: str):
+        """Time a post-processing stage running on the event loop."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._check_stage(name, time.perf_counter() - start)
+
+    def _check_stage(self, name: str, elapsed: float) -> None:
+        """Log a stage that blocked the event loop longer than the budget."""
+        if elapsed > self._stage_budget:
+            _LOGGER.warning(
+                "%s: %s took %.1f ms on the event loop (budget %.0f ms)",
+                self._location_name, name, elapsed * 1000, self._stage_budget * 1000)
+        else:
+            _LOGGER.debug("%s: %s took %.1f ms", self._location_name, name, elapsed * 1000)
 
-            self.data = result
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the entities, timing the derived fields they read."""
+        with self._stage('listeners'):
+            super().async_update_listeners()
 
-            return result
+    async def async_open_history(self) -> None:
+        """Open the forecast history, importing sqlite3 only when it is enabled."""
+        history = await self._hass.async_add_import_executor_job(
+            importlib.import_module, f"{__package__}.history")
+        self._history = history.ForecastHistory(
+            self._hass.config.path(STORAGE_DIR, f"{DOMAIN}_history_{self._api_key}.db"))
 
-        except ValueError as err:
-            _LOGGER.error("Check Weather API %s", err.args)
-            raise UpdateFailed(err)
-        except (asyncio.TimeoutError, aiohttp.ClientError) as err:
-            _LOGGER.error("Error fetching Weather data: %s", repr(err))
-            raise UpdateFailed(err)
-        # _LOGGER.debug(f'Weather data {self.data}')
+    async def _async_record_history(self, result_data: dict) -> dict[str, Any]:
+        """Append this fetch to the forecast history and return the accuracy scores."""
+        import sqlite3
 
-    def _range_desc(self, range1, value):
-        value = int(value)
-        desc = ['좋음','보통','나쁨','매우나쁨']
-        for i in range(len(range1)):
-            if value < range1[i]:
-                return desc[i]
-        return desc[3]
-
-    def _build_url(self, baseurl):
-        return baseurl.format(
-            apiKey=self._api_key,
-            lang=self._lang.split('-', 1)[0]
-        )
+        from .history import EMPTY_SCORES, SCORE_INTERVAL
+
+        now = int(time.time())
+        observed_at = parse_publish_time(result_data['current'].get(FIELD_VALIDTIMELOCAL))
+        try:
+            await self._hass.async_add_executor_job(
+                self._history.append, now, None if observed_at is None else int(observed_at.timestamp()),
+                result_data['current'], result_data['hourly'], result_data['daily'])
+            if self._history_scores is None or now - self._history_scored >= SCORE_INTERVAL:
+                self._history_scores = await self._hass.async_add_executor_job(self._history.scores)
+                self._history_scored = now
+        except sqlite3.Error as err:
+            _LOGGER.warning("Forecast history unavailable: %s", err)
+        return self._history_scores or EMPTY_SCORES
+
+    async def async_close_history(self) -> None:
+        """Close the forecast history."""
+        if self._history is not None:
+            await self._hass.async_add_executor_job(self._history.close)
+
+    @callback
+    def async_start_interpolation(self) -> CALLBACK_TYPE:
+        """Interpolate the current values between refreshes, return the unsubscribe."""
+        return async_track_time_interval(self._hass, self._async_interpolate, INTERPOLATE_INTERVAL)
+
+    @callback
+    def _async_interpolate(self, now: datetime) -> None:
+        """Move the current values along the hourly forecast, without requests."""
+        if self._interpolator is None or self.data is None:
+            return
+        if values := self._interpolator.values_at(now):
+            self.interpolated = values
+            self._bump_data_version()
+            self.async_update_listeners()
+
+    def _sun_fields(self, now: datetime, fallback: dict) -> dict[str, Any]:
+        """Return sunrise, sunset and day/night computed for the location."""
+        solar_day = self._solar.day(now)
+        return {
+            'sunrise': _format_clock(solar_day.sunrise) if solar_day.sunrise else fallback['sunrise'],
+            'sunset': _format_clock(solar_day.sunset) if solar_day.sunset else fallback['sunset'],
+            FIELD_DAYORNIGHT: 'D' if self._solar.is_day(now) else 'N',
+        }
+
+    @callback
+    def async_start_sun_tracking(self) -> CALLBACK_TYPE:
+        """Switch day and night exactly at sunrise and sunset, return the stop callback."""
+        self._sun_tracking = True
+        self._async_schedule_sun()
+
+        @callback
+        def _async_stop() -> None:
+            self._sun_tracking = False
+            if self._sun_unsub is not None:
+                self._sun_unsub()
+                self._sun_unsub = None
+
+        return _async_stop
+
+    @callback
+    def _async_schedule_sun(self) -> None:
+        # 위경도는 첫 갱신에서 알게 됨
+        if self._solar is None:
+            return
+        if (change := self._solar.next_change(dt_util.utcnow())) is not None:
+            self._sun_unsub = async_track_point_in_utc_time(self._hass, self._async_sun_changed, change)
+
+    @callback
+    def _async_sun_changed(self, now: datetime) -> None:
+        """Update day/night at sunrise or sunset, without requests."""
+        self._sun_unsub = None
+        if self.data is not None:
+            current = self.data[RESULTS_CURRENT]
+            current.update(self._sun_fields(now, current))
+            self._bump_data_version()
+            self.async_update_listeners()
+        self._async_schedule_sun()
+
+    def _build_url(self, baseurl, **kwargs):
+        return build_url(baseurl, self._api_key, self._lang, **kwargs)
+
+    async def _fetch_json(self, url: str):
+        """Fetch one endpoint, using a payload primed by the config flow once."""
+        if (primed := self._hass.data.get(DATA_PRIMED, {}).pop(url, None)) is not None:
+            primed_at, result = primed
+            if time.monotonic() - primed_at < MIN_TIME_BETWEEN_UPDATES.total_seconds():
+                _LOGGER.debug("Using payload primed by the config flow for %s", url)
+                self._check_errors(url, result)
+                return result
+
+        result = await async_fetch_json(self._hass, url, self._entry_id)
+        self._check_errors(url, result)
+        return result
 
     def _check_errors(self, url: str, response: dict):
         # _LOGGER.debug(f'Checking errors from {url} in {response}')
@@ -391,9 +640,30 @@ class WeatherUpdateCoordinator(DataUpdateCoordinator):
             'snowrain': '-'
         }
 
+    def get_hourly_forecast(self) -> list[dict]:
+        """Return the hourly rows with the comfort indexes computed."""
+        self.data[RESULTS_CURRENT][FIELD_HOURLY_COMFORT]
+        return self.data[RESULTS_FORECAST_HOURLY]
+
+    def get_forecast_at(self, kind: str, when: datetime, interpolate: bool = False) -> dict | None:
+        """Return the hourly or daily row valid at a time, or one interpolated between rows."""
+        index = self.data[RESULTS_CURRENT][FIELD_FORECAST_INDEX][kind]
+        if interpolate:
+            return index.interpolate(when.timestamp())
+        return index.row_at(when.timestamp())
+
+    def current_value(self, field: str) -> Any:
+        """Return a current field as shown by the entities, interpolated between refreshes."""
+        if field in self.interpolated:
+            return self.interpolated[field]
+        return self.data[RESULTS_CURRENT].get(field)
+
     def get_current(self, field):
         try:
-            ret = self.data[RESULTS_CURRENT][field]
+            if field in self.interpolated:
+                ret = self.interpolated[field]
+            else:
+                ret = self.data[RESULTS_CURRENT][field]
         except KeyError as err:
             _LOGGER.error("Current KeyError %s", repr(err))
             return None
@@ -403,9 +673,7 @@ class WeatherUpdateCoordinator(DataUpdateCoordinator):
         #     FIELD_VALIDTIMELOCAL,
         #     FIELD_WINDDIRECTIONCARDINAL,
         # ]:
-        if isinstance(ret, str) and bool(re.match(r'^[0-9][0-9.]*$', ret)):
-            ret = float(ret)
-        return ret
+        return _to_number(ret)
 
     def get_forecast(self, field, data):
         try:
@@ -414,9 +682,7 @@ class WeatherUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Forecast KeyError %s", repr(err))
             return None
             
-        if isinstance(ret, str) and bool(re.match(r'^[0-9][0-9.]*$', ret)):
-            ret = float(ret)
-        return ret
+        return _to_number(ret)
 
     @classmethod
     def _iconcode_to_condition(cls, icon_code):
@@ -444,11 +710,15 @@ class WeatherUpdateCoordinator(DataUpdateCoordinator):
     async def get_tran_file(self):
         tfiledir = f'{self._hass.config.config_dir}/custom_components/{DOMAIN}/weather_translations/'
         tfilename = self._lang.split('-', 1)[0]
+        # Shared by every coordinator of the same language
+        if tfilename in _TRANSLATIONS:
+            return _TRANSLATIONS[tfilename]
         try:
             tfiledata = await load_json_async(f'{tfiledir}{tfilename}.json')
         except Exception:  # pylint: disable=broad-except
             tfiledata = await load_json_async(f'{tfiledir}en.json')
             _LOGGER.warning(f'Sensor translation file {tfilename}.json does not exist. Defaulting to en-US.')
+        _TRANSLATIONS[tfilename] = tfiledata
         return tfiledata
 
     def tran_key(self, key):
@@ -457,6 +727,47 @@ class WeatherUpdateCoordinator(DataUpdateCoordinator):
             return self._tranfile[key]
         return key
 
+def _to_number(value):
+    """Convert unsigned numeric strings such as '12.5' to float."""
+    if isinstance(value, str) and value[:1].isdigit() and NUMERIC_CHARS.issuperset(value):
+        return float(value)
+    return value
+
+
+def _format_clock(when: datetime) -> str:
+    """Return a UTC time as local HH:MM, the format of the API."""
+    return dt_util.as_local(when).strftime('%H:%M')
+
+
+def build_url(baseurl: str, api_key: str, lang: str, **kwargs) -> str:
+    """Return an endpoint url for a location code and language."""
+    return baseurl.format(
+        apiKey=api_key,
+        lang=lang.split('-', 1)[0],
+        **kwargs
+    )
+
+
+async def async_fetch_json(hass: HomeAssistant, url: str, entry_id: str | None = None):
+    """Fetch one endpoint through the shared session, the entry's host rate limit and timeout."""
+    session = async_get_clientsession(hass)
+    await async_get_rate_limiter(hass).async_acquire(url, entry_id)
+    async with async_timeout.timeout(REQUEST_TIMEOUT):
+        response = await session.get(url, headers=HEADERS)
+        response.raise_for_status()
+        result = await response.json(content_type=None)
+
+    if result is None:
+        raise ValueError(f'NO RESULT {url}')
+    return result
+
+
+@callback
+def async_prime_payload(hass: HomeAssistant, url: str, payload) -> None:
+    """Keep a payload fetched by the config flow for the first refresh."""
+    hass.data.setdefault(DATA_PRIMED, {})[url] = (time.monotonic(), payload)
+
+
 async def load_json_async(filename):
     loop = asyncio.get_event_loop()
     contents = await loop.run_in_executor(None, lambda: open(filename, mode='r', encoding='utf-8').read())
@@ -466,44 +777,228 @@ class InvalidApiKey(HomeAssistantError):
     """Error to indicate there is an invalid api key."""
 
 def heatIndexCalc(temp,hum):
-    """https://github.com/gregnau/heat-index-calc/blob/master/heat-index-calc.py"""
-
-    temp = int(temp)
-    # ...then wait for the relative humidity in % value
-    hum = int(hum)
-    # Convert celius to fahrenheit (heat-index is only fahrenheit compatible)
-    fahrenheit = ((temp * 9/5) + 32)
-
-    # Creating multiples of 'fahrenheit' & 'hum' values for the coefficients
-    T2 = pow(fahrenheit, 2)
-    T3 = pow(fahrenheit, 3)
-    H2 = pow(hum, 2)
-    H3 = pow(hum, 3)
-
-    # Coefficients for the calculations
-    # C1 = [ -42.379, 2.04901523, 10.14333127, -0.22475541, -6.83783e-03, -5.481717e-02, 1.22874e-03, 8.5282e-04, -1.99e-06]
-    C2 = [ 0.363445176, 0.988622465, 4.777114035, -0.114037667, -0.000850208, -0.020716198, 0.000687678, 0.000274954, 0]
-    # C3 = [ 16.923, 0.185212, 5.37941, -0.100254, 0.00941695, 0.00728898, 0.000345372, -0.000814971, 0.0000102102, -0.000038646, 0.0000291583, 0.00000142721, 0.000000197483, -0.0000000218429, 0.000000000843296, -0.0000000000481975]
-
-    # Calculating heat-indexes with 3 different formula
-    # heatindex1 = C1[0] + (C1[1] * fahrenheit) + (C1[2] * hum) + (C1[3] * fahrenheit * hum) + (C1[4] * T2) + (C1[5] * H2) + (C1[6] * T2 * hum) + (C1[7] * fahrenheit * H2) + (C1[8] * T2 * H2)
-    heatindex2 = C2[0] + (C2[1] * fahrenheit) + (C2[2] * hum) + (C2[3] * fahrenheit * hum) + (C2[4] * T2) + (C2[5] * H2) + (C2[6] * T2 * hum) + (C2[7] * fahrenheit * H2) + (C2[8] * T2 * H2)
-    # heatindex3 = C3[0] + (C3[1] * fahrenheit) + (C3[2] * hum) + (C3[3] * fahrenheit * hum) + (C3[4] * T2) + (C3[5] * H2) + (C3[6] * T2 * hum) + (C3[7] * fahrenheit * H2) + (C3[8] * T2 * H2) + (C3[9] * T3) + (C3[10] * H3) + (C3[11] * T3 * hum) + (C3[12] * fahrenheit * H3) + (C3[13] * T3 * H2) + (C3[14] * T2 * H3) + (C3[15] * T3 * H3)
-
-    # 32 주의, 39 매우주의, 51 위험 , 매우위
-    # 통합대기 지수
-    heatindex = round(((heatindex2 - 32) * 5/9), 0)
-    if heatindex > 51:
-        heatgrade = '매우위험'
-    elif heatindex > 39:
-        heatgrade = '위험'
-    elif heatindex > 32:
-        heatgrade = '매우주의'
-    elif heatindex > 27:
-        heatgrade = '주의'
-    else:
-        heatgrade = '-'
+    """Return the heat index and its grade for a single observation."""
+    heatindex = comfort_series([temp], [hum], [None])[0][0]
     return {
         'heatindex': heatindex,
-        'heatgrade': heatgrade
+        'heatgrade': heat_grade(heatindex)
+    }
+
+
+@dataclass(frozen=True)
+class _Payloads:
+    """Responses of one refresh, the context of the derived fields."""
+
+    coordinator: WeatherUpdateCoordinator
+    main: dict
+    summary: list | None
+    air: dict | None
+    pm: dict | None
+
+    def rows(self) -> int:
+        """Return the number of forecast rows, the size of the post-processing."""
+        rows = len(self.main['hourly']) + len(self.main['daily'])
+        if self.pm is not None:
+            rows += len(self.pm['pm']['forcast']['hourly']) + len(self.pm['pm']['forcast']['daily'])
+        return rows
+
+
+@DERIVED.register(FIELD_HOURLY_COMFORT)
+def _derive_hourly_comfort(payloads: _Payloads, current: dict) -> dict:
+    """매시 예보 체감지수 (열지수, 체감온도, 불쾌지수)"""
+    hourly = payloads.main['hourly']
+    heatSeries, chillSeries, discomfortSeries = comfort_series(
+        [hour_data.get(FIELD_TEMP) for hour_data in hourly],
+        [hour_data.get(FIELD_HUMIDITY_HOURLY) for hour_data in hourly],
+        [hour_data.get(FIELD_WINDSPEED) for hour_data in hourly],
+    )
+    for hour_data, heat, chill, discomfort in zip(hourly, heatSeries, chillSeries, discomfortSeries):
+        hour_data.update({
+            FIELD_HEATINDEX: heat,
+            FIELD_WINDCHILL: chill,
+            FIELD_DISCOMFORT: discomfort,
+        })
+    return {FIELD_HOURLY_COMFORT: True}
+
+
+@DERIVED.register(FIELD_FORECAST_INDEX, deps=(FIELD_HOURLY_COMFORT,))
+def _derive_forecast_index(payloads: _Payloads, current: dict) -> dict:
+    """예보 시간 색인 (매시, 매일)"""
+    return {FIELD_FORECAST_INDEX: {
+        RESULTS_FORECAST_HOURLY: ForecastIndex(payloads.main['hourly']),
+        RESULTS_FORECAST_DAILY: ForecastIndex(payloads.main['daily']),
+    }}
+
+
+@DERIVED.register('heatindex', 'heatindexAttr')
+def _derive_heat_index(payloads: _Payloads, current: dict) -> dict:
+    """열지수"""
+    heatIndex = heatIndexCalc(current[FIELD_TEMP], current[FIELD_HUMIDITY])
+    return {'heatindex': heatIndex['heatindex'], 'heatindexAttr': heatIndex}
+
+
+@DERIVED.register(
+    'heatindexPeakToday', 'heatindexPeakTodayAttr', 'heatindexPeakTomorrow', 'heatindexPeakTomorrowAttr',
+    deps=(FIELD_HOURLY_COMFORT,), group=GROUP_FORECAST)
+def _derive_heat_index_peak(payloads: _Payloads, current: dict) -> dict:
+    """오늘, 내일 최고 열지수"""
+    hourly = payloads.main['hourly']
+    heatIndexPeakTodayAttr = peak_heat_index(hourly, payloads.main['daily'][0]['day'])
+    heatIndexPeakTomorrowAttr = peak_heat_index(hourly, payloads.main['daily'][1]['day'])
+    return {
+        'heatindexPeakToday': heatIndexPeakTodayAttr['heatindex'],
+        'heatindexPeakTodayAttr': heatIndexPeakTodayAttr,
+        'heatindexPeakTomorrow': heatIndexPeakTomorrowAttr['heatindex'],
+        'heatindexPeakTomorrowAttr': heatIndexPeakTomorrowAttr,
+    }
+
+
+def _register_precip_window(key: str, hours: int | str | None) -> None:
+    @DERIVED.register(key, f'{key}Attr', group=GROUP_FORECAST)
+    def _derive_precip_hour(payloads: _Payloads, current: dict) -> dict:
+        """비시작시간"""
+        hourly = payloads.main['hourly']
+        remainhour = 24 - int(hourly[0]['hour'])
+        day = payloads.main['daily'][0]['day']
+        if hours is None:
+            attr = payloads.coordinator._get_precip_hour(hourly, remainhour) # 오늘
+        elif hours == 'tomorrow':
+            attr = payloads.coordinator._get_precip_hour(hourly, remainhour+24, day) # 내일까지
+        else:
+            attr = payloads.coordinator._get_precip_hour(hourly, hours, day)
+        return {key: attr['cmt'], f'{key}Attr': attr}
+
+
+for _key, _hours in PRECIP_WINDOWS.items():
+    _register_precip_window(_key, _hours)
+
+
+def _trend(payloads: _Payloads, delta: float, steady: float) -> str:
+    if abs(delta) < steady:
+        return payloads.coordinator.tran_key('steady')
+    return payloads.coordinator.tran_key('rising' if delta > 0 else 'falling')
+
+
+@DERIVED.register('pressureTendency', 'pressureTendencyTrend', 'pressureTendencyAttr')
+def _derive_pressure_tendency(payloads: _Payloads, current: dict) -> dict:
+    """기압 3시간 변화"""
+    if (change := payloads.coordinator._observations.change(FIELD_PRESSURE, PRESSURE_TENDENCY_WINDOW)) is None:
+        return {'pressureTendency': None, 'pressureTendencyTrend': None, 'pressureTendencyAttr': {}}
+    delta, elapsed = change
+    # 3시간 보다 긴 간격은 3시간 변화로 환산
+    delta = delta * PRESSURE_TENDENCY_WINDOW / elapsed
+    trend = _trend(payloads, delta, PRESSURE_STEADY)
+    return {
+        'pressureTendency': round(delta, 1),
+        'pressureTendencyTrend': trend,
+        'pressureTendencyAttr': {'trend': trend, 'hours': round(elapsed / 3600, 1)},
+    }
+
+
+@DERIVED.register('tempRate', 'tempRateAttr')
+def _derive_temp_rate(payloads: _Payloads, current: dict) -> dict:
+    """기온 시간당 변화"""
+    if (change := payloads.coordinator._observations.change(FIELD_TEMP, TEMP_RATE_WINDOW)) is None:
+        return {'tempRate': None, 'tempRateAttr': {}}
+    delta, elapsed = change
+    return {
+        'tempRate': round(delta * 3600 / elapsed, 1),
+        'tempRateAttr': {'change': round(delta, 1), 'hours': round(elapsed / 3600, 1)},
+    }
+
+
+@DERIVED.register('pm10Trend', 'pm10TrendAttr')
+def _derive_pm_trend(payloads: _Payloads, current: dict) -> dict:
+    """미세먼지 3시간 추세"""
+    observations = payloads.coordinator._observations
+    if (change := observations.change('pm10', PM_TREND_WINDOW)) is None:
+        return {'pm10Trend': None, 'pm10TrendAttr': {}}
+    delta, elapsed = change
+    pm25 = observations.change('pm25', PM_TREND_WINDOW)
+    return {
+        'pm10Trend': _trend(payloads, delta, PM_STEADY),
+        'pm10TrendAttr': {
+            'pm10_change': round(delta),
+            'pm25_change': round(pm25[0]) if pm25 else None,
+            'pm25_trend': _trend(payloads, pm25[0], PM_STEADY) if pm25 else None,
+            'hours': round(elapsed / 3600, 1),
+        },
+    }
+
+
+@DERIVED.register('pmForecastDaily', 'pmForecastHourly', group=GROUP_PM_FORECAST)
+def _derive_pm_forecast(payloads: _Payloads, current: dict) -> dict:
+    """미세먼지예보, 항목별로 전체 예보를 한 번에 등급 계산"""
+    grading = payloads.coordinator._grading
+    daily = payloads.pm['pm']['forcast']['daily']
+    hourly = payloads.pm['pm']['forcast']['hourly']
+    dailyGrades = {key: grading[key].grade_series([pm[key] for pm in daily]) for key in ('pm10', 'pm25', 'aqi')}
+    hourlyGrades = {key: grading[key].grade_series([pm[key] for pm in hourly]) for key in ('pm10', 'pm25')}
+
+    pmForecastDaily = []
+    pmForecastHourly = []
+    for idx, pm in enumerate(daily):
+        new_pm = {
+            "date": f'{pm["year"]}-{pm["mon"]:02d}-{pm["day"]:02d} 00:00:00',
+            "pm10": pm["pm10"],
+            "pm25": pm["pm25"],
+            "aqi": pm["aqi"],
+            "o3": pm["o3"],
+        }
+        for key, (grades, descs) in dailyGrades.items():
+            new_pm[f"{key}Desc"] = descs[idx]
+            new_pm[f"{key}Grade"] = grades[idx]
+        pmForecastDaily.append(new_pm)
+
+    for idx, pm in enumerate(hourly):
+        new_pm = {
+            "date": f'{pm["year"]}-{pm["mon"]:02d}-{pm["day"]:02d} {pm["hour"]:02d}:00:00',
+            "pm10": pm["pm10"],
+            "pm25": pm["pm25"]
+        }
+        for key, (grades, descs) in hourlyGrades.items():
+            new_pm[f"{key}Desc"] = descs[idx]
+            new_pm[f"{key}Grade"] = grades[idx]
+        pmForecastHourly.append(new_pm)
+    return {'pmForecastDaily': pmForecastDaily, 'pmForecastHourly': pmForecastHourly}
+
+
+@DERIVED.register('weatherBriping', 'weatherBripingAttr', deps=('precipHour12Attr',), group=GROUP_BRIEFING)
+def _derive_briefing(payloads: _Payloads, current: dict) -> dict:
+    """날씨보고, 꺼진 기능 그룹의 항목은 빠짐"""
+    result_data = payloads.main
+    result_data2 = payloads.summary
+    result_data3 = payloads.air
+    precipHour12Attr = current['precipHour12Attr']
+    hour = int(result_data['hourly'][0]['hour'])
+    mon = int(result_data['hourly'][0]['mon'])
+    weather_briefing = {}
+    if result_data2 is not None:
+        weather_briefing['현재 날씨'] = f"현재 날씨 {result_data2[0]['cur_cmt']}"
+    weather_briefing['온도'] = f"온도 {current[FIELD_TEMP]}°C"
+    weather_briefing['어제와 온도차'] = current.get('tempdiffCmt')
+    weather_briefing['최저 온도'] = f"최저 {current[FIELD_TEMPERATUREMIN]}°C"
+    weather_briefing['최고 온도'] = f"최고 {current[FIELD_TEMPERATUREMAX]}°C"
+    weather_briefing['습도'] = f"습도 {current[FIELD_HUMIDITY]}%"
+    weather_briefing['강수확률'] = f"강수확률 {precipHour12Attr['max_pop']}%"
+    weather_briefing['강수예상'] = f"{precipHour12Attr['cmt']}, {precipHour12Attr['cmt2']} 예상"
+    if result_data2 is not None:
+        weather_briefing['미세먼지'] = f"미세먼지 {result_data2[0]['air']['pm10']['description']}"
+        weather_briefing['초미세먼지'] = f"초미세먼지 {result_data2[0]['air']['pm25']['description']}"
+    if result_data3 is not None:
+        weather_briefing['통합대기'] = f"통합대기 {result_data3['aq']['khaiDesc']}"
+
+    weather_briefing_cmt = dict(weather_briefing)
+    if mon not in [11,12,1,2] or hour > 10:
+        del weather_briefing_cmt['최저 온도']
+    if hour > 14:
+        del weather_briefing_cmt['최고 온도']
+    if precipHour12Attr['cmt'] == '안옴':
+        del weather_briefing_cmt['강수확률']
+        del weather_briefing_cmt['강수예상']
+
+    weather_briefing_str = [str(value) for value in weather_briefing_cmt.values() if value]
+    return {
+        'weatherBriping': ", ".join(weather_briefing_str) + "입니다.",
+        'weatherBripingAttr': weather_briefing,
     }
@@ -0,0 +1,100 @@
+"""Lazily computed derived fields of the current data.
+
+Derived fields are registered as producers with the keys they return, the
+fields they depend on and their feature group. ``LazyCurrent`` runs a
+producer the first time one of its keys is read and keeps the result for
+the rest of the data generation (until the next refresh), so fields that no
+enabled entity, attribute, rule or forecast reads are never computed.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import time
+from typing import Any, Callable
+
+
+@dataclass(frozen=True)
+class Producer:
+    """Computes one or more derived fields."""
+
+    keys: tuple[str, ...]
+    deps: tuple[str, ...]
+    group: str | None
+    fn: Callable[..., dict[str, Any]]
+
+
+class DerivedRegistry:
+    """Producers by field key."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._producers: dict[str, Producer] = {}
+
+    def register(self, *keys: str, deps: tuple[str, ...] = (), group: str | None = None):
+        """Register a producer ``fn(context, current) -> {key: value}``."""
+        def decorator(fn):
+            producer = Producer(keys, deps, group, fn)
+            for key in keys:
+                self._producers[key] = producer
+            return fn
+        return decorator
+
+    def get(self, key: str) -> Producer | None:
+        """Return the producer of a key."""
+        return self._producers.get(key)
+
+    def keys(self, groups) -> frozenset[str]:
+        """Return the public keys (no leading underscore) of the given groups."""
+        return frozenset(
+            key for key, producer in self._producers.items()
+            if not key.startswith('_') and (producer.group is None or producer.group in groups)
+        )
+
+
+class LazyCurrent(dict):
+    """Current data computing registered derived fields on first read.
+
+    Only ``keys`` (the fields of enabled groups) show up in ``in`` and
+    ``get``; any registered field can still be read by index, so producers
+    may depend on fields of disabled groups. ``materialize`` computes every
+    exposed field for full dumps. ``on_compute(key, seconds)`` is called
+    after each producer run with its first key and duration.
+    """
+
+    def __init__(
+            self, data: dict, registry: DerivedRegistry, keys: frozenset[str], context: Any,
+            on_compute: Callable[[str, float], None] | None = None
+    ) -> None:
+        """Initialize."""
+        super().__init__(data)
+        self._registry = registry
+        self._keys = keys
+        self._context = context
+        self.on_compute = on_compute
+
+    def __missing__(self, key: str) -> Any:
+        producer = self._registry.get(key)
+        if producer is None:
+            raise KeyError(key)
+        for dep in producer.deps:
+            self[dep]
+        start = time.perf_counter()
+        self.update(producer.fn(self._context, self))
+        if self.on_compute is not None:
+            self.on_compute(producer.keys[0], time.perf_counter() - start)
+        return dict.__getitem__(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return dict.__contains__(self, key) or key in self._keys
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if dict.__contains__(self, key) or key in self._keys:
+            return self[key]
+        return default
+
+    def materialize(self) -> LazyCurrent:
+        """Compute every exposed derived field."""
+        for key in self._keys:
+            if not dict.__contains__(self, key):
+                self[key]
+        return self
@@ -0,0 +1,101 @@
+"""Fleet mode: one config entry polling many location codes."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .coordinator import WeatherUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_location_codes(value: str) -> list[str]:
+    """Split a comma, space or newline separated list of location codes."""
+    codes = []
+    for code in value.replace(',', ' ').split():
+        if code not in codes:
+            codes.append(code)
+    return codes
+
+
+class FleetScheduler:
+    """Refresh many location coordinators from a single timer.
+
+    The update interval is divided into one slot per location and every tick
+    refreshes the next location in turn, so upstream requests are spread
+    evenly instead of all starting at the same moment. A semaphore bounds how
+    many refreshes may be in flight when the upstream is slow.
+    """
+
+    def __init__(
+            self,
+            hass: HomeAssistant,
+            coordinators: dict[str, WeatherUpdateCoordinator],
+            update_interval: timedelta,
+            concurrency: int,
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self.coordinators = coordinators
+        self._order = list(coordinators.values())
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._slot = update_interval / max(len(self._order), 1)
+        self._next = 0
+        self._in_flight: set[WeatherUpdateCoordinator] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self._unsub = None
+
+    @property
+    def slot(self) -> timedelta:
+        """Return the delay between two location refreshes."""
+        return self._slot
+
+    @callback
+    def async_start(self) -> None:
+        """Start the initial pass and the round-robin timer."""
+        self._spawn(self._async_refresh_all(), "weathernews fleet initial refresh")
+        self._unsub = async_track_time_interval(self._hass, self._async_tick, self._slot)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop the timer and cancel in-flight refreshes."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+
+    @callback
+    def _spawn(self, target, name: str) -> None:
+        task = self._hass.async_create_background_task(target, name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _async_refresh_all(self) -> None:
+        await asyncio.gather(*(self._async_refresh(coordinator) for coordinator in self._order))
+
+    @callback
+    def _async_tick(self, now: datetime) -> None:
+        if not self._order:
+            return
+        coordinator = self._order[self._next]
+        self._next = (self._next + 1) % len(self._order)
+        if coordinator in self._in_flight:
+            _LOGGER.debug("Skipping fleet refresh of %s, previous refresh still running",
+                          coordinator.location_name)
+            return
+        self._spawn(self._async_refresh(coordinator), f"weathernews fleet refresh {coordinator.api_key}")
+
+    async def _async_refresh(self, coordinator: WeatherUpdateCoordinator) -> None:
+        self._in_flight.add(coordinator)
+        try:
+            async with self._semaphore:
+                await coordinator.async_refresh()
+        finally:
+            self._in_flight.discard(coordinator)
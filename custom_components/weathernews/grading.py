@@ -0,0 +1,74 @@
+"""Air quality grades by standard, looked up by bisection.
+
+Each scale lists the exclusive upper bound of every grade but the last, so
+``bisect_right`` over the bounds returns the grade index directly. Grading a
+whole series returns the indexes and the labels in one pass.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from .const import AQ_STANDARD_KOREA, AQ_STANDARD_US, AQ_STANDARD_WHO
+
+KOREA_LABELS = ('좋음', '보통', '나쁨', '매우나쁨')
+# WHO 2021 대기질 가이드라인(AQG)과 잠정목표(IT), 24시간 평균
+WHO_LABELS = ('AQG 충족', '잠정목표4', '잠정목표3', '잠정목표2', '잠정목표1', '잠정목표1 초과')
+# 미국 EPA AQI 등급
+US_LABELS = ('좋음', '보통', '민감군 나쁨', '나쁨', '매우나쁨', '위험')
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Grade labels and the upper bounds between them."""
+
+    bounds: tuple[float, ...]
+    labels: tuple[str, ...]
+
+    def index(self, value: Any) -> int | None:
+        """Return the grade index of a value, None when it is not a number."""
+        try:
+            return bisect_right(self.bounds, float(value))
+        except (TypeError, ValueError):
+            return None
+
+    def grade(self, value: Any) -> str | None:
+        """Return the grade label of a value."""
+        index = self.index(value)
+        return None if index is None else self.labels[index]
+
+    def grade_series(self, values: Iterable[Any]) -> tuple[list[int | None], list[str | None]]:
+        """Return the grade indexes and labels of a series."""
+        indexes = [self.index(value) for value in values]
+        return indexes, [None if index is None else self.labels[index] for index in indexes]
+
+
+# The composite index of the payload is the Korean KHAI, graded on its own
+# scale under every standard; the standards differ in the PM breakpoints
+KHAI_SCALE = Scale((50, 100, 250), KOREA_LABELS)
+
+# standard -> pollutant -> scale
+STANDARDS: dict[str, dict[str, Scale]] = {
+    AQ_STANDARD_KOREA: {
+        'pm10': Scale((30, 80, 150), KOREA_LABELS),
+        'pm25': Scale((15, 35, 75), KOREA_LABELS),
+        'aqi': KHAI_SCALE,
+    },
+    AQ_STANDARD_WHO: {
+        'pm10': Scale((45, 50, 75, 100, 150), WHO_LABELS),
+        'pm25': Scale((15, 25, 37.5, 50, 75), WHO_LABELS),
+        'aqi': KHAI_SCALE,
+    },
+    AQ_STANDARD_US: {
+        # 24시간 농도 구간 (PM2.5는 2024년 개정 기준)
+        'pm10': Scale((55, 155, 255, 355, 425), US_LABELS),
+        'pm25': Scale((9.1, 35.5, 55.5, 125.5, 225.5), US_LABELS),
+        'aqi': KHAI_SCALE,
+    },
+}
+
+
+def get_standard(name: str) -> dict[str, Scale]:
+    """Return the scales of a standard, Korean by default."""
+    return STANDARDS.get(name, STANDARDS[AQ_STANDARD_KOREA])
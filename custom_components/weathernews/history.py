@@ -0,0 +1,245 @@
+"""Local forecast history and forecast-vs-observed accuracy scores.
+
+Every refresh appends the hourly and daily forecast keyed by ``(valid, issued)``,
+``issued`` being the fetch time, to a small SQLite file, so every forecast
+ever made for an hour or a day is kept. Observations are keyed by the hour
+of their own timestamp. Rows older than ``RETENTION`` are purged once a day.
+Hourly forecasts are scored against the hourly observations, daily highs
+and lows against the extremes of the observed hours of that day. All
+methods block, run them in an executor.
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+from typing import Any
+
+from .const import (
+    FIELD_PRECIPCHANCE,
+    FIELD_PRECIPITATION,
+    FIELD_TEMP,
+    FIELD_TEMPERATUREMAX,
+    FIELD_TEMPERATUREMIN,
+    FIELD_VALIDTIMEUTC,
+)
+
+# Seconds of history kept
+RETENTION = 30 * 86400
+PURGE_INTERVAL = 86400
+# Seconds between two score computations
+SCORE_INTERVAL = 3600
+# Observations further than this from the full hour are not stored
+OBSERVATION_TOLERANCE = 15 * 60
+# A rain start counts as hit when rain was forecast within this window
+RAIN_START_WINDOW = 3600
+# Observed hours needed before a day's high and low are scored
+DAILY_MIN_OBSERVATIONS = 18
+# Lead time buckets in hours and in days, inclusive
+LEAD_BUCKETS = ((0, 6), (7, 12), (13, 24), (25, 48))
+DAILY_LEAD_BUCKETS = ((0, 1), (2, 3), (4, 9))
+
+# Bumped when the tables change, older tables are dropped
+SCHEMA_VERSION = 2
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS hourly (valid INTEGER, issued INTEGER, lead INTEGER, temp REAL, pop INTEGER, "
+    "prec REAL, PRIMARY KEY (valid, issued)) WITHOUT ROWID",
+    "CREATE TABLE IF NOT EXISTS daily (valid INTEGER, issued INTEGER, lead INTEGER, tmax REAL, tmin REAL, "
+    "pop INTEGER, PRIMARY KEY (valid, issued)) WITHOUT ROWID",
+    "CREATE TABLE IF NOT EXISTS observed (time INTEGER PRIMARY KEY, observed INTEGER, temp REAL, prec REAL) "
+    "WITHOUT ROWID",
+)
+# Observed high and low of every forecast day with enough observed hours
+DAILY_OBSERVED = (
+    "WITH days AS (SELECT DISTINCT valid FROM daily), "
+    "obs AS (SELECT days.valid AS valid, MAX(o.temp) AS tmax, MIN(o.temp) AS tmin FROM days "
+    "JOIN observed o ON o.time >= days.valid AND o.time < days.valid + 86400 "
+    "WHERE o.temp IS NOT NULL GROUP BY days.valid HAVING COUNT(*) >= ?) "
+)
+
+EMPTY_SCORES = {
+    'forecastTempMae': None,
+    'forecastTempMaeAttr': {},
+    'forecastPopBrier': None,
+    'forecastPopBrierAttr': {},
+    'forecastRainHitRate': None,
+    'forecastRainHitRateAttr': {},
+    'forecastTmaxMae': None,
+    'forecastTmaxMaeAttr': {},
+    'forecastTminMae': None,
+    'forecastTminMaeAttr': {},
+}
+
+
+def _to_float(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _bucket(lead: int, buckets: tuple, unit: str) -> str | None:
+    for low, high in buckets:
+        if low <= lead <= high:
+            return f'{low}-{high}{unit}'
+    return None
+
+
+def _by_bucket(rows, buckets: tuple = LEAD_BUCKETS, unit: str = 'h') -> tuple[float | None, dict[str, float], int]:
+    """Merge ``(lead, mean, count)`` rows into lead buckets and an overall mean."""
+    sums: dict[str, list[float]] = {}
+    for lead, mean, count in rows:
+        if (bucket := _bucket(lead, buckets, unit)) is None or mean is None:
+            continue
+        total = sums.setdefault(bucket, [0.0, 0])
+        total[0] += mean * count
+        total[1] += count
+    buckets = {bucket: round(total / count, 2) for bucket, (total, count) in sums.items()}
+    samples = sum(count for _, count in sums.values())
+    overall = round(sum(total for total, _ in sums.values()) / samples, 2) if samples else None
+    return overall, buckets, samples
+
+
+class ForecastHistory:
+    """Append-only forecast store with accuracy scoring."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize."""
+        self._path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._purged = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            # auto_vacuum only applies to a new file, before any table exists
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            with conn:
+                if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                    # tables of older versions kept one forecast per lead only
+                    for table in ("hourly", "daily", "observed"):
+                        conn.execute(f"DROP TABLE IF EXISTS {table}")
+                    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                for statement in SCHEMA:
+                    conn.execute(statement)
+            self._conn = conn
+        return self._conn
+
+    def append(
+            self, issued: int, observed: int | None, current: dict, hourly: list[dict], daily: list[dict]
+    ) -> None:
+        """Store one fetch.
+
+        ``issued`` is the fetch time and ``observed`` the time of the current
+        observation in epoch seconds, None when unknown.
+        """
+        hourly_rows = []
+        for row in hourly:
+            valid = int(row[FIELD_VALIDTIMEUTC])
+            if (lead := round((valid - issued) / 3600)) < 0:
+                continue
+            hourly_rows.append((valid, issued, lead, _to_float(row.get(FIELD_TEMP)),
+                                _to_float(row.get(FIELD_PRECIPCHANCE)), _to_float(row.get(FIELD_PRECIPITATION))))
+        daily_rows = []
+        for row in daily:
+            valid = int(row[FIELD_VALIDTIMEUTC])
+            # whole days ahead, rounded up: the day still running is lead 0
+            if (lead := -((issued - valid) // 86400)) < 0:
+                continue
+            daily_rows.append((valid, issued, lead, _to_float(row.get(FIELD_TEMPERATUREMAX)),
+                               _to_float(row.get(FIELD_TEMPERATUREMIN)), _to_float(row.get(FIELD_PRECIPCHANCE))))
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany("INSERT INTO hourly VALUES (?, ?, ?, ?, ?, ?)", hourly_rows)
+                conn.executemany("INSERT INTO daily VALUES (?, ?, ?, ?, ?, ?)", daily_rows)
+                if observed is not None:
+                    hour = round(observed / 3600) * 3600
+                    if abs(observed - hour) <= OBSERVATION_TOLERANCE:
+                        # the same observation is returned until the next one, keep the first
+                        conn.execute("INSERT OR IGNORE INTO observed VALUES (?, ?, ?, ?)", (
+                            hour, observed, _to_float(current.get(FIELD_TEMP)),
+                            _to_float(current.get(FIELD_PRECIPITATION))))
+            if issued - self._purged >= PURGE_INTERVAL:
+                self._purge(conn, issued - RETENTION)
+                self._purged = issued
+
+    @staticmethod
+    def _purge(conn: sqlite3.Connection, before: int) -> None:
+        with conn:
+            conn.execute("DELETE FROM hourly WHERE valid < ?", (before,))
+            conn.execute("DELETE FROM daily WHERE valid < ?", (before,))
+            conn.execute("DELETE FROM observed WHERE time < ?", (before,))
+        # give the freed pages back to the file system
+        conn.execute("PRAGMA incremental_vacuum")
+
+    def scores(self) -> dict[str, Any]:
+        """Return the forecast accuracy per lead time bucket."""
+        with self._lock:
+            conn = self._connect()
+            temp_rows = conn.execute(
+                "SELECT h.lead, AVG(ABS(h.temp - o.temp)), COUNT(*) FROM hourly h "
+                "JOIN observed o ON o.time = h.valid "
+                "WHERE h.temp IS NOT NULL AND o.temp IS NOT NULL GROUP BY h.lead").fetchall()
+            brier_rows = conn.execute(
+                "SELECT h.lead, AVG((h.pop / 100.0 - (o.prec > 0)) * (h.pop / 100.0 - (o.prec > 0))), COUNT(*) "
+                "FROM hourly h JOIN observed o ON o.time = h.valid "
+                "WHERE h.pop IS NOT NULL AND o.prec IS NOT NULL GROUP BY h.lead").fetchall()
+            calibration_rows = conn.execute(
+                "SELECT CAST(h.pop / 10 AS INTEGER) * 10, AVG(o.prec > 0), COUNT(*) FROM hourly h "
+                "JOIN observed o ON o.time = h.valid "
+                "WHERE h.pop IS NOT NULL AND o.prec IS NOT NULL GROUP BY 1").fetchall()
+            # hours with rain after a dry hour
+            starts = [row[0] for row in conn.execute(
+                "SELECT o.time FROM observed o JOIN observed p ON p.time = o.time - 3600 "
+                "WHERE o.prec > 0 AND p.prec = 0")]
+            hit_rows = []
+            for start in starts:
+                # one sample per fetch made before the start, at the lead of the start
+                hit_rows += conn.execute(
+                    "SELECT (? - issued + 1800) / 3600, MAX(prec > 0), 1 FROM hourly "
+                    "WHERE valid BETWEEN ? AND ? AND issued < ? AND prec IS NOT NULL GROUP BY issued",
+                    (start, start - RAIN_START_WINDOW, start + RAIN_START_WINDOW, start)).fetchall()
+            daily_rows = {
+                field: conn.execute(
+                    DAILY_OBSERVED + f"SELECT d.lead, AVG(ABS(d.{field} - obs.{field})), COUNT(*) FROM daily d "
+                    f"JOIN obs ON obs.valid = d.valid WHERE d.{field} IS NOT NULL GROUP BY d.lead",
+                    (DAILY_MIN_OBSERVATIONS,)).fetchall()
+                for field in ('tmax', 'tmin')
+            }
+
+        temp_mae, temp_buckets, temp_samples = _by_bucket(temp_rows)
+        brier, brier_buckets, brier_samples = _by_bucket(brier_rows)
+        hit_rate, hit_buckets, _ = _by_bucket(hit_rows)
+        daily_scores = {}
+        for field, key in (('tmax', 'forecastTmaxMae'), ('tmin', 'forecastTminMae')):
+            mae, buckets, samples = _by_bucket(daily_rows[field], DAILY_LEAD_BUCKETS, 'd')
+            daily_scores[key] = mae
+            daily_scores[f'{key}Attr'] = {**buckets, 'samples': samples}
+        return {
+            'forecastTempMae': temp_mae,
+            'forecastTempMaeAttr': {**temp_buckets, 'samples': temp_samples},
+            'forecastPopBrier': brier,
+            'forecastPopBrierAttr': {
+                **brier_buckets,
+                'samples': brier_samples,
+                # observed rain frequency per forecast pop
+                'calibration': {f'{pop}%': round(freq * 100) for pop, freq, _ in calibration_rows},
+            },
+            'forecastRainHitRate': None if hit_rate is None else round(hit_rate * 100),
+            'forecastRainHitRateAttr': {
+                **{bucket: round(rate * 100) for bucket, rate in hit_buckets.items()},
+                'rain_starts': len(starts),
+            },
+            **daily_scores,
+        }
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,91 @@
+"""Interpolation of current values from the hourly forecast between fetches."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from typing import Any
+
+from .const import (
+    FIELD_FEELS_LIKE,
+    FIELD_HUMIDITY,
+    FIELD_HUMIDITY_HOURLY,
+    FIELD_TEMP,
+    FIELD_VALIDTIMEUTC,
+    FIELD_WINDSPEED,
+)
+
+# current field -> (hourly field, decimals)
+INTERPOLATED_FIELDS = {
+    FIELD_TEMP: (FIELD_TEMP, 1),
+    FIELD_FEELS_LIKE: (FIELD_FEELS_LIKE, 1),
+    FIELD_HUMIDITY: (FIELD_HUMIDITY_HOURLY, 0),
+    FIELD_WINDSPEED: (FIELD_WINDSPEED, 1),
+}
+
+# The observation bias fades out linearly over this period
+ANCHOR_DECAY = timedelta(hours=3)
+
+
+def _to_float(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class CurrentInterpolator:
+    """Interpolate current values from the hourly forecast.
+
+    The forecast curve is shifted by the difference between the last
+    observation and the forecast at the observation time; that bias fades
+    out over ``ANCHOR_DECAY`` so the values rejoin the forecast.
+    """
+
+    def __init__(self, hourly: list[dict], observed: dict, observed_at: datetime) -> None:
+        """Initialize."""
+        rows = sorted(
+            (int(row[FIELD_VALIDTIMEUTC]), row) for row in hourly
+            if row.get(FIELD_VALIDTIMEUTC) is not None
+        )
+        self._times = [timestamp for timestamp, _ in rows]
+        self._columns = {
+            field: [_to_float(row.get(hourly_field)) for _, row in rows]
+            for field, (hourly_field, _) in INTERPOLATED_FIELDS.items()
+        }
+        self._observed_at = observed_at
+        self._bias = {}
+        for field in INTERPOLATED_FIELDS:
+            value = _to_float(observed.get(field))
+            forecast = self._forecast_at(field, observed_at.timestamp())
+            if value is not None and forecast is not None:
+                self._bias[field] = value - forecast
+
+    def _forecast_at(self, field: str, timestamp: float) -> float | None:
+        times = self._times
+        column = self._columns[field]
+        if not times:
+            return None
+        idx = bisect_right(times, timestamp)
+        if idx == 0:
+            return column[0]
+        if idx == len(times):
+            return column[-1]
+        before, after = column[idx - 1], column[idx]
+        if before is None or after is None:
+            return before if after is None else after
+        ratio = (timestamp - times[idx - 1]) / (times[idx] - times[idx - 1])
+        return before + (after - before) * ratio
+
+    def values_at(self, when: datetime) -> dict[str, float]:
+        """Return the interpolated current values at the given time."""
+        elapsed = (when - self._observed_at) / ANCHOR_DECAY
+        weight = max(0.0, 1.0 - elapsed)
+        values = {}
+        for field, (_, decimals) in INTERPOLATED_FIELDS.items():
+            forecast = self._forecast_at(field, when.timestamp())
+            if forecast is None or field not in self._bias:
+                continue
+            value = round(forecast + self._bias[field] * weight, decimals)
+            values[field] = int(value) if decimals == 0 else value
+        return values
@@ -0,0 +1,219 @@
+"""Export of hourly observations and forecasts to the recorder long-term statistics.
+
+Every new observation adds a sample to the hour of its own ``TimeLocal``;
+interpolated values, sunrise/sunset pushes and repeated fetches of the same
+observation are not sampled. Every fetch also records the latest hourly
+forecast for each coming hour. Once an hour is complete its mean, min and
+max (precipitation: hourly amount and running sum) and the last forecast made
+for it are written with one ``async_add_external_statistics`` call per
+statistic. Each hour is written once, hours already in the recorder are
+skipped after a restart.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import CONCENTRATION_MICROGRAMS_PER_CUBIC_METER
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+from homeassistant.util.unit_conversion import DistanceConverter, TemperatureConverter
+
+from .const import (
+    DOMAIN,
+    FIELD_PRECIPITATION,
+    FIELD_TEMP,
+    FIELD_VALIDTIMELOCAL,
+    FIELD_VALIDTIMEUTC,
+    LENGTHUNIT,
+    RESULTS_CURRENT,
+    RESULTS_FORECAST_HOURLY,
+    TEMPUNIT,
+)
+from .schedule import parse_publish_time
+
+try:
+    # mean_type replaces has_mean in newer recorders
+    from homeassistant.components.recorder.models import StatisticMeanType
+except ImportError:
+    StatisticMeanType = None
+
+_LOGGER = logging.getLogger(__name__)
+
+# current field -> (statistic suffix, name, has_sum)
+EXPORTED_FIELDS = {
+    FIELD_TEMP: ('temperature', 'Temperature', False),
+    FIELD_PRECIPITATION: ('precipitation', 'Precipitation', True),
+    'pm10': ('pm10', 'PM10', False),
+    'pm25': ('pm25', 'PM2.5', False),
+    'khai': ('khai', 'KHAI', False),
+}
+# hourly forecast field -> (statistic suffix, name, has_sum)
+FORECAST_FIELDS = {
+    FIELD_TEMP: ('forecast_temperature', 'Forecast Temperature', False),
+    FIELD_PRECIPITATION: ('forecast_precipitation', 'Forecast Precipitation', True),
+}
+# statistic suffix -> unit class of the unit converters
+UNIT_CLASSES = {
+    'temperature': TemperatureConverter.UNIT_CLASS,
+    'precipitation': DistanceConverter.UNIT_CLASS,
+    'forecast_temperature': TemperatureConverter.UNIT_CLASS,
+    'forecast_precipitation': DistanceConverter.UNIT_CLASS,
+}
+
+
+def _to_float(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class StatisticsExporter:
+    """Collect hourly samples of one coordinator and export them."""
+
+    def __init__(self, hass: HomeAssistant, coordinator) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._coordinator = coordinator
+        units = {
+            FIELD_TEMP: coordinator.units_of_measurement[TEMPUNIT],
+            FIELD_PRECIPITATION: coordinator.units_of_measurement[LENGTHUNIT],
+            'pm10': CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+            'pm25': CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+            'khai': None,
+        }
+        # statistic suffix -> metadata
+        self._metadata: dict[str, StatisticMetaData] = {}
+        for fields in (EXPORTED_FIELDS, FORECAST_FIELDS):
+            for field, (suffix, name, has_sum) in fields.items():
+                self._metadata[suffix] = _metadata(
+                    f"{coordinator.location_name} {name}",
+                    f"{DOMAIN}:{coordinator.api_key}_{suffix}".lower(),
+                    units[field], has_sum, UNIT_CLASSES.get(suffix))
+        # statistic suffix -> start of the last exported hour
+        self._exported: dict[str, datetime | None] = {}
+        self._sums: dict[str, float] = {}
+        # hour start -> statistic suffix -> samples
+        self._samples: dict[datetime, dict[str, list[float]]] = {}
+        # observation time of the last sample and fetch time of the last forecast
+        self._sampled: datetime | None = None
+        self._forecasted: datetime | None = None
+
+    async def async_start(self) -> None:
+        """Load the last exported hour of every statistic."""
+        recorder = get_instance(self._hass)
+        for suffix, metadata in self._metadata.items():
+            last = await recorder.async_add_executor_job(
+                get_last_statistics, self._hass, 1, metadata["statistic_id"], True, {"sum"})
+            rows = last.get(metadata["statistic_id"])
+            if not rows:
+                self._exported[suffix] = None
+                self._sums[suffix] = 0.0
+                continue
+            start = rows[0]["start"]
+            if not isinstance(start, datetime):
+                start = dt_util.utc_from_timestamp(start)
+            self._exported[suffix] = start
+            self._sums[suffix] = rows[0].get("sum") or 0.0
+
+    @callback
+    def async_update(self) -> None:
+        """Add the samples of a new fetch and export the completed hours."""
+        if self._coordinator.data is None:
+            return
+        hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        if (fetched_at := self._coordinator.fetched_at) != self._forecasted:
+            self._forecasted = fetched_at
+            self._add_observation()
+            self._add_forecast(hour)
+
+        completed = sorted(start for start in self._samples if start < hour)
+        if not completed:
+            return
+        for suffix, metadata in self._metadata.items():
+            rows = []
+            for start in completed:
+                values = self._samples[start].get(suffix)
+                exported = self._exported.get(suffix)
+                if not values or (exported is not None and start <= exported):
+                    continue
+                if metadata["has_sum"]:
+                    # the observation is the amount of the running hour
+                    amount = max(values)
+                    self._sums[suffix] = self._sums.get(suffix, 0.0) + amount
+                    rows.append(StatisticData(start=start, state=amount, sum=self._sums[suffix]))
+                else:
+                    rows.append(StatisticData(
+                        start=start, mean=sum(values) / len(values), min=min(values), max=max(values)))
+                self._exported[suffix] = start
+            if rows:
+                async_add_external_statistics(self._hass, metadata, rows)
+        for start in completed:
+            del self._samples[start]
+        _LOGGER.debug("Exported statistics for %s up to %s", self._coordinator.location_name, completed[-1])
+
+    def _add_observation(self) -> None:
+        """Sample the current observation once, in the hour it was observed."""
+        current = self._coordinator.data[RESULTS_CURRENT]
+        observed = parse_publish_time(current.get(FIELD_VALIDTIMELOCAL))
+        if observed is None:
+            # no observation time, fall back to the fetch time
+            observed = self._coordinator.fetched_at
+        if observed is None or observed == self._sampled:
+            return
+        self._sampled = observed
+        start = dt_util.as_utc(observed).replace(minute=0, second=0, microsecond=0)
+        samples = self._samples.setdefault(start, {})
+        for field, (suffix, _, _) in EXPORTED_FIELDS.items():
+            if (value := _to_float(current.get(field))) is not None:
+                samples.setdefault(suffix, []).append(value)
+
+    def _add_forecast(self, hour: datetime) -> None:
+        """Keep the latest forecast of every hour not yet complete."""
+        for row in self._coordinator.data[RESULTS_FORECAST_HOURLY]:
+            try:
+                start = dt_util.utc_from_timestamp(int(row[FIELD_VALIDTIMEUTC])).replace(
+                    minute=0, second=0, microsecond=0)
+            except (KeyError, TypeError, ValueError):
+                continue
+            if start < hour:
+                continue
+            samples = self._samples.setdefault(start, {})
+            for field, (suffix, _, _) in FORECAST_FIELDS.items():
+                if (value := _to_float(row.get(field))) is not None:
+                    samples[suffix] = [value]
+
+
+def _metadata(
+        name: str, statistic_id: str, unit: str | None, has_sum: bool, unit_class: str | None
+) -> StatisticMetaData:
+    """Return the metadata of a statistic for the running recorder version."""
+    metadata = StatisticMetaData(
+        has_sum=has_sum,
+        name=name,
+        source=DOMAIN,
+        statistic_id=statistic_id,
+        unit_of_measurement=unit,
+    )
+    if StatisticMeanType is not None:
+        metadata["mean_type"] = StatisticMeanType.NONE if has_sum else StatisticMeanType.ARITHMETIC
+    else:
+        metadata["has_mean"] = not has_sum
+    if "unit_class" in StatisticMetaData.__annotations__:
+        metadata["unit_class"] = unit_class
+    return metadata
+
+
+async def async_setup_exporter(hass: HomeAssistant, coordinator) -> StatisticsExporter:
+    """Create an exporter and load its export state."""
+    exporter = StatisticsExporter(hass, coordinator)
+    await exporter.async_start()
+    return exporter
@@ -0,0 +1,78 @@
+"""Recent observations of a location kept in memory for trend sensors.
+
+A fixed-size ring buffer backed by one ``array`` per field: appending
+overwrites the oldest sample in O(1) and the memory never grows. Sample
+times only increase, so lookups by time bisect the logical order.
+"""
+from __future__ import annotations
+
+from array import array
+import math
+from typing import Any, Iterable
+
+# 하루치 (20분 주기)
+CAPACITY = 72
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class ObservationBuffer:
+    """Ring buffer of timestamped observations, missing values stored as NaN."""
+
+    def __init__(self, fields: Iterable[str], capacity: int = CAPACITY) -> None:
+        """Initialize."""
+        self._capacity = capacity
+        self._times = array('d', bytes(8 * capacity))
+        self._values = {field: array('d', bytes(8 * capacity)) for field in fields}
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _slot(self, index: int) -> int:
+        """Return the array slot of the index-th oldest sample."""
+        return (self._head - self._size + index) % self._capacity
+
+    def append(self, when: float, values: dict[str, Any]) -> None:
+        """Add a sample (epoch seconds), replacing the oldest when full."""
+        if self._size and when <= self._times[self._slot(self._size - 1)]:
+            return
+        self._times[self._head] = when
+        for field, column in self._values.items():
+            column[self._head] = _to_float(values.get(field))
+        self._head = (self._head + 1) % self._capacity
+        self._size = min(self._size + 1, self._capacity)
+
+    def _index_at(self, when: float) -> int | None:
+        """Return the index of the newest sample at or before a time."""
+        low, high = 0, self._size
+        while low < high:
+            mid = (low + high) // 2
+            if self._times[self._slot(mid)] <= when:
+                low = mid + 1
+            else:
+                high = mid
+        return low - 1 if low else None
+
+    def change(self, field: str, window: float) -> tuple[float, float] | None:
+        """Return (latest minus the value ``window`` seconds earlier, elapsed seconds).
+
+        None until the buffer covers the window or when either value is missing.
+        """
+        if not self._size:
+            return None
+        latest = self._slot(self._size - 1)
+        index = self._index_at(self._times[latest] - window)
+        if index is None:
+            return None
+        earlier = self._slot(index)
+        delta = self._values[field][latest] - self._values[field][earlier]
+        if math.isnan(delta):
+            return None
+        return delta, self._times[latest] - self._times[earlier]
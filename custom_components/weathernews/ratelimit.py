@@ -0,0 +1,107 @@
+"""Per-host request rate limiting for the weathernews integration."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_RATE_LIMITER, DEFAULT_REQUESTS_PER_MINUTE
+
+# Seconds worth of budget that may be spent in a single burst
+BURST_SECONDS = 10
+
+
+class TokenBucket:
+    """Token bucket refilled at a fixed rate, waiters served in order."""
+
+    def __init__(self, requests_per_minute: int) -> None:
+        """Initialize."""
+        self._lock = asyncio.Lock()
+        self._updated = time.monotonic()
+        self.set_rate(requests_per_minute)
+        self._tokens = self._capacity
+
+    def set_rate(self, requests_per_minute: int) -> None:
+        """Change the refill rate, keeping the tokens already earned."""
+        self._rate = requests_per_minute / 60
+        self._capacity = max(1.0, self._rate * BURST_SECONDS)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def async_acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class HostRateLimiter:
+    """Token buckets per config entry and upstream host, and daily request counts per host.
+
+    Every config entry registers its own requests-per-minute budget, so a
+    conservative entry only slows its own locations. Requests made outside an
+    entry, such as config flow validation, use the default budget.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._budgets: dict[str, int] = {}
+        self._buckets: dict[tuple[str | None, str], TokenBucket] = {}
+        self._day = dt_util.now().date()
+        self._counts: dict[str, int] = {}
+
+    def requests_per_minute(self, entry_id: str | None = None) -> int:
+        """Return the budget applied to the requests of a config entry."""
+        return self._budgets.get(entry_id, DEFAULT_REQUESTS_PER_MINUTE)
+
+    @callback
+    def async_set_budget(self, entry_id: str, requests_per_minute: int) -> None:
+        """Register the budget of a config entry."""
+        self._budgets[entry_id] = requests_per_minute
+        for (owner, _host), bucket in self._buckets.items():
+            if owner == entry_id:
+                bucket.set_rate(requests_per_minute)
+
+    @callback
+    def async_remove_budget(self, entry_id: str) -> None:
+        """Forget the budget and buckets of an unloaded config entry."""
+        self._budgets.pop(entry_id, None)
+        for key in [key for key in self._buckets if key[0] == entry_id]:
+            del self._buckets[key]
+
+    async def async_acquire(self, url: str, entry_id: str | None = None) -> None:
+        """Wait for the entry's budget on the host and count the request."""
+        host = urlsplit(url).hostname or ''
+        if (bucket := self._buckets.get((entry_id, host))) is None:
+            bucket = self._buckets[(entry_id, host)] = TokenBucket(self.requests_per_minute(entry_id))
+        await bucket.async_acquire()
+
+        today = dt_util.now().date()
+        if today != self._day:
+            self._day = today
+            self._counts = {}
+        self._counts[host] = self._counts.get(host, 0) + 1
+
+    def requests_today(self) -> dict[str, int]:
+        """Return today's request count per host."""
+        if dt_util.now().date() != self._day:
+            return {}
+        return dict(self._counts)
+
+
+@callback
+def async_get_rate_limiter(hass: HomeAssistant) -> HostRateLimiter:
+    """Return the rate limiter shared by every config entry."""
+    if (limiter := hass.data.get(DATA_RATE_LIMITER)) is None:
+        limiter = hass.data[DATA_RATE_LIMITER] = HostRateLimiter()
+    return limiter
@@ -0,0 +1,312 @@
+"""Offline index of Korean administrative region (location) codes.
+
+The bundled ``regions.tsv`` holds one ``code<TAB>name<TAB>lat<TAB>lon`` row
+per 시/도, 시/군/구 and 읍/면/동, sorted by code. To keep the file small the
+name is relative to the parent row (``1147010300<TAB>신월동`` under
+``1147000000<TAB>양천구``) and only 읍/면/동 rows, the level of a location
+code, carry coordinates. The index is loaded lazily on first use and
+searched by code prefix, name substring or Hangul jamo/choseong (e.g.
+``ㅅㅇㄷ`` or ``신월ㄷ``), or by distance to a coordinate through grid buckets
+of the 읍/면/동 centroids.
+
+Regenerate the data file from the official 법정동코드 list (code.go.kr),
+optionally with a CSV of centroids by code such as ``dongnaeKR_*.csv`` of the
+dongnae-kr package::
+
+    python -m custom_components.weathernews.regions 법정동코드_전체자료.txt dongnaeKR_251130.csv
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+import csv
+from functools import lru_cache
+import math
+import os
+import sys
+
+REGIONS_FILE = os.path.join(os.path.dirname(__file__), 'regions.tsv')
+
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSEONG = ('', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ',
+             'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ')
+HANGUL_FIRST = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+MAX_RESULTS = 20
+# Grid bucket size of the spatial index in degrees (about 11 km)
+GRID_SIZE = 0.1
+# Rings searched around the query cell before giving up (about 550 km)
+MAX_RINGS = 50
+# Farthest centroid still suggested as a default location code
+MAX_SUGGEST_KM = 20.0
+
+LEVEL_SIDO = 0
+LEVEL_SIGUNGU = 1
+LEVEL_DONG = 2
+
+# Column names of the code and coordinates in a centroid CSV
+CENTROID_COLUMNS = (('dnid', 'code'), ('dnlatitude', 'lat'), ('dnlongitude', 'lon'))
+DATA_HEADER = '# 법정동코드: 행정표준코드관리시스템 (code.go.kr), 읍/면/동 좌표: dongnae-kr (MIT, Copyright (c) 2025 Nash Do It Right)\n'
+
+
+def decompose(text: str) -> str:
+    """Return the text with every Hangul syllable split into its jamo."""
+    out = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_FIRST <= code <= HANGUL_LAST:
+            code -= HANGUL_FIRST
+            out.append(CHOSEONG[code // 588])
+            out.append(JUNGSEONG[(code % 588) // 28])
+            out.append(JONGSEONG[code % 28])
+        else:
+            out.append(char)
+    return ''.join(out)
+
+
+def choseong(text: str) -> str:
+    """Return the initial consonant of every Hangul syllable."""
+    out = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_FIRST <= code <= HANGUL_LAST:
+            out.append(CHOSEONG[(code - HANGUL_FIRST) // 588])
+        else:
+            out.append(char)
+    return ''.join(out)
+
+
+class RegionIndex:
+    """Sorted parallel arrays with newline-joined search blobs.
+
+    Substring searches run as ``str.find`` over one blob per representation
+    and map hits back to rows with a bisect over the row offsets.
+    """
+
+    def __init__(self, rows: list[tuple]) -> None:
+        """Initialize."""
+        rows = sorted(rows)
+        self.codes = [row[0] for row in rows]
+        self.names = [row[1] for row in rows]
+        self.lats = [row[2] if len(row) > 2 else None for row in rows]
+        self.lons = [row[3] if len(row) > 3 else None for row in rows]
+        self._grid: dict[tuple[int, int], list[int]] = {}
+        for idx, (code, lat, lon) in enumerate(zip(self.codes, self.lats, self.lons)):
+            # Only 읍/면/동 are suggested, a 시/도 or 시/군/구 code is far too coarse
+            if lat is not None and lon is not None and region_level(code) == LEVEL_DONG:
+                self._grid.setdefault(_cell(lat, lon), []).append(idx)
+        self._blobs = {}
+        for kind, transform in (('name', str), ('jamo', decompose), ('choseong', choseong)):
+            offsets = []
+            position = 0
+            parts = []
+            for name in self.names:
+                value = transform(name).replace(' ', '')
+                offsets.append(position)
+                parts.append(value)
+                position += len(value) + 1
+            self._blobs[kind] = ('\n'.join(parts), offsets)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def name(self, code: str) -> str | None:
+        """Return the name of a code."""
+        idx = bisect_left(self.codes, code)
+        if idx < len(self.codes) and self.codes[idx] == code:
+            return self.names[idx]
+        return None
+
+    def _find(self, kind: str, needle: str, limit: int) -> list[int]:
+        blob, offsets = self._blobs[kind]
+        found = []
+        start = 0
+        while len(found) < limit:
+            pos = blob.find(needle, start)
+            if pos < 0:
+                break
+            row = bisect_right(offsets, pos) - 1
+            if not found or found[-1] != row:
+                found.append(row)
+            # continue from the next row
+            start = offsets[row + 1] if row + 1 < len(offsets) else len(blob)
+        return found
+
+    def search(self, query: str, limit: int = MAX_RESULTS) -> list[tuple[str, str]]:
+        """Return ``(code, name)`` rows matching the query."""
+        query = query.strip().replace(' ', '')
+        if not query:
+            return []
+        if query.isdigit():
+            lo = bisect_left(self.codes, query)
+            hi = bisect_left(self.codes, query + ':')  # ':' sorts after every digit
+            rows = range(lo, min(hi, lo + limit))
+        elif all(char in CHOSEONG for char in query):
+            rows = self._find('choseong', query, limit)
+        else:
+            rows = self._find('name', query, limit)
+            if len(rows) < limit:
+                # partially typed syllables, e.g. '신월ㄷ'
+                rows += [row for row in self._find('jamo', decompose(query), limit) if row not in rows]
+        return [(self.codes[row], self.names[row]) for row in list(rows)[:limit]]
+
+    def nearest(
+            self, lat: float, lon: float, limit: int = 5, max_km: float | None = None
+    ) -> list[tuple[str, str, float]]:
+        """Return the ``(code, name, km)`` 읍/면/동 rows closest to a coordinate.
+
+        Grid cells are visited ring by ring around the query cell; the search
+        stops once the ring is farther away than the last accepted candidate.
+        """
+        if not self._grid:
+            return []
+        cell_lat, cell_lon = _cell(lat, lon)
+        # smallest east-west extent of a cell, to bound the ring distance
+        cell_km = GRID_SIZE * 111.0 * math.cos(math.radians(min(abs(lat) + GRID_SIZE, 89.0)))
+        found = []
+        for ring in range(MAX_RINGS + 1):
+            for d_lat in range(-ring, ring + 1):
+                for d_lon in range(-ring, ring + 1):
+                    if max(abs(d_lat), abs(d_lon)) != ring:
+                        continue
+                    for idx in self._grid.get((cell_lat + d_lat, cell_lon + d_lon), ()):
+                        found.append((distance_km(lat, lon, self.lats[idx], self.lons[idx]), idx))
+            found.sort()
+            del found[limit:]
+            if len(found) >= limit and found[-1][0] <= ring * cell_km:
+                break
+        return [
+            (self.codes[idx], self.names[idx], round(km, 1)) for km, idx in found
+            if max_km is None or km <= max_km
+        ]
+
+
+def _cell(lat: float, lon: float) -> tuple[int, int]:
+    return (math.floor(lat / GRID_SIZE), math.floor(lon / GRID_SIZE))
+
+
+def distance_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Return the equirectangular distance between two coordinates."""
+    x = math.radians(lon2 - lon1) * math.cos(math.radians((lat1 + lat2) / 2))
+    y = math.radians(lat2 - lat1)
+    return 6371.0 * math.hypot(x, y)
+
+
+def _parse_coordinate(value: str) -> float | None:
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def region_level(code: str) -> int:
+    """Return the level of a code: LEVEL_SIDO, LEVEL_SIGUNGU or LEVEL_DONG."""
+    if code[5:].strip('0'):
+        return LEVEL_DONG
+    if code[2:].strip('0'):
+        return LEVEL_SIGUNGU
+    return LEVEL_SIDO
+
+
+def parent_code(code: str) -> str | None:
+    """Return the code of the 시/군/구 or 시/도 a region belongs to."""
+    if code[5:].strip('0'):
+        return code[:5] + '00000'
+    if code[2:].strip('0'):
+        return code[:2] + '00000000'
+    return None
+
+
+def read_regions(path: str = REGIONS_FILE) -> list[tuple]:
+    """Read the bundled region rows with full names."""
+    rows = []
+    names = {}
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            parts = line.rstrip('\n').split('\t')
+            if not parts[0] or parts[0].startswith('#'):
+                continue
+            parts += [''] * (4 - len(parts))
+            code, name = parts[0], parts[1]
+            parent = names.get(parent_code(code))
+            if parent:
+                name = f'{parent} {name}' if name else parent
+            names[code] = name
+            rows.append((code, name, _parse_coordinate(parts[2]), _parse_coordinate(parts[3])))
+    return rows
+
+
+def _relative_name(name: str, parent: str | None) -> str:
+    if parent is None:
+        return name
+    if name == parent:
+        return ''
+    if name.startswith(parent + ' '):
+        return name[len(parent) + 1:]
+    raise ValueError(f'{name} is not below {parent}')
+
+
+@lru_cache(maxsize=1)
+def load_region_index() -> RegionIndex:
+    """Load the bundled index. Blocking, call from an executor."""
+    return RegionIndex(read_regions())
+
+
+def read_centroids(path: str) -> dict[str, tuple[float, float]]:
+    """Read ``code -> (lat, lon)`` from a CSV with a header row."""
+    centroids = {}
+    with open(path, encoding='utf-8-sig', newline='') as file:
+        reader = csv.DictReader(file)
+        columns = [next(name for name in names if name in reader.fieldnames) for names in CENTROID_COLUMNS]
+        for row in reader:
+            code, lat, lon = (row[column] for column in columns)
+            if (lat := _parse_coordinate(lat)) is not None and (lon := _parse_coordinate(lon)) is not None:
+                centroids[code] = (round(lat, 4), round(lon, 4))
+    return centroids
+
+
+def build_regions(source: str, target: str = REGIONS_FILE, centroids: str | None = None) -> int:
+    """Convert the official 법정동코드 list to the bundled format.
+
+    Rows marked as abolished (폐지) and ri-level codes are dropped, names are
+    written relative to the parent row. The official list has no
+    coordinates: 읍/면/동 centroids are read from the given CSV, falling back
+    to the ones already in the target file.
+    """
+    known = {}
+    if os.path.exists(target):
+        known = {row[0]: row[2:] for row in read_regions(target) if row[2] is not None}
+    if centroids is not None:
+        known.update(read_centroids(centroids))
+    rows = []
+    for encoding in ('utf-8', 'cp949'):
+        try:
+            with open(source, encoding=encoding) as file:
+                lines = file.read().splitlines()
+            break
+        except UnicodeDecodeError:
+            continue
+    for line in lines[1:]:
+        parts = line.split('\t')
+        if len(parts) < 3 or not parts[0].isdigit() or parts[2].strip() != '존재':
+            continue
+        code = parts[0]
+        if code[8:] != '00':
+            continue
+        rows.append((code, parts[1].strip()))
+    rows.sort()
+    names = dict(rows)
+    with open(target, 'w', encoding='utf-8') as file:
+        file.write(DATA_HEADER)
+        for code, name in rows:
+            line = f'{code}\t{_relative_name(name, names.get(parent_code(code)))}'
+            if code in known and region_level(code) == LEVEL_DONG:
+                lat, lon = known[code]
+                line += f'\t{lat}\t{lon}'
+            file.write(line + '\n')
+    return len(rows)
+
+
+if __name__ == '__main__':
+    print(build_regions(sys.argv[1], centroids=sys.argv[2] if len(sys.argv) > 2 else None), 'regions written')
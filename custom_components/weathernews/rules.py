@@ -0,0 +1,171 @@
+"""Threshold alert rules evaluated once per coordinator update.
+
+One rule per line (or separated by ``;``)::
+
+    rain_soon: precipHour3Attr.sum_prec > 0
+    pm25_bad_tomorrow: pmForecastDaily.1.pm25 >= 36
+    heat: heatindex >= 32 and rhum >= 60
+
+A condition is ``path op value`` where ``path`` is a current field, dotted
+into dict keys and list indexes, ``op`` one of ``> >= < <= == !=`` and
+``value`` a number or a string. Rules are parsed once; a rule fires the
+``weathernews_alert`` event only when it changes from off to on, a restart
+or reload does not fire it again.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import operator
+import re
+from typing import Any, Callable
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import RESULTS_CURRENT
+
+_LOGGER = logging.getLogger(__name__)
+
+EVENT_ALERT = 'weathernews_alert'
+
+OPERATORS = {
+    '>=': operator.ge,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>': operator.gt,
+    '<': operator.lt,
+}
+
+RULE_NAME = re.compile(r'^[A-Za-z0-9_]+$')
+CONDITION = re.compile(r'^(?P<path>[A-Za-z0-9_.]+)\s*(?P<op>>=|<=|==|!=|>|<)\s*(?P<value>[^<>=!\s].*)$')
+
+
+@dataclass(frozen=True)
+class Condition:
+    """One compiled ``path op value`` comparison."""
+
+    path: tuple[str | int, ...]
+    op: Callable[[Any, Any], bool]
+    value: float | str
+
+    def resolve(self, current: dict) -> Any:
+        """Return the value of the path, None when missing."""
+        value: Any = current
+        for key in self.path:
+            try:
+                value = value[key]
+            except (KeyError, IndexError, TypeError):
+                return None
+        return value
+
+    def test(self, current: dict) -> bool:
+        """Return whether the condition holds."""
+        actual = self.resolve(current)
+        if actual is None:
+            return False
+        if isinstance(self.value, float):
+            try:
+                actual = float(actual)
+            except (TypeError, ValueError):
+                return False
+        else:
+            actual = str(actual)
+        return self.op(actual, self.value)
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A named rule, on when all conditions hold."""
+
+    name: str
+    source: str
+    conditions: tuple[Condition, ...]
+
+
+def _parse_value(value: str) -> float | str:
+    value = value.strip().strip('"\'')
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def compile_rules(text: str) -> tuple[Rule, ...]:
+    """Parse the rules text, raise ValueError on the first invalid rule."""
+    rules = []
+    names = set()
+    for line in re.split(r'[;\n]', text or ''):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        name, sep, body = line.partition(':')
+        name = name.strip()
+        if not sep or not RULE_NAME.match(name) or name in names:
+            raise ValueError(f"invalid rule name: {line}")
+        conditions = []
+        # a dangling 'and' leaves an empty condition instead of joining the value
+        for part in re.split(r'\s+and(?:\s+|$)', body.strip()):
+            if (match := CONDITION.match(part.strip())) is None:
+                raise ValueError(f"invalid condition: {part}")
+            path = tuple(
+                int(key) if key.isdigit() else key for key in match['path'].split('.')
+            )
+            conditions.append(Condition(path, OPERATORS[match['op']], _parse_value(match['value'])))
+        names.add(name)
+        rules.append(Rule(name, body.strip(), tuple(conditions)))
+    return tuple(rules)
+
+
+class RuleEngine:
+    """Evaluate the compiled rules of one coordinator and fire alerts on edges.
+
+    The state of a rule is None until it is known: its binary sensor restores
+    the state from before a restart or reload, otherwise the first evaluation
+    only records it. Rules are evaluated once per fetch, not on the pushes of
+    interpolated values or sunrise/sunset between fetches.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator, rules: tuple[Rule, ...]) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self.rules = rules
+        self.state: dict[str, bool | None] = {rule.name: None for rule in rules}
+        # fetch time of the last evaluation
+        self._evaluated = None
+
+    @callback
+    def async_evaluate(self) -> None:
+        """Evaluate every rule against the data of a new fetch."""
+        if self._coordinator.data is None or self._coordinator.fetched_at == self._evaluated:
+            return
+        self._evaluated = self._coordinator.fetched_at
+        for rule in self.rules:
+            self._evaluate(rule)
+
+    @callback
+    def async_restore(self, name: str, active: bool | None) -> None:
+        """Restore the state of a rule from before a restart and evaluate it."""
+        if self.state.get(name, False) is not None:
+            return
+        self.state[name] = active
+        if self._coordinator.data is not None:
+            self._evaluate(next(rule for rule in self.rules if rule.name == name))
+
+    def _evaluate(self, rule: Rule) -> None:
+        current = self._coordinator.data[RESULTS_CURRENT]
+        active = all(condition.test(current) for condition in rule.conditions)
+        if active and self.state[rule.name] is False:
+            _LOGGER.debug("Rule %s matched for %s", rule.name, self._coordinator.location_name)
+            self._hass.bus.async_fire(EVENT_ALERT, {
+                'location': self._coordinator.location_name,
+                'api_key': self._coordinator.api_key,
+                'rule': rule.name,
+                'condition': rule.source,
+                'values': {
+                    '.'.join(map(str, condition.path)): condition.resolve(current)
+                    for condition in rule.conditions
+                },
+            })
+        self.state[rule.name] = active
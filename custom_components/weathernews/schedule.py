@@ -0,0 +1,113 @@
+"""Publish-time-aware refresh scheduling for the weathernews integration."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+from statistics import median
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+PUBLISH_TIME_FORMATS = (
+    "%Y/%m/%dT%H:%M:%S%z",
+    "%Y/%m/%d %H:%M:%S%z",
+    "%Y/%m/%d %H:%M:%S",
+    "%Y/%m/%d %H:%M",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%d %H:%M:%S",
+)
+
+# Number of publish times kept per endpoint to learn the cadence
+PUBLISH_HISTORY = 6
+# Wait this long after the expected publish before fetching
+PUBLISH_DELAY = timedelta(minutes=2)
+# Never poll more often than this
+MIN_REFRESH_INTERVAL = timedelta(minutes=5)
+# Never wait longer than this: air quality publishes no timestamp and changes hourly
+MAX_REFRESH_INTERVAL = timedelta(hours=1)
+# Overdue retries double from the minimum interval at most this many times
+MAX_RETRY_DOUBLINGS = 4
+# Cadences outside this range are treated as unknown
+MIN_CADENCE = timedelta(minutes=5)
+MAX_CADENCE = timedelta(hours=6)
+
+
+def parse_publish_time(value: Any) -> datetime | None:
+    """Parse an upstream publish timestamp, assuming local time without offset."""
+    if not isinstance(value, str):
+        return None
+    for fmt in PUBLISH_TIME_FORMATS:
+        try:
+            parsed = datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=dt_util.get_default_time_zone())
+        return parsed
+    return None
+
+
+class PublishTracker:
+    """Learn the publish cadence of each endpoint from the returned timestamps."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._published: dict[str, list[datetime]] = {}
+        # Refreshes in a row that found the expected publish missing
+        self._retries = 0
+
+    def record(self, endpoint: str, value: Any) -> None:
+        """Record the publish time returned by an endpoint."""
+        published = parse_publish_time(value)
+        if published is None:
+            return
+        history = self._published.setdefault(endpoint, [])
+        if history and published <= history[-1]:
+            return
+        history.append(published)
+        del history[:-PUBLISH_HISTORY]
+
+    def cadence(self, endpoint: str) -> timedelta | None:
+        """Return the learned cadence of an endpoint, None while unknown."""
+        history = self._published.get(endpoint, [])
+        if len(history) < 3:
+            return None
+        cadence = median(b - a for a, b in zip(history, history[1:]))
+        if not MIN_CADENCE <= cadence <= MAX_CADENCE:
+            return None
+        return cadence
+
+    def next_expected(self, endpoint: str) -> datetime | None:
+        """Return when the next publish of an endpoint is expected."""
+        if (cadence := self.cadence(endpoint)) is None:
+            return None
+        expected = self._published[endpoint][-1] + cadence
+        now = dt_util.now()
+        # A late publish is retried soon, older misses are skipped
+        if expected + PUBLISH_DELAY <= now and now - expected >= cadence:
+            while expected + PUBLISH_DELAY <= now:
+                expected += cadence
+        return expected
+
+    def next_refresh(self, fallback: timedelta) -> timedelta:
+        """Return the delay until shortly after the earliest expected publish.
+
+        The delay may exceed the fixed interval when the next publish is known
+        to be later. While a publish is overdue the retries back off from the
+        minimum interval up to the fixed interval.
+        """
+        known = [when for endpoint in self._published if (when := self.next_expected(endpoint)) is not None]
+        if not known:
+            return fallback
+        now = dt_util.now()
+        if (expected := min(known) + PUBLISH_DELAY) > now:
+            self._retries = 0
+            delay = max(MIN_REFRESH_INTERVAL, min(expected - now, MAX_REFRESH_INTERVAL))
+        else:
+            delay = min(MIN_REFRESH_INTERVAL * 2 ** self._retries, max(fallback, MIN_REFRESH_INTERVAL))
+            self._retries = min(self._retries + 1, MAX_RETRY_DOUBLINGS)
+        _LOGGER.debug("Next refresh in %s based on publish cadence", delay)
+        return delay
@@ -6,13 +6,16 @@ https://github.com/jaydeethree/Home-Assistant-weatherdotcom
 from __future__ import annotations
 
 import logging
-import asyncio
+from typing import Any
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
+from homeassistant.components.weather import ATTR_CONDITION_SUNNY
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import generate_entity_id
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -20,33 +23,72 @@ from .coordinator import WeatherUpdateCoordinator
 
 from .const import (
     CONF_ATTRIBUTION,
+    CONF_FLEET,
+    CONF_ENTITY_PROFILE,
     DOMAIN,
     FIELD_DAYPART,
+    FIELD_DAYORNIGHT,
+    FIELD_FEELS_LIKE,
+    FIELD_HUMIDITY,
+    FIELD_ICONCODE,
+    FIELD_TEMP,
+    FIELD_VALIDTIMELOCAL,
+    ICON_CONDITION_MAP,
+    PROFILE_COMPACT,
+    ICON_THERMOMETER,
+    TEMPUNIT,
     FIELD_WINDGUST,
     FIELD_WINDSPEED,
     RESULTS_CURRENT,
     RESULTS_FORECAST_DAILY,
     RESULTS_FORECAST_HOURLY
 )
-from .weather_current_conditions_sensors import *
-
-_LOGGER = logging.getLogger(__name__)
-
-# Declaration of supported Weather.com observation/condition sensors
-SENSOR_DESCRIPTIONS: tuple[WeatherSensorEntityDescription, ...] = (
-    current_condition_sensor_descriptions
+from .weather_current_conditions_sensors import (
+    WeatherSensorEntityDescription,
+    get_compact_sensor_descriptions,
+    get_current_condition_sensor_descriptions
 )
 
+_LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(
         hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Add Weather.com entities from a config_entry."""
+    if entry.data.get(CONF_FLEET):
+        fleet = hass.data[DOMAIN][entry.entry_id]
+        async_add_entities([
+            FleetLocationSensor(coordinator) for coordinator in fleet.coordinators.values()
+        ])
+        return
+
     coordinator: WeatherUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if entry.options.get(CONF_ENTITY_PROFILE) == PROFILE_COMPACT:
+        descriptions = get_compact_sensor_descriptions()
+    else:
+        descriptions = get_current_condition_sensor_descriptions()
+    # Disabled feature groups and optional fields (e.g. forecast accuracy) create no entities
     sensors = [
-        WeatherSensor(coordinator, description) for description in SENSOR_DESCRIPTIONS
+        WeatherSensor(coordinator, description)
+        for description in descriptions
+        if (description.group is None or description.group in coordinator.groups)
+        and description.key in coordinator.data[RESULTS_CURRENT]
     ]
 
+    # Sensors of the other profile, of disabled groups or options are disabled instead of left
+    # unavailable; they keep their settings and come back when the option is turned on again
+    registry = er.async_get(hass)
+    unique_ids = {sensor.unique_id for sensor in sensors}
+    for registry_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if registry_entry.domain != "sensor":
+            continue
+        if registry_entry.unique_id not in unique_ids:
+            if registry_entry.disabled_by is None:
+                registry.async_update_entity(
+                    registry_entry.entity_id, disabled_by=er.RegistryEntryDisabler.INTEGRATION)
+        elif registry_entry.disabled_by is er.RegistryEntryDisabler.INTEGRATION:
+            registry.async_update_entity(registry_entry.entity_id, disabled_by=None)
+
     async_add_entities(sensors)
 
 
@@ -71,10 +113,8 @@ class WeatherSensor(CoordinatorEntity, SensorEntity):
             entity_id_format, f"wn_{self.coordinator.location_name}_{description.name}", hass=coordinator.hass
         )
         self._unit_system = coordinator.unit_system
-        self._sensor_data = _get_sensor_data(
-            coordinator.data, description.key, self._unit_system)
-        self._extra_data = _get_sensor_data(
-            coordinator.data, description.key, self._unit_system)
+        # Values are read when the state is written, so derived fields of
+        # disabled entities are never computed
         self._attr_native_unit_of_measurement = self.entity_description.unit_fn(
             self.coordinator.hass.config.units is METRIC_SYSTEM)
 
@@ -94,7 +134,8 @@ class WeatherSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> StateType:
         """Return the state."""
-        return self.entity_description.value_fn(self._sensor_data, self._unit_system)
+        sensor_data = _get_sensor_data(self.coordinator, self.entity_description.key, self._unit_system)
+        return self.entity_description.value_fn(sensor_data, self._unit_system)
 
     @property
     def extra_state_attributes(self):
@@ -103,9 +144,13 @@ class WeatherSensor(CoordinatorEntity, SensorEntity):
         if not isinstance(attr_key, list):
             return None
         attr = {}
+        current = self.coordinator.data[RESULTS_CURRENT]
         for key in attr_key:
+            # fields of disabled groups or options
+            if key not in current:
+                continue
             val = _get_sensor_data(
-                self.coordinator.data, key, self._unit_system
+                self.coordinator, key, self._unit_system
             )
             if isinstance(val, dict):
                 attr.update(val)
@@ -127,28 +172,60 @@ class WeatherSensor(CoordinatorEntity, SensorEntity):
             "configuration_url": self.coordinator._build_url('https://www.kr-weathernews.com/mv4/html/today.html?loc={apiKey}')
         }
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle data update."""
-        # if self.entity_description.key == 'latitude':
-        #     self._sensor_data = self.coordinator._latitude
-        # elif self.entity_description.key == 'longitude':
-        #     self._sensor_data = self.coordinator._longitude
-        # else:
-        self._sensor_data = _get_sensor_data(
-            self.coordinator.data, self.entity_description.key, self._unit_system
+
+class FleetLocationSensor(CoordinatorEntity, SensorEntity):
+    """Lightweight per-location temperature sensor of a fleet entry."""
+    _attr_attribution = CONF_ATTRIBUTION
+    _attr_icon = ICON_THERMOMETER
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    # Current fields copied to the state attributes
+    ATTR_KEYS = (FIELD_VALIDTIMELOCAL, FIELD_FEELS_LIKE, FIELD_HUMIDITY, 'pop',
+                 'pm10', 'pm25', 'khai', 'precipHour3')
+
+    def __init__(self, coordinator: WeatherUpdateCoordinator):
+        super().__init__(coordinator)
+        self._attr_name = coordinator.location_name
+        self._attr_unique_id = f"wn_{coordinator.location_name},{FIELD_TEMP}".lower()
+        self.entity_id = generate_entity_id(
+            "sensor.{}", f"wn_{coordinator.location_name}", hass=coordinator.hass
         )
-        self.async_write_ha_state()
+        self._attr_native_unit_of_measurement = coordinator.units_of_measurement[TEMPUNIT]
+
+    @property
+    def available(self) -> bool:
+        """Return if weather data is available."""
+        return self.coordinator.data is not None
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state."""
+        return self.coordinator.get_current(FIELD_TEMP)
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        current = self.coordinator.data[RESULTS_CURRENT]
+        attr = {'location_code': self.coordinator.api_key}
+        attr.update({key: current.get(key) for key in self.ATTR_KEYS})
+        iconcode = current.get(FIELD_ICONCODE)
+        if iconcode is not None:
+            iconcode = int(iconcode)
+            if current.get(FIELD_DAYORNIGHT) == 'N' and iconcode in ICON_CONDITION_MAP[ATTR_CONDITION_SUNNY]:
+                iconcode = iconcode + 1000
+            attr['condition'] = self.coordinator._iconcode_to_condition(iconcode)
+        return attr
 
 
 def _get_sensor_data(
-        sensors: dict[str, Any],
+        coordinator: WeatherUpdateCoordinator,
         kind: str,
         unit_system: str
 ) -> Any:
     """Get sensor data."""
     # windGust is often null. When it is, set it to windSpeed instead.
-    if kind == FIELD_WINDGUST and sensors[RESULTS_CURRENT][kind] == None:
-        return sensors[RESULTS_CURRENT][FIELD_WINDSPEED]
+    if kind == FIELD_WINDGUST and coordinator.data[RESULTS_CURRENT][kind] == None:
+        return coordinator.current_value(FIELD_WINDSPEED)
     else:
-        return sensors[RESULTS_CURRENT][kind]
+        return coordinator.current_value(kind)
@@ -0,0 +1,107 @@
+"""Services of the weathernews integration."""
+from __future__ import annotations
+
+import asyncio
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .api import all_coordinators, find_coordinator
+from .const import DOMAIN, RESULTS_FORECAST_DAILY, RESULTS_FORECAST_HOURLY
+
+SERVICE_REFRESH_IF_STALE = "refresh_if_stale"
+SERVICE_GET_FORECAST_AT = "get_forecast_at"
+ATTR_MAX_AGE = "max_age"
+ATTR_LOCATION = "location"
+ATTR_TIME = "time"
+ATTR_TYPE = "type"
+ATTR_INTERPOLATE = "interpolate"
+
+REFRESH_IF_STALE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_MAX_AGE): cv.positive_time_period,
+        vol.Optional(ATTR_LOCATION): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+GET_FORECAST_AT_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_TIME): cv.datetime,
+        vol.Optional(ATTR_LOCATION): cv.string,
+        vol.Optional(ATTR_TYPE, default=RESULTS_FORECAST_HOURLY): vol.In(
+            [RESULTS_FORECAST_HOURLY, RESULTS_FORECAST_DAILY]),
+        vol.Optional(ATTR_INTERPOLATE, default=False): cv.boolean,
+    }
+)
+
+
+@callback
+def async_register_services(hass: HomeAssistant) -> None:
+    """Register the services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH_IF_STALE,
+        _async_refresh_if_stale,
+        schema=REFRESH_IF_STALE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_FORECAST_AT,
+        _async_get_forecast_at,
+        schema=GET_FORECAST_AT_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+async def _async_refresh_if_stale(call: ServiceCall) -> ServiceResponse:
+    """Refresh the locations whose data is older than max_age, return the data age."""
+    hass = call.hass
+    if ATTR_LOCATION in call.data:
+        coordinators = []
+        for location in call.data[ATTR_LOCATION]:
+            if (coordinator := find_coordinator(hass, location)) is None:
+                raise ServiceValidationError(f"Unknown location {location}")
+            coordinators.append(coordinator)
+    else:
+        coordinators = all_coordinators(hass)
+
+    refreshed = await asyncio.gather(*(
+        coordinator.async_refresh_if_stale(call.data[ATTR_MAX_AGE]) for coordinator in coordinators
+    ))
+    return {
+        coordinator.location_name: {
+            "age": None if (age := coordinator.data_age()) is None else round(age, 1),
+            "refreshed": was_refreshed,
+            "success": coordinator.last_update_success,
+        }
+        for coordinator, was_refreshed in zip(coordinators, refreshed)
+    }
+
+
+async def _async_get_forecast_at(call: ServiceCall) -> ServiceResponse:
+    """Return the forecast row valid at a time, or interpolated between rows."""
+    coordinator = find_coordinator(call.hass, call.data.get(ATTR_LOCATION))
+    if coordinator is None:
+        raise ServiceValidationError(
+            f"Unknown location {call.data.get(ATTR_LOCATION)}, set one of several locations")
+    # loaded with the config entry that created the coordinator
+    from .coordinator import _to_number
+
+    when = call.data[ATTR_TIME]
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=dt_util.get_default_time_zone())
+    row = None
+    if coordinator.data is not None:
+        row = coordinator.get_forecast_at(call.data[ATTR_TYPE], when, call.data[ATTR_INTERPOLATE])
+    return {
+        "location": coordinator.location_name,
+        "time": when.isoformat(),
+        "type": call.data[ATTR_TYPE],
+        "interpolated": call.data[ATTR_INTERPOLATE],
+        "forecast": None if row is None else {key: _to_number(value) for key, value in row.items()},
+    }
@@ -0,0 +1,94 @@
+"""Sunrise and sunset computed from the location, without requests.
+
+Uses the NOAA sunrise equation (about a minute of accuracy at mid
+latitudes). Each local day is computed once and kept in a small table, so
+day/night can be decided at any moment and switched exactly at sunrise and
+sunset instead of at the next refresh.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone, tzinfo
+import math
+
+J2000 = 2451545.0
+J2000_DATETIME = datetime(2000, 1, 1, 12, tzinfo=timezone.utc)
+J2000_ORDINAL = date(2000, 1, 1).toordinal()
+# 대기 굴절과 태양 반지름을 고려한 일출/일몰 고도
+SUN_ALTITUDE = -0.833
+EARTH_TILT = 23.4397
+# Days kept in the table (yesterday, today, tomorrow)
+TABLE_DAYS = 3
+
+
+@dataclass(frozen=True)
+class SolarDay:
+    """Sunrise and sunset (UTC) of one local day; None in polar day or night."""
+
+    sunrise: datetime | None
+    sunset: datetime | None
+    polar_day: bool = False
+
+
+def _from_julian(julian: float) -> datetime:
+    return J2000_DATETIME + timedelta(days=julian - J2000)
+
+
+def sun_events(day: date, lat: float, lon: float) -> SolarDay:
+    """Return the sunrise and sunset around the solar noon of a date at a longitude."""
+    mean_noon = day.toordinal() - J2000_ORDINAL - lon / 360
+    anomaly = math.radians((357.5291 + 0.98560028 * mean_noon) % 360)
+    center = 1.9148 * math.sin(anomaly) + 0.0200 * math.sin(2 * anomaly) + 0.0003 * math.sin(3 * anomaly)
+    ecliptic = math.radians((math.degrees(anomaly) + center + 180 + 102.9372) % 360)
+    transit = J2000 + mean_noon + 0.0053 * math.sin(anomaly) - 0.0069 * math.sin(2 * ecliptic)
+    declination = math.asin(math.sin(ecliptic) * math.sin(math.radians(EARTH_TILT)))
+    latitude = math.radians(lat)
+    cos_hour_angle = (
+        (math.sin(math.radians(SUN_ALTITUDE)) - math.sin(latitude) * math.sin(declination))
+        / (math.cos(latitude) * math.cos(declination))
+    )
+    if cos_hour_angle > 1:
+        return SolarDay(None, None, polar_day=False)
+    if cos_hour_angle < -1:
+        return SolarDay(None, None, polar_day=True)
+    hour_angle = math.degrees(math.acos(cos_hour_angle)) / 360
+    return SolarDay(_from_julian(transit - hour_angle), _from_julian(transit + hour_angle))
+
+
+class SolarTable:
+    """Sunrise and sunset of a location by local date."""
+
+    def __init__(self, lat: float | str, lon: float | str, time_zone: tzinfo) -> None:
+        """Initialize."""
+        self._lat = float(lat)
+        self._lon = float(lon)
+        self._time_zone = time_zone
+        self._days: dict[date, SolarDay] = {}
+
+    def day(self, when: datetime) -> SolarDay:
+        """Return the sunrise and sunset of the local date of a moment."""
+        local_date = when.astimezone(self._time_zone).date()
+        if (solar_day := self._days.get(local_date)) is None:
+            solar_day = sun_events(local_date, self._lat, self._lon)
+            self._days = {
+                key: value for key, value in self._days.items()
+                if abs((key - local_date).days) < TABLE_DAYS
+            }
+            self._days[local_date] = solar_day
+        return solar_day
+
+    def is_day(self, when: datetime) -> bool:
+        """Return whether the sun is up at a moment."""
+        solar_day = self.day(when)
+        if solar_day.sunrise is None:
+            return solar_day.polar_day
+        return solar_day.sunrise <= when < solar_day.sunset
+
+    def next_change(self, when: datetime) -> datetime | None:
+        """Return the next sunrise or sunset after a moment, None in polar day or night."""
+        for offset in range(TABLE_DAYS):
+            solar_day = self.day(when + timedelta(days=offset))
+            for event in (solar_day.sunrise, solar_day.sunset):
+                if event is not None and event > when:
+                    return event
+        return None
@@ -0,0 +1,78 @@
+"""Forecast rows indexed by validity time."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Any
+
+from .const import (
+    FIELD_DISCOMFORT,
+    FIELD_DEW_POINT,
+    FIELD_FEELS_LIKE,
+    FIELD_HEATINDEX,
+    FIELD_HUMIDITY,
+    FIELD_HUMIDITY_HOURLY,
+    FIELD_PRECIPCHANCE,
+    FIELD_PRECIPITATION,
+    FIELD_TEMP,
+    FIELD_TEMPERATUREMAX,
+    FIELD_TEMPERATUREMIN,
+    FIELD_UV_INDEX,
+    FIELD_VALIDTIMEUTC,
+    FIELD_WINDCHILL,
+    FIELD_WINDSPEED,
+)
+
+# Fields interpolated between rows, the others come from the nearest row
+CONTINUOUS_FIELDS = frozenset((
+    FIELD_TEMP, FIELD_FEELS_LIKE, FIELD_HUMIDITY, FIELD_HUMIDITY_HOURLY, FIELD_DEW_POINT,
+    FIELD_WINDSPEED, FIELD_PRECIPITATION, FIELD_PRECIPCHANCE, FIELD_UV_INDEX,
+    FIELD_TEMPERATUREMAX, FIELD_TEMPERATUREMIN, FIELD_HEATINDEX, FIELD_WINDCHILL, FIELD_DISCOMFORT,
+))
+
+
+def _to_float(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class ForecastIndex:
+    """Forecast rows sorted by ``TimeUtc`` for O(log n) lookups."""
+
+    def __init__(self, rows: list[dict]) -> None:
+        """Initialize."""
+        pairs = sorted(
+            ((int(row[FIELD_VALIDTIMEUTC]), idx) for idx, row in enumerate(rows)
+             if row.get(FIELD_VALIDTIMEUTC) is not None)
+        )
+        self._times = [timestamp for timestamp, _ in pairs]
+        self._rows = [rows[idx] for _, idx in pairs]
+        # A row is valid until the next one; the last row for the usual step
+        self._step = self._times[-1] - self._times[-2] if len(self._times) > 1 else 0
+
+    def row_at(self, timestamp: float) -> dict | None:
+        """Return the row valid at a time, None outside the forecast."""
+        idx = bisect_right(self._times, timestamp) - 1
+        if idx < 0 or (idx == len(self._times) - 1 and timestamp >= self._times[idx] + self._step):
+            return None
+        return self._rows[idx]
+
+    def interpolate(self, timestamp: float) -> dict | None:
+        """Return a row with the continuous fields interpolated linearly to a time."""
+        idx = bisect_right(self._times, timestamp)
+        if idx == 0 or (idx == len(self._times) and timestamp > self._times[-1]):
+            return None
+        before = self._rows[idx - 1]
+        if timestamp == self._times[idx - 1]:
+            return dict(before)
+        after = self._rows[idx]
+        ratio = (timestamp - self._times[idx - 1]) / (self._times[idx] - self._times[idx - 1])
+        row = dict(before if ratio < 0.5 else after)
+        for field in CONTINUOUS_FIELDS.intersection(before):
+            start, end = _to_float(before.get(field)), _to_float(after.get(field))
+            if start is not None and end is not None:
+                row[field] = round(start + (end - start) * ratio, 1)
+        row[FIELD_VALIDTIMEUTC] = str(int(timestamp))
+        return row
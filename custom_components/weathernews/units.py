@@ -0,0 +1,128 @@
+"""Conversion of the metric kr-weathernews payload to US customary units.
+
+kr-weathernews only answers in metric. For non-metric installs the numeric
+columns of the current, hourly and daily data are converted once per update,
+column by column, so the entities report native imperial values.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from .const import (
+    FIELD_DEW_POINT,
+    FIELD_FEELS_LIKE,
+    FIELD_HEATINDEX,
+    FIELD_PRECIPITATION,
+    FIELD_PRESSURE,
+    FIELD_TEMP,
+    FIELD_TEMPERATUREMAX,
+    FIELD_TEMPERATUREMIN,
+    FIELD_VISIBILITY,
+    FIELD_WINDCHILL,
+    FIELD_WINDGUST,
+    FIELD_WINDSPEED,
+)
+
+MM_PER_INCH = 25.4
+KM_PER_MILE = 1.609344
+MBAR_PER_INHG = 33.8639
+
+
+def _fahrenheit(value: float) -> float:
+    return round(value * 1.8 + 32, 1)
+
+
+def _fahrenheit_delta(value: float) -> float:
+    return round(value * 1.8, 1)
+
+
+def _inches(value: float) -> float:
+    return round(value / MM_PER_INCH, 2)
+
+
+def _miles(value: float) -> float:
+    return round(value / KM_PER_MILE, 1)
+
+
+def _inhg(value: float) -> float:
+    return round(value / MBAR_PER_INHG, 2)
+
+
+TEMPERATURE_FIELDS = (
+    FIELD_TEMP, FIELD_FEELS_LIKE, FIELD_DEW_POINT, FIELD_TEMPERATUREMAX, FIELD_TEMPERATUREMIN,
+    FIELD_HEATINDEX, FIELD_WINDCHILL,
+)
+
+# Columns of the current, hourly and daily rows
+ROW_CONVERSIONS: dict[str, Callable[[float], float]] = {
+    **{field: _fahrenheit for field in TEMPERATURE_FIELDS},
+    FIELD_PRECIPITATION: _inches,
+    FIELD_WINDSPEED: _miles,
+    FIELD_WINDGUST: _miles,
+    FIELD_VISIBILITY: _miles,
+    FIELD_PRESSURE: _inhg,
+}
+
+# Derived current fields, changes convert without the offset
+CURRENT_CONVERSIONS: dict[str, Callable[[float], float]] = {
+    **ROW_CONVERSIONS,
+    'heatindexPeakToday': _fahrenheit,
+    'heatindexPeakTomorrow': _fahrenheit,
+    'tempdiff': _fahrenheit_delta,
+    'tempRate': _fahrenheit_delta,
+    'pressureTendency': _inhg,
+}
+
+# Attribute dicts of the current data: key -> fields
+PRECIP_ATTR_CONVERSIONS = {'prec': _inches, 'sum_prec': _inches, 'end_sum_prec': _inches}
+ATTR_CONVERSIONS: dict[str, dict[str, Callable[[float], float]]] = {
+    'heatindexAttr': {FIELD_HEATINDEX: _fahrenheit},
+    'heatindexPeakTodayAttr': {FIELD_HEATINDEX: _fahrenheit},
+    'heatindexPeakTomorrowAttr': {FIELD_HEATINDEX: _fahrenheit},
+    'tempRateAttr': {'change': _fahrenheit_delta},
+    **{
+        f'precipHour{window}Attr': PRECIP_ATTR_CONVERSIONS
+        for window in ('Today', 'Tomorrow', 3, 6, 9, 12)
+    },
+}
+
+
+def _to_float(value: Any) -> float | None:
+    if isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def convert_columns(
+        rows: list[dict], conversions: dict[str, Callable[[float], float]], done: set | None = None
+) -> None:
+    """Convert the given columns of the rows in place, one column at a time.
+
+    ``done`` collects (row id, field) so a row reachable twice, e.g. an
+    hourly row reused as a rain forecast attribute, converts only once.
+    """
+    for field, convert in conversions.items():
+        for row in rows:
+            if field not in row or (value := _to_float(row[field])) is None:
+                continue
+            if done is not None:
+                if (id(row), field) in done:
+                    continue
+                done.add((id(row), field))
+            row[field] = convert(value)
+
+
+def to_imperial(current: dict, hourly: list[dict], daily: list[dict]) -> None:
+    """Convert a fully derived metric dataset to imperial units in place."""
+    done = set()
+    convert_columns(hourly, ROW_CONVERSIONS, done)
+    convert_columns(daily, ROW_CONVERSIONS, done)
+    convert_columns([current], {
+        field: convert for field, convert in CURRENT_CONVERSIONS.items() if dict.__contains__(current, field)
+    }, done)
+    for key, conversions in ATTR_CONVERSIONS.items():
+        if isinstance(attr := dict.get(current, key), dict):
+            convert_columns([attr], conversions, done)
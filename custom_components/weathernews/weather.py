@@ -4,11 +4,10 @@ For more details about this platform, please refer to the documentation at
 https://github.com/jaydeethree/Home-Assistant-weatherdotcom
 """
 
-from . import WeatherUpdateCoordinator
+from .coordinator import WeatherUpdateCoordinator
 from homeassistant.config_entries import ConfigEntry
 
 from homeassistant.components.weather import (
-    ATTR_CONDITION_CLEAR_NIGHT,
     ATTR_CONDITION_SUNNY
 )
 from .const import (
@@ -19,13 +18,14 @@ from .const import (
     SPEEDUNIT,
     PRESSUREUNIT,
 
-    FIELD_CLOUD_COVER,
     FIELD_DEW_POINT,
     FIELD_FEELS_LIKE,
+    FIELD_HEATINDEX,
+    FIELD_WINDCHILL,
+    FIELD_DISCOMFORT,
     FIELD_HUMIDITY,
     FIELD_HUMIDITY_HOURLY,
     FIELD_ICONCODE,
-    FIELD_ICONCODE_DAILY,
     FIELD_ICONCODE_AM,
     FIELD_ICONCODE_PM,
     FIELD_DAYORNIGHT,
@@ -40,24 +40,23 @@ from .const import (
     FIELD_VISIBILITY,
     FIELD_WINDDIR,
     FIELD_WINDDIRECTIONCARDINAL,
-    FIELD_WINDGUST,
     FIELD_WINDSPEED,
     
-    RESULTS_CURRENT,
     RESULTS_FORECAST_DAILY,
-    RESULTS_FORECAST_HOURLY,
-    ICON_CONDITION_MAP
+    ICON_CONDITION_MAP,
+
+    ATTR_FORECAST_HEAT_INDEX,
+    ATTR_FORECAST_WIND_CHILL,
+    ATTR_FORECAST_DISCOMFORT_INDEX
 )
 
 import logging
 
 from homeassistant.components.weather import (
-    ATTR_FORECAST_CLOUD_COVERAGE,
     ATTR_FORECAST_CONDITION,
     ATTR_FORECAST_HUMIDITY,
     ATTR_FORECAST_NATIVE_APPARENT_TEMP,
     ATTR_FORECAST_NATIVE_DEW_POINT,
-    ATTR_FORECAST_NATIVE_WIND_GUST_SPEED,
     ATTR_FORECAST_PRECIPITATION,
     ATTR_FORECAST_PRECIPITATION_PROBABILITY,
     ATTR_FORECAST_TEMP,
@@ -315,7 +314,7 @@ class WeatherNewsForecast(WeatherNews):
         """Return the hourly forecast in native units."""
 
         forecast = []
-        for data in self.coordinator.data[RESULTS_FORECAST_HOURLY]:
+        for data in self.coordinator.get_hourly_forecast():
             
             iconcode = self.coordinator.get_forecast(FIELD_ICONCODE, data)
             if self.coordinator.get_forecast(FIELD_DAYORNIGHT, data) == 'N' and iconcode in ICON_CONDITION_MAP[ATTR_CONDITION_SUNNY]:
@@ -350,6 +349,12 @@ class WeatherNewsForecast(WeatherNews):
                 ATTR_FORECAST_WIND_BEARING:
                     self.coordinator.get_forecast(FIELD_WINDDIRECTIONCARDINAL, data),
                 ATTR_FORECAST_WIND_SPEED:
-                    self.coordinator.get_forecast(FIELD_WINDSPEED, data)
+                    self.coordinator.get_forecast(FIELD_WINDSPEED, data),
+                ATTR_FORECAST_HEAT_INDEX:
+                    self.coordinator.get_forecast(FIELD_HEATINDEX, data),
+                ATTR_FORECAST_WIND_CHILL:
+                    self.coordinator.get_forecast(FIELD_WINDCHILL, data),
+                ATTR_FORECAST_DISCOMFORT_INDEX:
+                    self.coordinator.get_forecast(FIELD_DISCOMFORT, data)
             }))
         return forecast
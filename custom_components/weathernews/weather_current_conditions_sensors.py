@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from typing import Callable, Any, cast
 
 from .const import (
@@ -19,11 +20,16 @@ from .const import (
     ICON_THERMOMETER,
     ICON_UMBRELLA,
     ICON_WIND,
-    RESULTS_CURRENT
+    RESULTS_CURRENT,
+    GROUP_FORECAST,
+    GROUP_SUMMARY,
+    GROUP_AIR,
+    GROUP_PM_FORECAST,
+    GROUP_BRIEFING
 )
 from homeassistant.components.sensor import SensorEntityDescription, SensorDeviceClass, SensorStateClass
 from homeassistant.const import PERCENTAGE, UV_INDEX, DEGREE, UnitOfLength, UnitOfTemperature, \
-    UnitOfVolumetricFlux, UnitOfPressure, UnitOfSpeed, CONCENTRATION_MICROGRAMS_PER_CUBIC_METER
+    UnitOfVolumetricFlux, UnitOfPressure, UnitOfSpeed, CONCENTRATION_MICROGRAMS_PER_CUBIC_METER, EntityCategory
 from homeassistant.helpers.typing import StateType
 
 
@@ -40,347 +46,500 @@ class WeatherSensorEntityDescription(
     # attr_fn: Callable[[dict[str, Any]], dict[str, StateType]] = lambda _: {}
     unit_fn: Callable[[bool], str | None] = lambda _: None
     attr_key: Callable[[list], Any | None] = lambda _: None 
+    group: str | None = None
     """Describes Weather.com Sensor entity."""
 
 
-current_condition_sensor_descriptions = [
-    WeatherSensorEntityDescription(
-        key=FIELD_VALIDTIMELOCAL,
-        name="Local Observation Time",
-        icon="mdi:clock",
-        value_fn=lambda data, _: cast(str, data),
-    ),
-    # WeatherSensorEntityDescription(
-    #     key=FIELD_DESCRIPTION,
-    #     name="Weather Description",
-    #     icon="mdi:note-text",
-    #     value_fn=lambda data, _: cast(str, data),
-    # ),
-    WeatherSensorEntityDescription(
-        key=FIELD_HUMIDITY,
-        name="Relative Humidity",
-        icon="mdi:water-percent",
-        device_class=SensorDeviceClass.HUMIDITY,
-        state_class=SensorStateClass.MEASUREMENT,
-        unit_fn=lambda _: PERCENTAGE,
-        value_fn=lambda data, _: cast(int, data) or 0,
-    ),
-    WeatherSensorEntityDescription(
-        key=FIELD_UV_INDEX,
-        name="UV Index",
-        icon="mdi:sunglasses",
-        state_class=SensorStateClass.MEASUREMENT,
-        unit_fn=lambda _: UV_INDEX,
-        value_fn=lambda data, _: cast(int, data) or 0,
-    ),
-    # WeatherSensorEntityDescription(
-    #     key=FIELD_WINDDIR,
-    #     name="Wind Direction - Degrees",
-    #     icon=ICON_WIND,
-    #     state_class=SensorStateClass.MEASUREMENT,
-    #     unit_fn=lambda _: DEGREE,
-    #     value_fn=lambda data, _: cast(int, data) or 0,
-    # ),
-    WeatherSensorEntityDescription(
-        key=FIELD_WINDDIRECTIONCARDINAL,
-        name="Wind Direction - Cardinal",
-        icon="mdi:windsock",
-        unit_fn=lambda _: None,
-        value_fn=lambda data, _: cast(str, data) or "",
-    ),
-    WeatherSensorEntityDescription(
-        key=FIELD_DEW_POINT,
-        name="Dewpoint",
-        icon="mdi:water",
-        state_class=SensorStateClass.MEASUREMENT,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        unit_fn=lambda metric: UnitOfTemperature.CELSIUS if metric else UnitOfTemperature.FAHRENHEIT,
-        value_fn=lambda data, _: cast(float, data),
-    ),
-    WeatherSensorEntityDescription(
-        key=FIELD_FEELS_LIKE,
-        name="Temperature - Feels Like",
-        icon=ICON_THERMOMETER,
-        state_class=SensorStateClass.MEASUREMENT,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        unit_fn=lambda metric: UnitOfTemperature.CELSIUS if metric else UnitOfTemperature.FAHRENHEIT,
-        value_fn=lambda data, _: cast(float, data),
-    ),
-    WeatherSensorEntityDescription(
-        key=FIELD_TEMP,
-        name="Temperature",
-        icon=ICON_THERMOMETER,
-        state_class=SensorStateClass.MEASUREMENT,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        unit_fn=lambda metric: UnitOfTemperature.CELSIUS if metric else UnitOfTemperature.FAHRENHEIT,
-        value_fn=lambda data, _: cast(float, data),
-        attr_key=['tmin','tmax'],
-    ),
-    # WeatherSensorEntityDescription(
-    #     key="tmax",
-    #     name="Max Temperature",
-    #     icon=ICON_THERMOMETER,
-    #     state_class=SensorStateClass.MEASUREMENT,
-    #     device_class=SensorDeviceClass.TEMPERATURE,
-    #     unit_fn=lambda metric: UnitOfTemperature.CELSIUS if metric else UnitOfTemperature.FAHRENHEIT,
-    #     value_fn=lambda data, _: cast(float, data),
-    # ),
-    # WeatherSensorEntityDescription(
-    #     key="tmin",
-    #     name="Min Temperature",
-    #     icon=ICON_THERMOMETER,
-    #     state_class=SensorStateClass.MEASUREMENT,
-    #     device_class=SensorDeviceClass.TEMPERATURE,
-    #     unit_fn=lambda metric: UnitOfTemperature.CELSIUS if metric else UnitOfTemperature.FAHRENHEIT,
-    #     value_fn=lambda data, _: cast(float, data),
-    # ),
-    WeatherSensorEntityDescription(
-        key="heatindex",
-        name="Heat Index",
-        icon=ICON_THERMOMETER,
-        state_class=SensorStateClass.MEASUREMENT,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        unit_fn=lambda metric: UnitOfTemperature.CELSIUS if metric else UnitOfTemperature.FAHRENHEIT,
-        value_fn=lambda data, _: cast(float, data),
-        attr_key=['heatindexAttr'],
-    ),
-    # WeatherSensorEntityDescription(
-    #     key="temperatureWindChill",
-    #     name="Wind Chill",
-    #     icon=ICON_THERMOMETER,
-    #     state_class=SensorStateClass.MEASUREMENT,
-    #     device_class=SensorDeviceClass.TEMPERATURE,
-    #     unit_fn=lambda metric: UnitOfTemperature.CELSIUS if metric else UnitOfTemperature.FAHRENHEIT,
-    #     value_fn=lambda data, _: cast(float, data),
-    # ),
-    # WeatherSensorEntityDescription(
-    #     key="precip1Hour",
-    #     name="Precipitation - Last hour",
-    #     icon=ICON_UMBRELLA,
-    #     state_class=SensorStateClass.MEASUREMENT,
-    #     device_class=SensorDeviceClass.PRECIPITATION,
-    #     unit_fn=lambda metric: UnitOfLength.MILLIMETERS if metric else UnitOfLength.INCHES,
-    #     value_fn=lambda data, _: cast(float, data) or 0,
-    # ),
-    WeatherSensorEntityDescription(
-        key="pop",
-        name="Precipitation Probability",
-        icon=ICON_UMBRELLA,
-        state_class=SensorStateClass.MEASUREMENT,
-        unit_fn=lambda _: PERCENTAGE,
-        value_fn=lambda data, _: cast(int, data) or None,
-        attr_key=['prec'],
-    ),
-    # WeatherSensorEntityDescription(
-    #     key="precip6Hour",
-    #     name="Precipitation - Last 6 hours",
-    #     icon=ICON_UMBRELLA,
-    #     state_class=SensorStateClass.MEASUREMENT,
-    #     device_class=SensorDeviceClass.PRECIPITATION,
-    #     unit_fn=lambda metric: UnitOfLength.MILLIMETERS if metric else UnitOfLength.INCHES,
-    #     value_fn=lambda data, _: cast(int, data) or None,
-    #     attr_key=['precip6HourAttr'],
-    # ),
-    # WeatherSensorEntityDescription(
-    #     key="precip12Hour",
-    #     name="Precipitation - Last 12 hours",
-    #     icon=ICON_UMBRELLA,
-    #     state_class=SensorStateClass.MEASUREMENT,
-    #     device_class=SensorDeviceClass.PRECIPITATION,
-    #     unit_fn=lambda metric: UnitOfLength.MILLIMETERS if metric else UnitOfLength.INCHES,
-    #     value_fn=lambda data, _: cast(int, data) or None,
-    #     attr_key=['precip12HourAttr'],
-    # ),
-    WeatherSensorEntityDescription(
-        key=FIELD_PRESSURE,
-        name="Pressure",
-        icon="mdi:gauge",
-        state_class=SensorStateClass.MEASUREMENT,
-        device_class=SensorDeviceClass.PRESSURE,
-        unit_fn=lambda metric: UnitOfPressure.MBAR if metric else UnitOfPressure.INHG,
-        value_fn=lambda data, _: cast(float, data),
-    ),
-    # WeatherSensorEntityDescription(
-    #     key=FIELD_WINDGUST,
-    #     name="Wind Gust",
-    #     icon=ICON_WIND,
-    #     state_class=SensorStateClass.MEASUREMENT,
-    #     device_class=SensorDeviceClass.WIND_SPEED,
-    #     unit_fn=lambda metric: UnitOfSpeed.KILOMETERS_PER_HOUR if metric else UnitOfSpeed.MILES_PER_HOUR,
-    #     value_fn=lambda data, _: cast(float, data),
-    # ),
-    WeatherSensorEntityDescription(
-        key=FIELD_WINDSPEED,
-        name="Wind Speed",
-        icon=ICON_WIND,
-        state_class=SensorStateClass.MEASUREMENT,
-        device_class=SensorDeviceClass.WIND_SPEED,
-        unit_fn=lambda metric: UnitOfSpeed.KILOMETERS_PER_HOUR if metric else UnitOfSpeed.MILES_PER_HOUR,
-        value_fn=lambda data, _: cast(float, data),
-    ),
-    # WeatherSensorEntityDescription(
-    #     key="cloudCeiling",
-    #     name="Cloud Ceiling",
-    #     icon="mdi:clouds",
-    #     state_class=SensorStateClass.MEASUREMENT,
-    #     device_class=SensorDeviceClass.DISTANCE,
-    #     unit_fn=lambda metric: UnitOfLength.METERS if metric else UnitOfLength.FEET,
-    #     value_fn=lambda data, _: cast(int, data) or 0,
-    # ),
-    # WeatherSensorEntityDescription(
-    #     key="pressureTendencyTrend",
-    #     name="Pressure Tendency Trend",
-    #     icon="mdi:gauge",
-    #     value_fn=lambda data, _: cast(str, data),
-    # ),
-    # WeatherSensorEntityDescription(
-    #     key="cloudCoverPhrase",
-    #     name="Cloud Cover Phrase",
-    #     icon="mdi:clouds",
-    #     value_fn=lambda data, _: cast(str, data),
-    # ),
-    WeatherSensorEntityDescription(
-        key="sunrise",
-        name="Sunrise",
-        icon="mdi:weather-sunset-up",
-        value_fn=lambda data, _: cast(str, data),
-    ),
-    WeatherSensorEntityDescription(
-        key="sunset",
-        name="Sunset",
-        icon="mdi:weather-sunset",
-        value_fn=lambda data, _: cast(str, data),
-    ),
-    WeatherSensorEntityDescription(
-        key="pm10",
-        name="PM10",
-        icon="mdi:blur",
-        unit_fn=lambda metric: CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-        value_fn=lambda data, _: cast(float, data),
-        attr_key=['pm10Attr'],
-    ),
-    WeatherSensorEntityDescription(
-        key="pm25",
-        name="PM2.5",
-        icon="mdi:blur-linear",
-        unit_fn=lambda metric: CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-        value_fn=lambda data, _: cast(float, data),
-        attr_key=['pm25Attr'],
-    ),
-    WeatherSensorEntityDescription(
-        key="pm10Desc",
-        name="PM10 description",
-        icon="mdi:blur",
-        value_fn=lambda data, _: cast(str, data),
-    ),
-    WeatherSensorEntityDescription(
-        key="pm25Desc",
-        name="PM2.5 description",
-        icon="mdi:blur-linear",
-        value_fn=lambda data, _: cast(str, data),
-    ),
-    WeatherSensorEntityDescription(
-        key="pmForecast",
-        name="pm Forecast",
-        icon="mdi:blur",
-        unit_fn=lambda metric: CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-        value_fn=lambda data, _: cast(float, data),
-        attr_key=['pmForecastDaily','pmForecastHourly'],
-    ),
-    WeatherSensorEntityDescription(
-        key="cur_cmt",
-        name="current condition",
-        icon="mdi:cloud-question-outline",
-        value_fn=lambda data, _: cast(str, data),
-        attr_key=['day_cmt','night_cmt','dayShortCmt','nextDayShortCmt'],
-    ),
-    WeatherSensorEntityDescription(
-        key="day_cmt",
-        name="day condition",
-        icon="mdi:weather-sunny",
-        value_fn=lambda data, _: cast(str, data),
-    ),
-    WeatherSensorEntityDescription(
-        key="night_cmt",
-        name="night condition",
-        icon="mdi:weather-night",
-        value_fn=lambda data, _: cast(str, data),
-    ),
-    WeatherSensorEntityDescription(
-        key="dayShortCmt",
-        name="day Short Comment",
-        icon="mdi:comment-text-outline",
-        value_fn=lambda data, _: cast(str, data),
-    ),
-    WeatherSensorEntityDescription(
-        key="nextDayShortCmt",
-        name="next Day Short Comment",
-        icon="mdi:comment-text-outline",
-        value_fn=lambda data, _: cast(str, data),
-    ),
-    WeatherSensorEntityDescription(
-        key="tempdiffCmt",
-        name="Temp diff Comment",
-        icon="mdi:thermometer-lines",
-        value_fn=lambda data, _: cast(str, data),
-        attr_key=['tempdiff'],
-    ),
-    WeatherSensorEntityDescription(
-        key="weatherBriping",
-        name="Weather briefing",
-        icon="mdi:comment-text-outline",
-        value_fn=lambda data, _: cast(str, data),
-        attr_key=['weatherBripingAttr'],
-    ),
-    WeatherSensorEntityDescription(
-        key="khai",
-        name="CAI",
-        icon="mdi:tailwind",
-        unit_fn=lambda metric: CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-        value_fn=lambda data, _: cast(float, data),
-        # attr_fn=lambda _: {}
-        attr_key=['pm'],
-    ),
-    WeatherSensorEntityDescription(
-        key="precipHourToday",
-        name="precip Hour Today",
-        icon="mdi:weather-rainy",
-        value_fn=lambda data, _: cast(str, data),
-        attr_key=['precipHourTodayAttr'],
-    ),
-    WeatherSensorEntityDescription(
-        key="precipHourTomorrow",
-        name="precip Hour Today Tomorrow",
-        icon="mdi:weather-rainy",
-        value_fn=lambda data, _: cast(str, data),
-        attr_key=['precipHourTomorrowAttr'],
-    ),
-    WeatherSensorEntityDescription(
-        key="precipHour3",
-        name="precip 3Hour",
-        icon="mdi:weather-rainy",
-        value_fn=lambda data, _: cast(str, data),
-        attr_key=['precipHour3Attr'],
-    ),
-    WeatherSensorEntityDescription(
-        key="precipHour6",
-        name="precip 6Hour",
-        icon="mdi:weather-rainy",
-        value_fn=lambda data, _: cast(str, data),
-        attr_key=['precipHour6Attr'],
-    ),
-    WeatherSensorEntityDescription(
-        key="precipHour9",
-        name="precip 9Hour",
-        icon="mdi:weather-rainy",
-        value_fn=lambda data, _: cast(str, data),
-        attr_key=['precipHour9Attr'],
-    ),
-    WeatherSensorEntityDescription(
-        key="precipHour12",
-        name="precip 12Hour",
-        icon="mdi:weather-rainy",
-        value_fn=lambda data, _: cast(str, data),
-        attr_key=['precipHour12Attr'],
-    ),
-]
+@lru_cache(maxsize=1)
+def get_current_condition_sensor_descriptions() -> tuple[WeatherSensorEntityDescription, ...]:
+    """Build the sensor descriptions on first use."""
+    return (
+        WeatherSensorEntityDescription(
+            key=FIELD_VALIDTIMELOCAL,
+            name="Local Observation Time",
+            icon="mdi:clock",
+            value_fn=lambda data, _: cast(str, data),
+        ),
+        # WeatherSensorEntityDescription(
+        #     key=FIELD_DESCRIPTION,
+        #     name="Weather Description",
+        #     icon="mdi:note-text",
+        #     value_fn=lambda data, _: cast(str, data),
+        # ),
+        WeatherSensorEntityDescription(
+            key=FIELD_HUMIDITY,
+            name="Relative Humidity",
+            icon="mdi:water-percent",
+            device_class=SensorDeviceClass.HUMIDITY,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_fn=lambda _: PERCENTAGE,
+            value_fn=lambda data, _: cast(int, data) or 0,
+        ),
+        WeatherSensorEntityDescription(
+            key=FIELD_UV_INDEX,
+            name="UV Index",
+            icon="mdi:sunglasses",
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_fn=lambda _: UV_INDEX,
+            value_fn=lambda data, _: cast(int, data) or 0,
+        ),
+        # WeatherSensorEntityDescription(
+        #     key=FIELD_WINDDIR,
+        #     name="Wind Direction - Degrees",
+        #     icon=ICON_WIND,
+        #     state_class=SensorStateClass.MEASUREMENT,
+        #     unit_fn=lambda _: DEGREE,
+        #     value_fn=lambda data, _: cast(int, data) or 0,
+        # ),
+        WeatherSensorEntityDescription(
+            key=FIELD_WINDDIRECTIONCARDINAL,
+            name="Wind Direction - Cardinal",
+            icon="mdi:windsock",
+            unit_fn=lambda _: None,
+            value_fn=lambda data, _: cast(str, data) or "",
+        ),
+        WeatherSensorEntityDescription(
+            key=FIELD_DEW_POINT,
+            name="Dewpoint",
+            icon="mdi:water",
+            state_class=SensorStateClass.MEASUREMENT,
+            device_class=SensorDeviceClass.TEMPERATURE,
+            unit_fn=lambda metric: UnitOfTemperature.CELSIUS if metric else UnitOfTemperature.FAHRENHEIT,
+            value_fn=lambda data, _: cast(float, data),
+        ),
+        WeatherSensorEntityDescription(
+            key=FIELD_FEELS_LIKE,
+            name="Temperature - Feels Like",
+            icon=ICON_THERMOMETER,
+            state_class=SensorStateClass.MEASUREMENT,
+            device_class=SensorDeviceClass.TEMPERATURE,
+            unit_fn=lambda metric: UnitOfTemperature.CELSIUS if metric else UnitOfTemperature.FAHRENHEIT,
+            value_fn=lambda data, _: cast(float, data),
+        ),
+        WeatherSensorEntityDescription(
+            key=FIELD_TEMP,
+            name="Temperature",
+            icon=ICON_THERMOMETER,
+            state_class=SensorStateClass.MEASUREMENT,
+            device_class=SensorDeviceClass.TEMPERATURE,
+            unit_fn=lambda metric: UnitOfTemperature.CELSIUS if metric else UnitOfTemperature.FAHRENHEIT,
+            value_fn=lambda data, _: cast(float, data),
+            attr_key=['tmin','tmax'],
+        ),
+        # WeatherSensorEntityDescription(
+        #     key="tmax",
+        #     name="Max Temperature",
+        #     icon=ICON_THERMOMETER,
+        #     state_class=SensorStateClass.MEASUREMENT,
+        #     device_class=SensorDeviceClass.TEMPERATURE,
+        #     unit_fn=lambda metric: UnitOfTemperature.CELSIUS if metric else UnitOfTemperature.FAHRENHEIT,
+        #     value_fn=lambda data, _: cast(float, data),
+        # ),
+        # WeatherSensorEntityDescription(
+        #     key="tmin",
+        #     name="Min Temperature",
+        #     icon=ICON_THERMOMETER,
+        #     state_class=SensorStateClass.MEASUREMENT,
+        #     device_class=SensorDeviceClass.TEMPERATURE,
+        #     unit_fn=lambda metric: UnitOfTemperature.CELSIUS if metric else UnitOfTemperature.FAHRENHEIT,
+        #     value_fn=lambda data, _: cast(float, data),
+        # ),
+        WeatherSensorEntityDescription(
+            key="heatindex",
+            name="Heat Index",
+            icon=ICON_THERMOMETER,
+            state_class=SensorStateClass.MEASUREMENT,
+            device_class=SensorDeviceClass.TEMPERATURE,
+            unit_fn=lambda metric: UnitOfTemperature.CELSIUS if metric else UnitOfTemperature.FAHRENHEIT,
+            value_fn=lambda data, _: cast(float, data),
+            attr_key=['heatindexAttr'],
+        ),
+        WeatherSensorEntityDescription(
+            key="heatindexPeakToday",
+            name="Heat Index Peak Today",
+            icon=ICON_THERMOMETER,
+            device_class=SensorDeviceClass.TEMPERATURE,
+            unit_fn=lambda metric: UnitOfTemperature.CELSIUS if metric else UnitOfTemperature.FAHRENHEIT,
+            value_fn=lambda data, _: cast(float, data),
+            attr_key=['heatindexPeakTodayAttr'],
+            group=GROUP_FORECAST,
+        ),
+        WeatherSensorEntityDescription(
+            key="heatindexPeakTomorrow",
+            name="Heat Index Peak Tomorrow",
+            icon=ICON_THERMOMETER,
+            device_class=SensorDeviceClass.TEMPERATURE,
+            unit_fn=lambda metric: UnitOfTemperature.CELSIUS if metric else UnitOfTemperature.FAHRENHEIT,
+            value_fn=lambda data, _: cast(float, data),
+            attr_key=['heatindexPeakTomorrowAttr'],
+            group=GROUP_FORECAST,
+        ),
+        # WeatherSensorEntityDescription(
+        #     key="temperatureWindChill",
+        #     name="Wind Chill",
+        #     icon=ICON_THERMOMETER,
+        #     state_class=SensorStateClass.MEASUREMENT,
+        #     device_class=SensorDeviceClass.TEMPERATURE,
+        #     unit_fn=lambda metric: UnitOfTemperature.CELSIUS if metric else UnitOfTemperature.FAHRENHEIT,
+        #     value_fn=lambda data, _: cast(float, data),
+        # ),
+        # WeatherSensorEntityDescription(
+        #     key="precip1Hour",
+        #     name="Precipitation - Last hour",
+        #     icon=ICON_UMBRELLA,
+        #     state_class=SensorStateClass.MEASUREMENT,
+        #     device_class=SensorDeviceClass.PRECIPITATION,
+        #     unit_fn=lambda metric: UnitOfLength.MILLIMETERS if metric else UnitOfLength.INCHES,
+        #     value_fn=lambda data, _: cast(float, data) or 0,
+        # ),
+        WeatherSensorEntityDescription(
+            key="pop",
+            name="Precipitation Probability",
+            icon=ICON_UMBRELLA,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_fn=lambda _: PERCENTAGE,
+            value_fn=lambda data, _: cast(int, data) or None,
+            attr_key=['prec'],
+        ),
+        # WeatherSensorEntityDescription(
+        #     key="precip6Hour",
+        #     name="Precipitation - Last 6 hours",
+        #     icon=ICON_UMBRELLA,
+        #     state_class=SensorStateClass.MEASUREMENT,
+        #     device_class=SensorDeviceClass.PRECIPITATION,
+        #     unit_fn=lambda metric: UnitOfLength.MILLIMETERS if metric else UnitOfLength.INCHES,
+        #     value_fn=lambda data, _: cast(int, data) or None,
+        #     attr_key=['precip6HourAttr'],
+        # ),
+        # WeatherSensorEntityDescription(
+        #     key="precip12Hour",
+        #     name="Precipitation - Last 12 hours",
+        #     icon=ICON_UMBRELLA,
+        #     state_class=SensorStateClass.MEASUREMENT,
+        #     device_class=SensorDeviceClass.PRECIPITATION,
+        #     unit_fn=lambda metric: UnitOfLength.MILLIMETERS if metric else UnitOfLength.INCHES,
+        #     value_fn=lambda data, _: cast(int, data) or None,
+        #     attr_key=['precip12HourAttr'],
+        # ),
+        WeatherSensorEntityDescription(
+            key=FIELD_PRESSURE,
+            name="Pressure",
+            icon="mdi:gauge",
+            state_class=SensorStateClass.MEASUREMENT,
+            device_class=SensorDeviceClass.PRESSURE,
+            unit_fn=lambda metric: UnitOfPressure.MBAR if metric else UnitOfPressure.INHG,
+            value_fn=lambda data, _: cast(float, data),
+        ),
+        # WeatherSensorEntityDescription(
+        #     key=FIELD_WINDGUST,
+        #     name="Wind Gust",
+        #     icon=ICON_WIND,
+        #     state_class=SensorStateClass.MEASUREMENT,
+        #     device_class=SensorDeviceClass.WIND_SPEED,
+        #     unit_fn=lambda metric: UnitOfSpeed.KILOMETERS_PER_HOUR if metric else UnitOfSpeed.MILES_PER_HOUR,
+        #     value_fn=lambda data, _: cast(float, data),
+        # ),
+        WeatherSensorEntityDescription(
+            key=FIELD_WINDSPEED,
+            name="Wind Speed",
+            icon=ICON_WIND,
+            state_class=SensorStateClass.MEASUREMENT,
+            device_class=SensorDeviceClass.WIND_SPEED,
+            unit_fn=lambda metric: UnitOfSpeed.KILOMETERS_PER_HOUR if metric else UnitOfSpeed.MILES_PER_HOUR,
+            value_fn=lambda data, _: cast(float, data),
+        ),
+        # WeatherSensorEntityDescription(
+        #     key="cloudCeiling",
+        #     name="Cloud Ceiling",
+        #     icon="mdi:clouds",
+        #     state_class=SensorStateClass.MEASUREMENT,
+        #     device_class=SensorDeviceClass.DISTANCE,
+        #     unit_fn=lambda metric: UnitOfLength.METERS if metric else UnitOfLength.FEET,
+        #     value_fn=lambda data, _: cast(int, data) or 0,
+        # ),
+        WeatherSensorEntityDescription(
+            key="pressureTendency",
+            name="Pressure Tendency",
+            icon="mdi:gauge",
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_fn=lambda metric: UnitOfPressure.MBAR if metric else UnitOfPressure.INHG,
+            value_fn=lambda data, _: cast(float, data),
+            attr_key=['pressureTendencyAttr'],
+        ),
+        WeatherSensorEntityDescription(
+            key="pressureTendencyTrend",
+            name="Pressure Tendency Trend",
+            icon="mdi:gauge",
+            value_fn=lambda data, _: cast(str, data),
+        ),
+        WeatherSensorEntityDescription(
+            key="tempRate",
+            name="Temperature Rate",
+            icon="mdi:thermometer-chevron-up",
+            state_class=SensorStateClass.MEASUREMENT,
+            unit_fn=lambda metric: f"{UnitOfTemperature.CELSIUS if metric else UnitOfTemperature.FAHRENHEIT}/h",
+            value_fn=lambda data, _: cast(float, data),
+            attr_key=['tempRateAttr'],
+        ),
+        WeatherSensorEntityDescription(
+            key="pm10Trend",
+            name="PM Trend",
+            icon="mdi:blur",
+            value_fn=lambda data, _: cast(str, data),
+            attr_key=['pm10TrendAttr'],
+        ),
+        # WeatherSensorEntityDescription(
+        #     key="cloudCoverPhrase",
+        #     name="Cloud Cover Phrase",
+        #     icon="mdi:clouds",
+        #     value_fn=lambda data, _: cast(str, data),
+        # ),
+        WeatherSensorEntityDescription(
+            key="sunrise",
+            name="Sunrise",
+            icon="mdi:weather-sunset-up",
+            value_fn=lambda data, _: cast(str, data),
+        ),
+        WeatherSensorEntityDescription(
+            key="sunset",
+            name="Sunset",
+            icon="mdi:weather-sunset",
+            value_fn=lambda data, _: cast(str, data),
+        ),
+        WeatherSensorEntityDescription(
+            key="pm10",
+            name="PM10",
+            icon="mdi:blur",
+            unit_fn=lambda metric: CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+            value_fn=lambda data, _: cast(float, data),
+            attr_key=['pm10Attr'],
+        ),
+        WeatherSensorEntityDescription(
+            key="pm25",
+            name="PM2.5",
+            icon="mdi:blur-linear",
+            unit_fn=lambda metric: CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+            value_fn=lambda data, _: cast(float, data),
+            attr_key=['pm25Attr'],
+        ),
+        WeatherSensorEntityDescription(
+            key="pm10Desc",
+            name="PM10 description",
+            icon="mdi:blur",
+            value_fn=lambda data, _: cast(str, data),
+            group=GROUP_SUMMARY,
+        ),
+        WeatherSensorEntityDescription(
+            key="pm25Desc",
+            name="PM2.5 description",
+            icon="mdi:blur-linear",
+            value_fn=lambda data, _: cast(str, data),
+            group=GROUP_SUMMARY,
+        ),
+        WeatherSensorEntityDescription(
+            key="pmForecast",
+            name="pm Forecast",
+            icon="mdi:blur",
+            unit_fn=lambda metric: CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+            value_fn=lambda data, _: cast(float, data),
+            attr_key=['pmForecastDaily','pmForecastHourly'],
+            group=GROUP_PM_FORECAST,
+        ),
+        WeatherSensorEntityDescription(
+            key="cur_cmt",
+            name="current condition",
+            icon="mdi:cloud-question-outline",
+            value_fn=lambda data, _: cast(str, data),
+            attr_key=['day_cmt','night_cmt','dayShortCmt','nextDayShortCmt'],
+            group=GROUP_SUMMARY,
+        ),
+        WeatherSensorEntityDescription(
+            key="day_cmt",
+            name="day condition",
+            icon="mdi:weather-sunny",
+            value_fn=lambda data, _: cast(str, data),
+            group=GROUP_SUMMARY,
+        ),
+        WeatherSensorEntityDescription(
+            key="night_cmt",
+            name="night condition",
+            icon="mdi:weather-night",
+            value_fn=lambda data, _: cast(str, data),
+            group=GROUP_SUMMARY,
+        ),
+        WeatherSensorEntityDescription(
+            key="dayShortCmt",
+            name="day Short Comment",
+            icon="mdi:comment-text-outline",
+            value_fn=lambda data, _: cast(str, data),
+            group=GROUP_SUMMARY,
+        ),
+        WeatherSensorEntityDescription(
+            key="nextDayShortCmt",
+            name="next Day Short Comment",
+            icon="mdi:comment-text-outline",
+            value_fn=lambda data, _: cast(str, data),
+            group=GROUP_SUMMARY,
+        ),
+        WeatherSensorEntityDescription(
+            key="tempdiffCmt",
+            name="Temp diff Comment",
+            icon="mdi:thermometer-lines",
+            value_fn=lambda data, _: cast(str, data),
+            attr_key=['tempdiff'],
+            group=GROUP_AIR,
+        ),
+        WeatherSensorEntityDescription(
+            key="weatherBriping",
+            name="Weather briefing",
+            icon="mdi:comment-text-outline",
+            value_fn=lambda data, _: cast(str, data),
+            attr_key=['weatherBripingAttr'],
+            group=GROUP_BRIEFING,
+        ),
+        WeatherSensorEntityDescription(
+            key="khai",
+            name="CAI",
+            icon="mdi:tailwind",
+            unit_fn=lambda metric: CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+            value_fn=lambda data, _: cast(float, data),
+            # attr_fn=lambda _: {}
+            attr_key=['pm'],
+            group=GROUP_AIR,
+        ),
+        WeatherSensorEntityDescription(
+            key="precipHourToday",
+            name="precip Hour Today",
+            icon="mdi:weather-rainy",
+            value_fn=lambda data, _: cast(str, data),
+            attr_key=['precipHourTodayAttr'],
+            group=GROUP_FORECAST,
+        ),
+        WeatherSensorEntityDescription(
+            key="precipHourTomorrow",
+            name="precip Hour Today Tomorrow",
+            icon="mdi:weather-rainy",
+            value_fn=lambda data, _: cast(str, data),
+            attr_key=['precipHourTomorrowAttr'],
+            group=GROUP_FORECAST,
+        ),
+        WeatherSensorEntityDescription(
+            key="precipHour3",
+            name="precip 3Hour",
+            icon="mdi:weather-rainy",
+            value_fn=lambda data, _: cast(str, data),
+            attr_key=['precipHour3Attr'],
+            group=GROUP_FORECAST,
+        ),
+        WeatherSensorEntityDescription(
+            key="precipHour6",
+            name="precip 6Hour",
+            icon="mdi:weather-rainy",
+            value_fn=lambda data, _: cast(str, data),
+            attr_key=['precipHour6Attr'],
+            group=GROUP_FORECAST,
+        ),
+        WeatherSensorEntityDescription(
+            key="precipHour9",
+            name="precip 9Hour",
+            icon="mdi:weather-rainy",
+            value_fn=lambda data, _: cast(str, data),
+            attr_key=['precipHour9Attr'],
+            group=GROUP_FORECAST,
+        ),
+        WeatherSensorEntityDescription(
+            key="precipHour12",
+            name="precip 12Hour",
+            icon="mdi:weather-rainy",
+            value_fn=lambda data, _: cast(str, data),
+            attr_key=['precipHour12Attr'],
+            group=GROUP_FORECAST,
+        ),
+        WeatherSensorEntityDescription(
+            key="requestsToday",
+            name="Requests Today",
+            icon="mdi:counter",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            value_fn=lambda data, _: cast(int, data),
+            attr_key=['requestsTodayAttr'],
+        ),
+        WeatherSensorEntityDescription(
+            key="forecastTempMae",
+            name="Forecast Temperature Error",
+            icon="mdi:thermometer-check",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            state_class=SensorStateClass.MEASUREMENT,
+            value_fn=lambda data, _: cast(float, data),
+            unit_fn=lambda metric: UnitOfTemperature.CELSIUS if metric else UnitOfTemperature.FAHRENHEIT,
+            attr_key=['forecastTempMaeAttr'],
+        ),
+        WeatherSensorEntityDescription(
+            key="forecastPopBrier",
+            name="Forecast Precipitation Chance Brier Score",
+            icon="mdi:umbrella-outline",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            state_class=SensorStateClass.MEASUREMENT,
+            value_fn=lambda data, _: cast(float, data),
+            attr_key=['forecastPopBrierAttr'],
+        ),
+        WeatherSensorEntityDescription(
+            key="forecastRainHitRate",
+            name="Forecast Rain Start Hit Rate",
+            icon="mdi:weather-pouring",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            state_class=SensorStateClass.MEASUREMENT,
+            value_fn=lambda data, _: cast(int, data),
+            unit_fn=lambda _: PERCENTAGE,
+            attr_key=['forecastRainHitRateAttr'],
+        ),
+        WeatherSensorEntityDescription(
+            key="forecastTmaxMae",
+            name="Forecast High Temperature Error",
+            icon="mdi:thermometer-chevron-up",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            state_class=SensorStateClass.MEASUREMENT,
+            value_fn=lambda data, _: cast(float, data),
+            unit_fn=lambda metric: UnitOfTemperature.CELSIUS if metric else UnitOfTemperature.FAHRENHEIT,
+            attr_key=['forecastTmaxMaeAttr'],
+        ),
+        WeatherSensorEntityDescription(
+            key="forecastTminMae",
+            name="Forecast Low Temperature Error",
+            icon="mdi:thermometer-chevron-down",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            state_class=SensorStateClass.MEASUREMENT,
+            value_fn=lambda data, _: cast(float, data),
+            unit_fn=lambda metric: UnitOfTemperature.CELSIUS if metric else UnitOfTemperature.FAHRENHEIT,
+            attr_key=['forecastTminMaeAttr'],
+        ),
+    )
+
+
+# Compact profile: sensor key -> current fields shown as its attributes
+COMPACT_SENSORS = {
+    FIELD_TEMP: [
+        'tmin', 'tmax', FIELD_FEELS_LIKE, FIELD_HUMIDITY, FIELD_DEW_POINT, FIELD_UV_INDEX, 'heatindex',
+        'heatindexPeakToday', 'heatindexPeakTomorrow', 'tempdiffCmt', 'tempRate', 'pressureTendencyTrend',
+        'sunrise', 'sunset', FIELD_VALIDTIMELOCAL,
+    ],
+    'pm10': ['pm10Desc', 'pm25', 'pm25Desc', 'khai', 'pm10Trend', 'pmForecast'],
+    'cur_cmt': ['day_cmt', 'night_cmt', 'dayShortCmt', 'nextDayShortCmt'],
+    'precipHour12': [
+        'precipHour12Attr', 'pop', 'precipHourToday', 'precipHourTomorrow', 'precipHour3', 'precipHour6',
+        'precipHour9',
+    ],
+    'weatherBriping': ['weatherBripingAttr'],
+    'requestsToday': ['requestsTodayAttr'],
+    'forecastTempMae': ['forecastPopBrier', 'forecastRainHitRate', 'forecastTmaxMae', 'forecastTminMae'],
+}
+
+
+@lru_cache(maxsize=1)
+def get_compact_sensor_descriptions() -> tuple[WeatherSensorEntityDescription, ...]:
+    """Build the few consolidated sensors of the compact profile."""
+    return tuple(
+        replace(description, attr_key=COMPACT_SENSORS[description.key])
+        for description in get_current_condition_sensor_descriptions()
+        if description.key in COMPACT_SENSORS
+    )
@@ -0,0 +1,9 @@
+"""Make the integration importable as ``custom_components.weathernews``."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+_ROOT = str(Path(__file__).parents[1])
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
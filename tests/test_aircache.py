@@ -0,0 +1,124 @@
+"""Tests for the shared air quality cache."""
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.weathernews import aircache  # noqa: E402
+
+SEOUL = (37.5665, 126.978)
+# within the same 2 km cell
+NEIGHBOUR = (37.5701, 126.9799)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(aircache, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+class _Fetch:
+    """Counting fetch that can be held open or made to fail."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.calls = 0
+        self.error = error
+        self.release = None
+
+    async def __call__(self):
+        self.calls += 1
+        if self.release is not None:
+            await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return {'aq': {'khai': 50 + self.calls}}
+
+
+def test_air_cell():
+    """Nearby coordinates share a cell, strings are accepted."""
+    assert aircache.air_cell(*SEOUL) == aircache.air_cell(*map(str, NEIGHBOUR))
+    assert aircache.air_cell(*SEOUL) != aircache.air_cell(37.5665, 127.0)
+
+
+def test_cached_within_ttl(clock):
+    """A cell is fetched once per TTL."""
+    cache = aircache.AirQualityCache()
+    fetch = _Fetch()
+
+    async def run():
+        first = await cache.async_get(*SEOUL, fetch)
+        assert await cache.async_get(*NEIGHBOUR, fetch) is first
+        clock.now += aircache.TTL_SECONDS
+        assert await cache.async_get(*SEOUL, fetch) is not first
+    asyncio.run(run())
+    assert fetch.calls == 2
+
+
+def test_concurrent_requests_share_one_fetch(clock):
+    """Waiters of a cell share the request in flight."""
+    cache = aircache.AirQualityCache()
+    fetch = _Fetch()
+
+    async def run():
+        fetch.release = asyncio.Event()
+        tasks = [asyncio.create_task(cache.async_get(*SEOUL, fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        fetch.release.set()
+        return await asyncio.gather(*tasks)
+    results = asyncio.run(run())
+    assert fetch.calls == 1
+    assert results[0] is results[1] is results[2]
+
+
+def test_errors_are_shared_and_not_cached(clock):
+    """A failed request fails its waiters and the next call retries."""
+    cache = aircache.AirQualityCache()
+    fetch = _Fetch(error=ValueError("bad response"))
+
+    async def run():
+        fetch.release = asyncio.Event()
+        tasks = [asyncio.create_task(cache.async_get(*SEOUL, fetch)) for _ in range(2)]
+        await asyncio.sleep(0)
+        fetch.release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+        fetch.error = None
+        fetch.release = None
+        return await cache.async_get(*SEOUL, fetch)
+    assert asyncio.run(run()) == {'aq': {'khai': 52}}
+    assert fetch.calls == 2
+
+
+def test_cancelled_fetch_times_out_waiters(clock):
+    """Cancelling the request fails waiters with a timeout instead of cancelling them."""
+    cache = aircache.AirQualityCache()
+    fetch = _Fetch()
+
+    async def run():
+        fetch.release = asyncio.Event()
+        owner = asyncio.create_task(cache.async_get(*SEOUL, fetch))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.async_get(*SEOUL, fetch))
+        await asyncio.sleep(0)
+        owner.cancel()
+        results = await asyncio.gather(owner, waiter, return_exceptions=True)
+        assert isinstance(results[0], asyncio.CancelledError)
+        assert isinstance(results[1], asyncio.TimeoutError)
+    asyncio.run(run())
+
+
+def test_expired_cells_dropped(clock):
+    """Stale cells are removed when a new response is stored."""
+    cache = aircache.AirQualityCache()
+
+    async def run():
+        await cache.async_get(*SEOUL, _Fetch())
+        clock.now += aircache.TTL_SECONDS
+        await cache.async_get(35.1796, 129.0756, _Fetch())
+    asyncio.run(run())
+    assert list(cache._entries) == [aircache.air_cell(35.1796, 129.0756)]
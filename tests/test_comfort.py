@@ -0,0 +1,53 @@
+"""Tests for the comfort indices."""
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+# The module has no Home Assistant dependency, load it without the package
+_PATH = Path(__file__).parents[1] / "custom_components" / "weathernews" / "comfort.py"
+_SPEC = importlib.util.spec_from_file_location("weathernews_comfort", _PATH)
+comfort = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(comfort)
+
+
+def _heat_index(temp, hum):
+    return comfort.comfort_series([temp], [hum], [None])[0][0]
+
+
+@pytest.mark.parametrize(
+    ("temp", "hum"),
+    [(-10, 60), (-5, 80), (0, 60), (0, 100), (10, 90), (20, 50), (24, 40)],
+)
+def test_heat_index_cold_and_mild_stays_near_temperature(temp, hum):
+    """Outside the hot range the heat index stays within a few degrees of the air."""
+    heatindex = _heat_index(temp, hum)
+    assert abs(heatindex - temp) <= 3
+    assert comfort.heat_grade(heatindex) == '-'
+
+
+@pytest.mark.parametrize(
+    ("temp", "hum", "expected"),
+    [(30, 60, 34), (33, 60, 41), (35, 70, 51)],
+)
+def test_heat_index_hot(temp, hum, expected):
+    """The regression applies in hot weather."""
+    assert _heat_index(temp, hum) == expected
+
+
+def test_heat_index_unparsable():
+    """Missing values yield None."""
+    heat, chill, discomfort = comfort.comfort_series([None, 'x'], [50, None], [None, None])
+    assert heat == [None, None]
+    assert discomfort == [None, None]
+    assert chill == [None, None]
+
+
+def test_wind_chill_only_when_cold_and_windy():
+    """Wind chill is the air temperature unless cold and windy."""
+    _, chill, _ = comfort.comfort_series([20, 0, 0], [50, 50, 50], [30, 2, 20])
+    assert chill[0] == 20
+    assert chill[1] == 0
+    assert chill[2] < 0
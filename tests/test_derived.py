@@ -0,0 +1,94 @@
+"""Tests for the lazily derived current fields."""
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+import sys
+
+import pytest
+
+# The module has no Home Assistant dependency, load it without the package
+_PATH = Path(__file__).parents[1] / "custom_components" / "weathernews" / "derived.py"
+_SPEC = importlib.util.spec_from_file_location("weathernews_derived", _PATH)
+derived = importlib.util.module_from_spec(_SPEC)
+# dataclasses look their module up by name
+sys.modules[_SPEC.name] = derived
+_SPEC.loader.exec_module(derived)
+
+
+@pytest.fixture
+def registry():
+    registry = derived.DerivedRegistry()
+    calls = []
+
+    @registry.register('heat', 'heatAttr')
+    def _heat(context, current):
+        calls.append('heat')
+        return {'heat': current['temp'] + context, 'heatAttr': {'base': current['temp']}}
+
+    @registry.register('peak', deps=('heat',), group='summary')
+    def _peak(context, current):
+        calls.append('peak')
+        return {'peak': dict.__getitem__(current, 'heat') + 1}
+
+    @registry.register('_series')
+    def _series(context, current):
+        calls.append('_series')
+        return {'_series': [1, 2]}
+
+    registry.calls = calls
+    return registry
+
+
+def _current(registry, groups=('summary',), on_compute=None):
+    return derived.LazyCurrent({'temp': 20}, registry, registry.keys(groups), 2, on_compute)
+
+
+def test_keys_exclude_private_and_disabled_groups(registry):
+    """Public keys only, producers of disabled groups left out."""
+    assert registry.keys(('summary',)) == {'heat', 'heatAttr', 'peak'}
+    assert registry.keys(()) == {'heat', 'heatAttr'}
+
+
+def test_contains_does_not_compute(registry):
+    """Membership answers from the keys without running producers."""
+    current = _current(registry)
+    assert 'heat' in current
+    assert '_series' not in current
+    assert registry.calls == []
+
+
+def test_computed_once_per_producer(registry):
+    """A producer runs on the first read of any of its keys, then is reused."""
+    current = _current(registry)
+    assert current['heat'] == 22
+    assert current.get('heatAttr') == {'base': 20}
+    assert current['heat'] == 22
+    assert registry.calls == ['heat']
+
+
+def test_dependencies_run_first(registry):
+    """Reading a field computes its dependencies first."""
+    current = _current(registry)
+    assert current['peak'] == 23
+    assert registry.calls == ['heat', 'peak']
+
+
+def test_disabled_fields_hidden_but_readable(registry):
+    """Fields of disabled groups are not exposed but may still be indexed."""
+    current = _current(registry, groups=())
+    assert 'peak' not in current
+    assert current.get('peak', 'off') == 'off'
+    assert registry.calls == []
+    assert current['peak'] == 23
+    with pytest.raises(KeyError):
+        current['unknown']
+
+
+def test_materialize_computes_exposed_fields(registry):
+    """Full dumps compute every exposed field, private ones stay lazy."""
+    timings = []
+    current = _current(registry, on_compute=lambda key, seconds: timings.append(key)).materialize()
+    assert dict(current) == {'temp': 20, 'heat': 22, 'heatAttr': {'base': 20}, 'peak': 23}
+    assert sorted(registry.calls) == ['heat', 'peak']
+    assert sorted(timings) == ['heat', 'peak']
@@ -0,0 +1,56 @@
+"""Tests for the air quality grading tables."""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.weathernews import grading  # noqa: E402
+from custom_components.weathernews.const import (  # noqa: E402
+    AQ_STANDARD_KOREA,
+    AQ_STANDARD_US,
+    AQ_STANDARD_WHO,
+)
+
+
+@pytest.mark.parametrize(
+    ("value", "label"),
+    [(0, '좋음'), (29, '좋음'), (30, '보통'), ('79', '보통'), (80, '나쁨'), (150, '매우나쁨'), (999, '매우나쁨')],
+)
+def test_korea_pm10(value, label):
+    """A value reaching a bound belongs to the next grade, as before the tables."""
+    assert grading.get_standard(AQ_STANDARD_KOREA)['pm10'].grade(value) == label
+
+
+@pytest.mark.parametrize(
+    ("value", "index"), [(9.0, 0), (9.1, 1), (35.4, 1), (35.5, 2), (225.5, 5)],
+)
+def test_us_pm25(value, index):
+    """US breakpoints are the first concentration of each category."""
+    assert grading.get_standard(AQ_STANDARD_US)['pm25'].index(value) == index
+
+
+@pytest.mark.parametrize("value", [None, '-', '', 'n/a'])
+def test_not_a_number(value):
+    """Missing values have no grade."""
+    scale = grading.get_standard(AQ_STANDARD_KOREA)['pm25']
+    assert scale.index(value) is None
+    assert scale.grade(value) is None
+
+
+def test_grade_series():
+    """A series is graded in one pass, gaps kept."""
+    indexes, labels = grading.get_standard(AQ_STANDARD_WHO)['pm25'].grade_series([10, None, 30, 80])
+    assert indexes == [0, None, 2, 5]
+    assert labels == ['AQG 충족', None, '잠정목표3', '잠정목표1 초과']
+
+
+def test_khai_is_korean_everywhere():
+    """The composite index keeps its Korean scale under every standard."""
+    for name in (AQ_STANDARD_KOREA, AQ_STANDARD_WHO, AQ_STANDARD_US):
+        assert grading.get_standard(name)['aqi'] is grading.KHAI_SCALE
+
+
+def test_unknown_standard_is_korean():
+    """An unknown option falls back to the Korean standard."""
+    assert grading.get_standard('mars') is grading.STANDARDS[AQ_STANDARD_KOREA]
@@ -0,0 +1,112 @@
+"""Tests for the forecast history store and its accuracy scores."""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.weathernews import history  # noqa: E402
+
+HOUR = 3600
+DAY = 86400
+# local midnight of a forecast day, in epoch seconds
+DAY_START = 1_792_335_600
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = history.ForecastHistory(str(tmp_path / "history.db"))
+    yield store
+    store.close()
+
+
+def _hourly(valid: int, temp, pop=None, prec=None) -> dict:
+    return {'TimeUtc': str(valid), 'temp': temp, 'pop': pop, 'prec': prec}
+
+
+def _observe(store, when: int, temp, prec=0) -> None:
+    store.append(when + 60, when, {'temp': temp, 'prec': prec}, [], [])
+
+
+def test_empty_scores(store):
+    """Without observations every score is empty."""
+    assert store.scores() == {
+        **history.EMPTY_SCORES,
+        'forecastTempMaeAttr': {'samples': 0},
+        'forecastPopBrierAttr': {'samples': 0, 'calibration': {}},
+        'forecastRainHitRateAttr': {'rain_starts': 0},
+        'forecastTmaxMaeAttr': {'samples': 0},
+        'forecastTminMaeAttr': {'samples': 0},
+    }
+
+
+def test_every_forecast_is_kept(store):
+    """Forecasts for the same hour from different fetches are all scored."""
+    valid = DAY_START + 12 * HOUR
+    store.append(valid - 3 * HOUR, None, {}, [_hourly(valid, '20', 100, '1')], [])
+    store.append(valid - 2 * HOUR, None, {}, [_hourly(valid, '21', 60, '1')], [])
+    store.append(valid - 20 * HOUR, None, {}, [_hourly(valid, '18', 0, '0')], [])
+    _observe(store, valid, '22', '0.5')
+    scores = store.scores()
+    assert scores['forecastTempMae'] == 2.33
+    assert scores['forecastTempMaeAttr'] == {'0-6h': 1.5, '13-24h': 4.0, 'samples': 3}
+    assert scores['forecastPopBrierAttr']['0-6h'] == 0.08
+    assert scores['forecastPopBrierAttr']['13-24h'] == 1.0
+
+
+def test_observations_keyed_by_observation_time(store):
+    """The observation hour comes from its own time, the first one is kept."""
+    valid = DAY_START + 12 * HOUR
+    store.append(valid - HOUR, None, {}, [_hourly(valid, '20')], [])
+    # fetched 40 minutes late, still the 12:00 observation
+    store.append(valid + 40 * 60, valid + 5 * 60, {'temp': '23', 'prec': '0'}, [], [])
+    store.append(valid + 50 * 60, valid + 5 * 60, {'temp': '99', 'prec': '0'}, [], [])
+    # too far from a full hour
+    store.append(valid + 2 * HOUR, valid + HOUR + 30 * 60, {'temp': '99', 'prec': '0'}, [], [])
+    # unknown observation time
+    store.append(valid + 3 * HOUR, None, {'temp': '99', 'prec': '0'}, [], [])
+    assert store.scores()['forecastTempMaeAttr'] == {'0-6h': 3.0, 'samples': 1}
+
+
+def test_rain_start_hit_rate(store):
+    """A rain start is hit when rain was forecast within the window."""
+    start = DAY_START + 12 * HOUR
+    store.append(start - 5 * HOUR, None, {}, [
+        _hourly(start - HOUR, '20', 10, '0'), _hourly(start, '20', 70, '2'),
+    ], [])
+    store.append(start - 20 * HOUR, None, {}, [_hourly(start, '20', 10, '0')], [])
+    _observe(store, start - HOUR, '20', '0')
+    _observe(store, start, '20', '1.5')
+    scores = store.scores()
+    assert scores['forecastRainHitRate'] == 50
+    assert scores['forecastRainHitRateAttr'] == {'0-6h': 100, '13-24h': 0, 'rain_starts': 1}
+
+
+def test_daily_high_and_low_scored(store):
+    """Daily highs and lows are scored against the observed hours of the day."""
+    store.append(DAY_START - HOUR, None, {}, [], [
+        {'TimeUtc': str(DAY_START), 'tmax': '25', 'tmin': '12', 'pop': '20'},
+    ])
+    store.append(DAY_START - 3 * DAY, None, {}, [], [
+        {'TimeUtc': str(DAY_START), 'tmax': '30', 'tmin': '5', 'pop': '20'},
+    ])
+    for hour in range(history.DAILY_MIN_OBSERVATIONS - 1):
+        _observe(store, DAY_START + hour * HOUR, str(10 + hour))
+    # not enough observed hours yet
+    assert store.scores()['forecastTmaxMae'] is None
+
+    _observe(store, DAY_START + 20 * HOUR, '27')
+    scores = store.scores()
+    assert scores['forecastTmaxMae'] == 2.5
+    assert scores['forecastTmaxMaeAttr'] == {'0-1d': 2.0, '2-3d': 3.0, 'samples': 2}
+    assert scores['forecastTminMae'] == 3.5
+    assert scores['forecastTminMaeAttr'] == {'0-1d': 2.0, '2-3d': 5.0, 'samples': 2}
+
+
+def test_old_rows_purged(store):
+    """Rows older than the retention are removed on append."""
+    old = DAY_START - history.RETENTION - DAY
+    store.append(old - HOUR, None, {}, [_hourly(old, '20')], [])
+    _observe(store, old, '22')
+    store.append(DAY_START + history.PURGE_INTERVAL, None, {}, [], [])
+    assert store.scores()['forecastTempMaeAttr'] == {'samples': 0}
@@ -0,0 +1,57 @@
+"""Tests for the observation ring buffer."""
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+# The module has no Home Assistant dependency, load it without the package
+_PATH = Path(__file__).parents[1] / "custom_components" / "weathernews" / "observations.py"
+_SPEC = importlib.util.spec_from_file_location("weathernews_observations", _PATH)
+observations = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(observations)
+
+
+def _buffer(samples, capacity=3):
+    buffer = observations.ObservationBuffer(('temp', 'press'), capacity)
+    for when, temp in samples:
+        buffer.append(when, {'temp': temp, 'press': '1013'})
+    return buffer
+
+
+def test_capacity_is_fixed():
+    """Appending past the capacity overwrites the oldest sample."""
+    buffer = _buffer([(0, 10), (600, 11), (1200, 12), (1800, 13), (2400, 14)])
+    assert len(buffer) == 3
+    assert buffer.change('temp', 1200) == (2.0, 1200.0)
+    # the sample at 600 was overwritten
+    assert buffer.change('temp', 1800) is None
+
+
+def test_change_uses_newest_sample_at_or_before_window():
+    """The earlier value is the newest sample not after latest minus window."""
+    buffer = _buffer([(0, 10), (600, 12), (1200, 15)])
+    assert buffer.change('temp', 900) == (5.0, 1200.0)
+    assert buffer.change('temp', 600) == (3.0, 600.0)
+    assert buffer.change('temp', 0) == (0.0, 0.0)
+
+
+def test_out_of_order_samples_are_dropped():
+    """A sample not newer than the last one is ignored."""
+    buffer = _buffer([(600, 10), (600, 99), (300, 99), (1200, 11)])
+    assert len(buffer) == 2
+    assert buffer.change('temp', 600) == (1.0, 600.0)
+
+
+@pytest.mark.parametrize("missing", [None, '-', ''])
+def test_missing_values(missing):
+    """Missing values are stored as NaN and give no change."""
+    buffer = _buffer([(0, missing), (600, 12)])
+    assert buffer.change('temp', 600) is None
+    assert buffer.change('press', 600) == (0.0, 600.0)
+
+
+def test_empty_buffer():
+    """An empty buffer has no change."""
+    assert _buffer([]).change('temp', 600) is None
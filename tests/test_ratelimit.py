@@ -0,0 +1,110 @@
+"""Tests for the token bucket and the per-entry rate budgets."""
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.weathernews import ratelimit  # noqa: E402
+
+
+class _Clock:
+    """Monotonic clock advanced only by the bucket's own sleeps."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.slept: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(ratelimit, "time", SimpleNamespace(monotonic=clock.monotonic))
+    monkeypatch.setattr(ratelimit, "asyncio", SimpleNamespace(Lock=asyncio.Lock, sleep=clock.sleep))
+    return clock
+
+
+def _acquire(bucket: ratelimit.TokenBucket, count: int) -> None:
+    async def run():
+        for _ in range(count):
+            await bucket.async_acquire()
+    asyncio.run(run())
+
+
+def test_burst_is_rate_times_burst_seconds(clock):
+    """A full bucket serves BURST_SECONDS worth of requests without waiting."""
+    bucket = ratelimit.TokenBucket(60)
+    _acquire(bucket, ratelimit.BURST_SECONDS)
+    assert clock.slept == []
+    _acquire(bucket, 1)
+    assert clock.slept == [pytest.approx(1.0)]
+
+
+def test_refill_after_idle(clock):
+    """Tokens come back at the rate, capped at the burst capacity."""
+    bucket = ratelimit.TokenBucket(60)
+    _acquire(bucket, 10)
+    clock.now += 3
+    _acquire(bucket, 3)
+    assert clock.slept == []
+    clock.now += 3600
+    _acquire(bucket, 10)
+    assert clock.slept == []
+    _acquire(bucket, 1)
+    assert len(clock.slept) == 1
+
+
+def test_slow_rate_keeps_one_token(clock):
+    """Below six requests per minute the bucket still holds a single token."""
+    bucket = ratelimit.TokenBucket(3)
+    _acquire(bucket, 1)
+    assert clock.slept == []
+    _acquire(bucket, 1)
+    assert clock.slept == [pytest.approx(20.0)]
+
+
+def test_set_rate_keeps_earned_tokens(clock):
+    """Changing the rate does not refill or empty the bucket."""
+    bucket = ratelimit.TokenBucket(60)
+    _acquire(bucket, 10)
+    bucket.set_rate(120)
+    _acquire(bucket, 1)
+    assert clock.slept == [pytest.approx(0.5)]
+
+
+def test_budgets_are_per_entry():
+    """Each entry has its own budget, requests outside an entry use the default."""
+    limiter = ratelimit.HostRateLimiter()
+    limiter.async_set_budget("a", 6)
+    limiter.async_set_budget("b", 120)
+    assert limiter.requests_per_minute("a") == 6
+    assert limiter.requests_per_minute("b") == 120
+    assert limiter.requests_per_minute() == ratelimit.DEFAULT_REQUESTS_PER_MINUTE
+    limiter.async_remove_budget("a")
+    assert limiter.requests_per_minute("a") == ratelimit.DEFAULT_REQUESTS_PER_MINUTE
+
+
+def test_entries_do_not_share_buckets(clock):
+    """A slow entry waits for its own budget without delaying another entry."""
+    limiter = ratelimit.HostRateLimiter()
+    limiter.async_set_budget("slow", 3)
+    url = "https://www.kr-weathernews.com/mv3/if/main_v4.fcgi"
+
+    async def run():
+        await limiter.async_acquire(url, "slow")
+        await limiter.async_acquire(url, "fast")
+        assert clock.slept == []
+        await limiter.async_acquire(url, "slow")
+    asyncio.run(run())
+    assert clock.slept == [pytest.approx(20.0)]
+    assert limiter.requests_today() == {"www.kr-weathernews.com": 3}
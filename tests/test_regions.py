@@ -0,0 +1,80 @@
+"""Tests for the bundled region search and nearest lookup."""
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+# The module has no Home Assistant dependency, load it without the package
+_PATH = Path(__file__).parents[1] / "custom_components" / "weathernews" / "regions.py"
+_SPEC = importlib.util.spec_from_file_location("weathernews_regions", _PATH)
+regions = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(regions)
+
+CHEONGUN = ('1111010100', '서울특별시 종로구 청운동')
+
+
+@pytest.fixture(scope="module")
+def index():
+    return regions.load_region_index()
+
+
+def test_code_levels():
+    """Codes resolve to their level and parent."""
+    assert regions.region_level('1100000000') == regions.LEVEL_SIDO
+    assert regions.region_level('1111000000') == regions.LEVEL_SIGUNGU
+    assert regions.region_level('1111010100') == regions.LEVEL_DONG
+    assert regions.parent_code('1111010100') == '1111000000'
+    assert regions.parent_code('1111000000') == '1100000000'
+    assert regions.parent_code('1100000000') is None
+
+
+def test_full_names(index):
+    """Names are stored relative to the parent and read back in full."""
+    assert index.name(CHEONGUN[0]) == CHEONGUN[1]
+    assert index.name('1111000000') == '서울특별시 종로구'
+    assert index.name('0000000000') is None
+
+
+@pytest.mark.parametrize("query", ['청운동', '종로구청운', ' 청운 동 ', 'ㅊㅇㄷ', '1111010'])
+def test_search(index, query):
+    """Names, names without spaces, initial consonants and code prefixes match."""
+    assert CHEONGUN in index.search(query)
+
+
+def test_search_partial_syllable(index):
+    """A half-typed last syllable matches through the jamo blob."""
+    assert ('1147010300', '서울특별시 양천구 신월동') in index.search('신월ㄷ')
+
+
+def test_search_limit_and_empty(index):
+    """Results are capped and an empty query finds nothing."""
+    assert len(index.search('동', limit=5)) == 5
+    assert len(index.search('11')) == regions.MAX_RESULTS
+    assert index.search('  ') == []
+    assert index.search('없는지역이름') == []
+
+
+def test_nearest_suggests_dong_codes_only(index):
+    """The nearest rows are 읍/면/동 codes sorted by distance."""
+    nearest = index.nearest(37.5892, 126.9693, limit=5)
+    assert nearest[0] == (*CHEONGUN, 0.0)
+    assert [km for _, _, km in nearest] == sorted(km for _, _, km in nearest)
+    assert all(regions.region_level(code) == regions.LEVEL_DONG for code, _, _ in nearest)
+
+
+def test_nearest_matches_brute_force(index):
+    """The grid search returns the same rows as a full scan."""
+    lat, lon = 35.1796, 129.0756
+    expected = sorted(
+        (regions.distance_km(lat, lon, index.lats[idx], index.lons[idx]), index.codes[idx])
+        for idx in range(len(index))
+        if index.lats[idx] is not None and regions.region_level(index.codes[idx]) == regions.LEVEL_DONG
+    )[:5]
+    assert [code for code, _, _ in index.nearest(lat, lon, limit=5)] == [code for _, code in expected]
+
+
+def test_nearest_max_distance(index):
+    """Nothing is suggested far out at sea."""
+    assert index.nearest(33.0, 124.0, limit=3, max_km=regions.MAX_SUGGEST_KM) == []
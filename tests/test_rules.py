@@ -0,0 +1,115 @@
+"""Tests for the alert rule parser and the edge-triggered engine."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.weathernews import rules  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "rain_soon precipHour3Attr.sum_prec > 0",
+        "rain soon: temp > 0",
+        "a: temp > 0; a: temp < 0",
+        "heat: heatindex",
+        "heat: heatindex => 32",
+        "heat: heatindex >= 32 and",
+        "heat: heat-index >= 32",
+    ],
+)
+def test_invalid_rules_raise(text):
+    """Bad names, duplicates and malformed conditions raise ValueError."""
+    with pytest.raises(ValueError):
+        rules.compile_rules(text)
+
+
+def test_compile_rules():
+    """Rules split on lines and ``;``, comments and blank lines are skipped."""
+    compiled = rules.compile_rules(
+        "# comment\n\nrain_soon: precipHour3Attr.sum_prec > 0; "
+        "pm25_bad_tomorrow: pmForecastDaily.1.pm25 >= 36\nsunny: cur_cmt == '맑음' and temp < 30"
+    )
+    assert [rule.name for rule in compiled] == ["rain_soon", "pm25_bad_tomorrow", "sunny"]
+    assert compiled[1].conditions[0].path == ("pmForecastDaily", 1, "pm25")
+    assert compiled[1].conditions[0].value == 36.0
+    assert compiled[2].conditions[0].value == "맑음"
+    assert len(compiled[2].conditions) == 2
+    assert rules.compile_rules("") == ()
+
+
+def test_condition_test():
+    """Numbers compare numerically, missing paths and unparsable values are false."""
+    (rule,) = rules.compile_rules("a: pm.1.pm25 >= 36")
+    (condition,) = rule.conditions
+    assert condition.test({"pm": [{}, {"pm25": "40"}]})
+    assert not condition.test({"pm": [{}, {"pm25": "35"}]})
+    assert not condition.test({"pm": [{}]})
+    assert not condition.test({"pm": [{}, {"pm25": "-"}]})
+    assert not condition.test({})
+
+
+class _Coordinator(SimpleNamespace):
+    """Coordinator stand-in; a new fetch sets new data and fetched_at."""
+
+    def fetch(self, **current):
+        self.data = {rules.RESULTS_CURRENT: current}
+        self.fetched_at = (self.fetched_at or 0) + 1
+
+
+@pytest.fixture
+def engine():
+    events = []
+    hass = SimpleNamespace(bus=SimpleNamespace(async_fire=lambda event, data: events.append(data)))
+    coordinator = _Coordinator(data=None, fetched_at=None, location_name="home", api_key="1100000000")
+    engine = rules.RuleEngine(hass, coordinator, rules.compile_rules("hot: temp >= 30"))
+    return engine, coordinator, events
+
+
+def test_first_evaluation_only_records(engine):
+    """Without a restored state an active rule does not fire on start."""
+    engine, coordinator, events = engine
+    coordinator.fetch(temp=31)
+    engine.async_evaluate()
+    assert engine.state == {"hot": True}
+    assert events == []
+
+
+def test_fires_on_rising_edges_only(engine):
+    """The event fires when a rule turns on, not while it stays on."""
+    engine, coordinator, events = engine
+    for temp in (25, 31, 32, 25, 33):
+        coordinator.fetch(temp=temp)
+        engine.async_evaluate()
+    assert [event["values"]["temp"] for event in events] == [31, 33]
+    assert events[0]["rule"] == "hot"
+    assert events[0]["location"] == "home"
+
+
+def test_same_fetch_is_not_evaluated_again(engine):
+    """Listener calls without a new fetch (interpolation, sun) are ignored."""
+    engine, coordinator, events = engine
+    coordinator.fetch(temp=25)
+    engine.async_evaluate()
+    coordinator.data[rules.RESULTS_CURRENT]["temp"] = 35
+    engine.async_evaluate()
+    assert engine.state == {"hot": False}
+    assert events == []
+
+
+@pytest.mark.parametrize(("restored", "fired"), [(True, 0), (False, 1), (None, 0)])
+def test_restored_state(engine, restored, fired):
+    """A restored off state fires when active, a restored on state does not."""
+    engine, coordinator, events = engine
+    coordinator.fetch(temp=31)
+    engine.async_restore("hot", restored)
+    assert len(events) == fired
+    assert engine.state == {"hot": True}
+    # restoring again after the state is known changes nothing
+    engine.async_restore("hot", False)
+    engine.async_evaluate()
+    assert len(events) == fired
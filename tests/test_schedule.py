@@ -0,0 +1,85 @@
+"""Tests for the publish-time-aware refresh delay."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.weathernews import schedule  # noqa: E402
+
+KST = timezone(timedelta(hours=9))
+START = datetime(2026, 10, 19, 5, 0, tzinfo=KST)
+FALLBACK = timedelta(minutes=20)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=START)
+    monkeypatch.setattr(schedule, "dt_util", SimpleNamespace(now=lambda: clock.now))
+    return clock
+
+
+def _tracker(cadence: timedelta, count: int = 4) -> schedule.PublishTracker:
+    tracker = schedule.PublishTracker()
+    for step in range(count):
+        tracker.record("main", (START + cadence * step).strftime("%Y-%m-%dT%H:%M:%S%z"))
+    return tracker
+
+
+def test_unknown_cadence_uses_fallback(clock):
+    """Fewer than three publish times give the fixed interval."""
+    tracker = _tracker(timedelta(hours=1), count=2)
+    assert tracker.cadence("main") is None
+    assert tracker.next_refresh(FALLBACK) == FALLBACK
+
+
+def test_refresh_shortly_after_next_publish(clock):
+    """The delay ends PUBLISH_DELAY after the expected publish."""
+    tracker = _tracker(timedelta(hours=1))
+    clock.now = START + timedelta(hours=3, minutes=10)
+    assert tracker.next_refresh(FALLBACK) == timedelta(minutes=52)
+
+
+def test_delay_may_exceed_fallback_up_to_max(clock):
+    """A distant publish waits past the fixed interval, at most MAX_REFRESH_INTERVAL."""
+    tracker = _tracker(timedelta(hours=3))
+    clock.now = START + timedelta(hours=9, minutes=10)
+    assert tracker.next_refresh(FALLBACK) == schedule.MAX_REFRESH_INTERVAL
+
+
+def test_delay_never_below_min(clock):
+    """A publish due within seconds still waits MIN_REFRESH_INTERVAL."""
+    tracker = _tracker(timedelta(hours=1))
+    clock.now = START + timedelta(hours=4, minutes=1)
+    assert tracker.next_refresh(FALLBACK) == schedule.MIN_REFRESH_INTERVAL
+
+
+def test_overdue_publish_backs_off(clock):
+    """Missing publishes are retried at doubling intervals capped at the fallback."""
+    tracker = _tracker(timedelta(hours=1))
+    clock.now = START + timedelta(hours=4, minutes=10)
+    delays = [tracker.next_refresh(FALLBACK) for _ in range(6)]
+    assert delays == [timedelta(minutes=minutes) for minutes in (5, 10, 20, 20, 20, 20)]
+
+    # the publish arrives, the next miss starts over from the minimum
+    tracker.record("main", (START + timedelta(hours=4)).strftime("%Y-%m-%dT%H:%M:%S%z"))
+    assert tracker.next_refresh(FALLBACK) == timedelta(minutes=52)
+    clock.now = START + timedelta(hours=5, minutes=10)
+    assert tracker.next_refresh(FALLBACK) == schedule.MIN_REFRESH_INTERVAL
+
+
+def test_long_missed_publishes_are_skipped(clock):
+    """After a whole cadence without a publish the next slot is expected."""
+    tracker = _tracker(timedelta(hours=1))
+    clock.now = START + timedelta(hours=5, minutes=30)
+    assert tracker.next_refresh(FALLBACK) == timedelta(minutes=32)
+
+
+def test_out_of_range_cadence_is_unknown(clock):
+    """Cadences shorter than MIN_CADENCE are ignored."""
+    tracker = _tracker(timedelta(minutes=1))
+    assert tracker.cadence("main") is None
+    assert tracker.next_refresh(FALLBACK) == FALLBACK
@@ -0,0 +1,70 @@
+"""Tests for the local sunrise and sunset table."""
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+import importlib.util
+from pathlib import Path
+import sys
+
+import pytest
+
+# The module has no Home Assistant dependency, load it without the package
+_PATH = Path(__file__).parents[1] / "custom_components" / "weathernews" / "solar.py"
+_SPEC = importlib.util.spec_from_file_location("weathernews_solar", _PATH)
+solar = importlib.util.module_from_spec(_SPEC)
+# dataclasses look their module up by name
+sys.modules[_SPEC.name] = solar
+_SPEC.loader.exec_module(solar)
+
+KST = timezone(timedelta(hours=9))
+SEOUL = (37.5665, 126.978)
+
+
+@pytest.mark.parametrize(
+    ("day", "sunrise", "sunset"),
+    [(date(2026, 6, 21), (5, 11), (19, 57)), (date(2026, 12, 21), (7, 43), (17, 17))],
+)
+def test_seoul_sun_events(day, sunrise, sunset):
+    """Seoul sunrise and sunset within two minutes of the published times."""
+    events = solar.sun_events(day, *SEOUL)
+    for event, (hour, minute) in ((events.sunrise, sunrise), (events.sunset, sunset)):
+        expected = datetime(day.year, day.month, day.day, hour, minute, tzinfo=KST)
+        assert abs(event - expected) <= timedelta(minutes=2)
+
+
+def test_polar_day_and_night():
+    """Above the polar circle the sun neither rises nor sets around the solstices."""
+    assert solar.sun_events(date(2026, 6, 21), 78.2, 15.6) == solar.SolarDay(None, None, polar_day=True)
+    assert solar.sun_events(date(2026, 12, 21), 78.2, 15.6) == solar.SolarDay(None, None, polar_day=False)
+
+
+def test_is_day_and_next_change():
+    """Day/night switches exactly at the computed events."""
+    table = solar.SolarTable(*map(str, SEOUL), KST)
+    noon = datetime(2026, 10, 19, 12, tzinfo=KST)
+    today = table.day(noon)
+    assert table.is_day(noon)
+    assert not table.is_day(today.sunset)
+    assert table.is_day(today.sunset - timedelta(seconds=1))
+    assert table.next_change(noon) == today.sunset
+    assert table.next_change(today.sunset) == table.day(noon + timedelta(days=1)).sunrise
+    assert not table.is_day(datetime(2026, 10, 19, 0, 30, tzinfo=KST))
+
+
+def test_local_date_and_table_size():
+    """Days are looked up by local date and the table stays small."""
+    table = solar.SolarTable(*SEOUL, KST)
+    # 20:00 UTC is already the next local day in Seoul
+    late = datetime(2026, 10, 19, 20, tzinfo=timezone.utc)
+    assert table.day(late) == solar.sun_events(date(2026, 10, 20), *SEOUL)
+    for offset in range(30):
+        table.day(late + timedelta(days=offset))
+    assert len(table._days) <= solar.TABLE_DAYS
+
+
+def test_polar_night_has_no_change():
+    """In polar night it is never day and there is no next event."""
+    table = solar.SolarTable(78.2, 15.6, timezone.utc)
+    when = datetime(2026, 12, 21, 12, tzinfo=timezone.utc)
+    assert not table.is_day(when)
+    assert table.next_change(when) is None
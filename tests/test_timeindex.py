@@ -0,0 +1,71 @@
+"""Tests for the forecast time index."""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.weathernews.timeindex import ForecastIndex  # noqa: E402
+
+T0 = 1_792_400_400
+HOUR = 3600
+
+
+@pytest.fixture
+def index():
+    rows = [
+        {'TimeUtc': str(T0 + 2 * HOUR), 'temp': '14', 'wx': '200'},
+        {'TimeUtc': str(T0), 'temp': '10', 'wx': '100'},
+        {'TimeUtc': str(T0 + HOUR), 'temp': '12', 'wx': '101'},
+        {'temp': '99'},
+    ]
+    return ForecastIndex(rows)
+
+
+@pytest.mark.parametrize(
+    ("offset", "temp"),
+    [
+        (-1, None),
+        (0, '10'),
+        (HOUR - 1, '10'),
+        (HOUR, '12'),
+        (2 * HOUR, '14'),
+        (3 * HOUR - 1, '14'),
+        (3 * HOUR, None),
+    ],
+)
+def test_row_at_boundaries(index, offset, temp):
+    """A row is valid from its time until the next row, the last for one step."""
+    row = index.row_at(T0 + offset)
+    assert (row and row['temp']) == temp
+
+
+def test_interpolate_between_rows(index):
+    """Continuous fields are linear, the others come from the nearest row."""
+    row = index.interpolate(T0 + HOUR // 4)
+    assert row['temp'] == 10.5
+    assert row['wx'] == '100'
+    assert row['TimeUtc'] == str(T0 + HOUR // 4)
+    assert index.interpolate(T0 + 3 * HOUR // 4)['wx'] == '101'
+
+
+@pytest.mark.parametrize(("offset", "temp"), [(0, '10'), (2 * HOUR, '14')])
+def test_interpolate_on_a_row(index, offset, temp):
+    """An exact row time returns a copy of that row."""
+    assert index.interpolate(T0 + offset)['temp'] == temp
+
+
+@pytest.mark.parametrize("offset", [-1, 2 * HOUR + 1])
+def test_interpolate_outside(index, offset):
+    """Interpolation does not extrapolate."""
+    assert index.interpolate(T0 + offset) is None
+
+
+def test_single_and_empty():
+    """A single row interpolates only at its own time, an empty index finds nothing."""
+    single = ForecastIndex([{'TimeUtc': str(T0), 'temp': '10'}])
+    assert single.interpolate(T0 + 1) is None
+    assert single.interpolate(T0)['temp'] == '10'
+    empty = ForecastIndex([])
+    assert empty.row_at(T0) is None
+    assert empty.interpolate(T0) is None
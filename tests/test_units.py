@@ -0,0 +1,58 @@
+"""Tests for the imperial conversion of the dataset."""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.weathernews.units import to_imperial  # noqa: E402
+
+
+def test_columns_converted():
+    """Temperatures, lengths, speeds and pressure convert in every section."""
+    hourly = [{'temp': '20', 'prec': '25.4', 'wspd': '1.609344', 'humi': '50'}]
+    daily = [{'tmax': '30', 'tmin': '-40'}]
+    current = {'temp': 0, 'press': '1013', 'visi': '20', 'rhum': '60'}
+    to_imperial(current, hourly, daily)
+    assert hourly == [{'temp': 68.0, 'prec': 1.0, 'wspd': 1.0, 'humi': '50'}]
+    assert daily == [{'tmax': 86.0, 'tmin': -40.0}]
+    assert current == {'temp': 32.0, 'press': 29.91, 'visi': 12.4, 'rhum': '60'}
+
+
+def test_differences_convert_without_offset():
+    """Temperature differences scale only."""
+    current = {'tempdiff': '-2', 'tempRate': 1.5, 'tempRateAttr': {'change': 3}}
+    to_imperial(current, [], [])
+    assert current == {'tempdiff': -3.6, 'tempRate': 2.7, 'tempRateAttr': {'change': 5.4}}
+
+
+def test_shared_rows_convert_once():
+    """An hourly row reused as a rain forecast attribute converts only once."""
+    row = {'temp': '20', 'prec': '25.4'}
+    current = {'precipHour3Attr': row, 'heatindexAttr': {'heatindex': 30}}
+    to_imperial(current, [row], [])
+    assert row == {'temp': 68.0, 'prec': 1.0}
+    assert current['heatindexAttr'] == {'heatindex': 86.0}
+
+
+@pytest.mark.parametrize("value", [None, '-', '', True])
+def test_non_numeric_untouched(value):
+    """Values that are not numbers stay as they are."""
+    current = {'temp': value}
+    to_imperial(current, [{'temp': value}], [])
+    assert current == {'temp': value}
+
+
+def test_lazy_fields_not_computed():
+    """Only fields already present convert, lazy lookups are not triggered."""
+
+    class Lazy(dict):
+        def __missing__(self, key):
+            raise AssertionError(f"{key} computed")
+
+        def __contains__(self, key):
+            return True
+
+    current = Lazy({'temp': 10})
+    to_imperial(current, [], [])
+    assert dict(current) == {'temp': 50.0}